@@ -3,37 +3,77 @@ Citizen Reports API Endpoints
 Handles submission and processing of citizen-generated hazard reports
 """
 
+import asyncio
 import logging
 import time
-from typing import List
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import JSONResponse
+from typing import AsyncIterator, List, Optional
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 
 from app.models.schemas import (
     CitizenReport, ProcessedReport, APIResponse, 
-    BatchProcessRequest, TrustScore, Priority
+    BatchProcessRequest, TrustScore, Priority, HazardType
 )
+from app.api.validation import openapi_request_body, parse_json_body, validate_body
 from app.services.ai_pipeline_simple import AIPipeline
+from app.services import scoring
+from app.services.job_queue import JobQueue
+from app.services.result_cache import get_report_cache, report_cache_key
+from app.services.spatial_index import get_report_index
+from app.utils.helpers import gather_with_concurrency
+from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Shared services, set by the application lifespan in main.py
+_AI_PIPELINE: Optional[AIPipeline] = None
+_JOB_QUEUE: Optional[JobQueue] = None
+
+# High-risk hazard types
+CRITICAL_HAZARDS = frozenset({HazardType.TSUNAMI.value, HazardType.STORM.value})
+
+MAX_BATCH_REPORTS = 100
+_BATCH_ADAPTER = TypeAdapter(BatchProcessRequest)
 
 
 def get_ai_pipeline():
     """Dependency to get AI Pipeline instance."""
-    from main import app
-    if not hasattr(app.state, 'ai_pipeline'):
+    ai_pipeline = _AI_PIPELINE
+    if ai_pipeline is None:
         raise HTTPException(status_code=503, detail="AI Pipeline not available")
-    return app.state.ai_pipeline
+    return ai_pipeline
+
+
+def get_job_queue():
+    """Dependency to get the background job queue."""
+    job_queue = _JOB_QUEUE
+    if job_queue is None:
+        raise HTTPException(status_code=503, detail="Job queue not available")
+    return job_queue
+
+
+async def get_batch_request(request: Request) -> BatchProcessRequest:
+    """Dependency that validates a batch body in one pass, rejecting oversized batches first."""
+    payload = parse_json_body(await request.body())
+    
+    # Count the raw items so an oversized batch never pays for model validation
+    if isinstance(payload, dict) and isinstance(payload.get("reports"), list) \
+            and len(payload["reports"]) > MAX_BATCH_REPORTS:
+        raise HTTPException(status_code=400, detail=f"Batch size cannot exceed {MAX_BATCH_REPORTS} reports")
+    
+    return validate_body(_BATCH_ADAPTER, payload)
 
 
-@router.post("/submit", response_model=APIResponse)
-@router.post("/citizen", response_model=APIResponse)  # Add alias for Postman
+@router.post("/submit")
+@router.post("/citizen")  # Add alias for Postman
 async def submit_citizen_report(
     report: CitizenReport,
-    background_tasks: BackgroundTasks,
-    ai_pipeline: AIPipeline = Depends(get_ai_pipeline)
+    ai_pipeline: AIPipeline = Depends(get_ai_pipeline),
+    job_queue: JobQueue = Depends(get_job_queue)
 ):
     """
     Submit a new citizen report for processing.
@@ -41,46 +81,41 @@ async def submit_citizen_report(
     This endpoint accepts a citizen report and processes it through the AI pipeline
     to generate a trust score and detect potential duplicates.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
-        logger.info(f"Received citizen report: {report.id}")
-        
-        # Validate report data
-        if not report.description.strip():
-            raise HTTPException(status_code=400, detail="Report description cannot be empty")
-        
-        if not (-90 <= report.location.latitude <= 90):
-            raise HTTPException(status_code=400, detail="Invalid latitude")
-        
-        if not (-180 <= report.location.longitude <= 180):
-            raise HTTPException(status_code=400, detail="Invalid longitude")
+        logger.info("Received citizen report: %s", report.id)
         
         # Process in background for large reports, immediate for small ones
         if len(report.images or []) > 3 or len(report.description) > 1000:
-            background_tasks.add_task(process_report_background, report, ai_pipeline)
+            job_queue.submit(process_report_background, report, ai_pipeline)
             
-            return APIResponse(
-                success=True,
-                message="Report submitted successfully. Processing in background.",
-                data={"report_id": report.id, "status": "processing"},
-                processing_time=time.time() - start_time
-            )
+            return ORJSONResponse({
+                "success": True,
+                "message": "Report submitted successfully. Processing in background.",
+                "data": {"report_id": report.id, "status": "processing"},
+                "errors": [],
+                "processing_time": (time.perf_counter_ns() - start_ns) / 1e9
+            })
         else:
             # Process immediately for small reports
             processed_report = await process_citizen_report(report, ai_pipeline)
             
-            return APIResponse(
-                success=True,
-                message="Report processed successfully",
-                data=processed_report.dict(),
-                processing_time=time.time() - start_time
-            )
+            # Serialize straight to JSON-ready primitives and skip response model re-validation
+            return ORJSONResponse({
+                "success": True,
+                "message": "Report processed successfully",
+                "data": processed_report.model_dump(mode="json"),
+                "errors": [],
+                "processing_time": (time.perf_counter_ns() - start_ns) / 1e9
+            })
     
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=503, detail="Processing queue is full, retry later")
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error processing citizen report {report.id}: {e}")
+        logger.error("Error processing citizen report %s: %s", report.id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -106,15 +141,15 @@ async def get_report_status(report_id: str):
         )
     
     except Exception as e:
-        logger.error(f"Error getting report status for {report_id}: {e}")
+        logger.error("Error getting report status for %s: %s", report_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.post("/batch", response_model=APIResponse)
+@router.post("/batch", openapi_extra=openapi_request_body(_BATCH_ADAPTER))
 async def submit_batch_reports(
-    batch_request: BatchProcessRequest,
-    background_tasks: BackgroundTasks,
-    ai_pipeline: AIPipeline = Depends(get_ai_pipeline)
+    batch_request: BatchProcessRequest = Depends(get_batch_request),
+    ai_pipeline: AIPipeline = Depends(get_ai_pipeline),
+    job_queue: JobQueue = Depends(get_job_queue)
 ):
     """
     Submit multiple citizen reports for batch processing.
@@ -122,16 +157,14 @@ async def submit_batch_reports(
     This endpoint accepts multiple reports and processes them efficiently
     in batch mode with optional priority processing.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
-        if len(batch_request.reports) > 100:
-            raise HTTPException(status_code=400, detail="Batch size cannot exceed 100 reports")
+        report_count = len(batch_request.reports)
+        logger.info("Received batch of %d reports", report_count)
         
-        logger.info(f"Received batch of {len(batch_request.reports)} reports")
-        
-        # Add to background processing
-        background_tasks.add_task(
+        # Hand off to the background job queue
+        job_queue.submit(
             process_batch_background, 
             batch_request.reports, 
             ai_pipeline,
@@ -140,24 +173,46 @@ async def submit_batch_reports(
         
         batch_id = f"batch_{int(time.time())}"
         
-        return APIResponse(
-            success=True,
-            message=f"Batch of {len(batch_request.reports)} reports submitted for processing",
-            data={
+        return ORJSONResponse({
+            "success": True,
+            "message": f"Batch of {report_count} reports submitted for processing",
+            "data": {
                 "batch_id": batch_id,
-                "report_count": len(batch_request.reports),
+                "report_count": report_count,
                 "status": "processing"
             },
-            processing_time=time.time() - start_time
-        )
+            "errors": [],
+            "processing_time": (time.perf_counter_ns() - start_ns) / 1e9
+        })
     
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=503, detail="Processing queue is full, retry later")
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error processing batch reports: {e}")
+        logger.error("Error processing batch reports: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.post("/batch/stream", openapi_extra=openapi_request_body(_BATCH_ADAPTER))
+async def stream_batch_reports(
+    batch_request: BatchProcessRequest = Depends(get_batch_request),
+    ai_pipeline: AIPipeline = Depends(get_ai_pipeline)
+):
+    """
+    Process a batch of citizen reports and stream the results.
+    
+    Results are written as newline-delimited JSON, one line per report,
+    as soon as each report is scored.
+    """
+    logger.info("Streaming batch of %d reports", len(batch_request.reports))
+    
+    return StreamingResponse(
+        stream_processed_reports(batch_request.reports, ai_pipeline),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.get("/duplicates/{report_id}")
 async def get_duplicate_reports(
     report_id: str,
@@ -184,16 +239,16 @@ async def get_duplicate_reports(
         )
     
     except Exception as e:
-        logger.error(f"Error getting duplicates for {report_id}: {e}")
+        logger.error("Error getting duplicates for %s: %s", report_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/nearby")
 async def get_nearby_reports(
-    latitude: float,
-    longitude: float,
-    radius_km: float = 10.0,
-    max_results: int = 50
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(10.0, gt=0, le=1000),
+    max_results: int = Query(50, ge=1, le=1000)
 ):
     """
     Get reports near a specific location.
@@ -202,17 +257,9 @@ async def get_nearby_reports(
     useful for spatial analysis and clustering.
     """
     try:
-        # Validate coordinates
-        if not (-90 <= latitude <= 90):
-            raise HTTPException(status_code=400, detail="Invalid latitude")
-        
-        if not (-180 <= longitude <= 180):
-            raise HTTPException(status_code=400, detail="Invalid longitude")
+        report_index = get_report_index()
         
-        if radius_km <= 0 or radius_km > 1000:
-            raise HTTPException(status_code=400, detail="Radius must be between 0 and 1000 km")
-        
-        # Mock data for demonstration
+        # Mock data for demonstration until reports have been processed
         mock_reports = [
             {
                 "id": "RPT001",
@@ -241,30 +288,63 @@ async def get_nearby_reports(
             },
         ]
         
+        if len(report_index) > 0:
+            nearby_reports = report_index.query(latitude, longitude, radius_km, max_results=max_results)
+        else:
+            nearby_reports = mock_reports[:max_results]
+        
         return APIResponse(
             success=True,
             message="Nearby reports retrieved",
             data={
                 "location": {"latitude": latitude, "longitude": longitude},
                 "radius_km": radius_km,
-                "reports": mock_reports,
-                "count": len(mock_reports)
+                "reports": nearby_reports,
+                "count": len(nearby_reports)
             }
         )
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting nearby reports: {e}")
+        logger.error("Error getting nearby reports: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 async def process_citizen_report(report: CitizenReport, ai_pipeline: AIPipeline) -> ProcessedReport:
     """Process a single citizen report through the AI pipeline."""
     try:
-        # Process through AI pipeline
-        processing_results = await ai_pipeline.process_citizen_report(report)
+        report_cache = get_report_cache()
+        cache_key = report_cache_key(report)
+        content_analysis = report_cache.get(cache_key)
         
+        if content_analysis is None:
+            # Process through AI pipeline
+            processing_results = await ai_pipeline.process_citizen_report(report)
+            report_cache.set(cache_key, {
+                'text_features': processing_results['text_features'],
+                'image_features': processing_results['image_features'],
+                'hazard_classification': processing_results['hazard_classification']
+            })
+        else:
+            # Reuse cached content analysis; duplicate detection still sees every report
+            duplicate_result = ai_pipeline._detect_duplicates_simple(report, content_analysis['text_features'])
+            processing_results = {
+                **content_analysis,
+                'duplicate_result': duplicate_result,
+                'processing_time': 0.0
+            }
+        
+        return await build_processed_report(report, processing_results, ai_pipeline)
+    
+    except Exception as e:
+        logger.error("Error processing report %s: %s", report.id, e)
+        raise
+
+
+async def build_processed_report(report: CitizenReport, processing_results: dict, ai_pipeline: AIPipeline) -> ProcessedReport:
+    """Score a report from its pipeline results and assemble the processed report."""
+    try:
         # Calculate trust score
         trust_score = await ai_pipeline.calculate_trust_score(report, processing_results)
         
@@ -299,28 +379,49 @@ async def process_citizen_report(report: CitizenReport, ai_pipeline: AIPipeline)
             processing_version="v1.0.0"
         )
         
-        logger.info(f"Successfully processed report {report.id} with trust score {trust_score.overall_score:.2f}")
+        # Make the report available to location queries
+        get_report_index().add(
+            report.id,
+            report.location.latitude,
+            report.location.longitude,
+            summarize_processed_report(processed_report),
+            report.timestamp
+        )
+        
+        logger.info("Successfully processed report %s with trust score %.2f", report.id, trust_score.overall_score)
         
         return processed_report
     
     except Exception as e:
-        logger.error(f"Error processing report {report.id}: {e}")
+        logger.error("Error building processed report %s: %s", report.id, e)
         raise
 
 
 def determine_priority(trust_score: TrustScore, hazard_type) -> Priority:
     """Determine report priority based on trust score and hazard type."""
-    # High-risk hazard types
-    critical_hazards = ["tsunami", "storm"]
-    
-    if hazard_type in critical_hazards and trust_score.overall_score > 0.7:
-        return Priority.CRITICAL
-    elif trust_score.overall_score > 0.8:
-        return Priority.HIGH
-    elif trust_score.overall_score > 0.5:
-        return Priority.MEDIUM
-    else:
-        return Priority.LOW
+    critical_hazard = getattr(hazard_type, 'value', hazard_type) in CRITICAL_HAZARDS
+    return Priority(scoring.priority_level(trust_score.overall_score, critical_hazard))
+
+
+def summarize_processed_report(processed_report: ProcessedReport) -> dict:
+    """Compact JSON-ready summary of a processed report for location queries."""
+    report = processed_report.original_report
+    return {
+        "id": report.id,
+        "description": report.description,
+        "hazard_type": getattr(report.hazard_type, 'value', report.hazard_type),
+        "location": {
+            "latitude": report.location.latitude,
+            "longitude": report.location.longitude,
+            "address": report.location_name
+        },
+        "trust_score": processed_report.trust_score.overall_score,
+        "priority": getattr(processed_report.priority, 'value', processed_report.priority),
+        "timestamp": report.timestamp.isoformat(),
+        "source": getattr(report.source, 'value', report.source),
+        "reported_by": report.reporter_id,
+        "is_duplicate": processed_report.is_duplicate
+    }
 
 
 async def process_report_background(report: CitizenReport, ai_pipeline: AIPipeline):
@@ -329,30 +430,53 @@ async def process_report_background(report: CitizenReport, ai_pipeline: AIPipeli
         processed_report = await process_citizen_report(report, ai_pipeline)
         
         # In a real implementation, save to database
-        logger.info(f"Background processing completed for report {report.id}")
+        logger.info("Background processing completed for report %s", report.id)
         
     except Exception as e:
-        logger.error(f"Background processing failed for report {report.id}: {e}")
+        logger.error("Background processing failed for report %s: %s", report.id, e)
+
+
+async def stream_processed_reports(reports: List[CitizenReport], ai_pipeline: AIPipeline) -> AsyncIterator[bytes]:
+    """Yield one NDJSON line per processed report."""
+    try:
+        batch_results = await ai_pipeline.process_citizen_report_batch(reports)
+    except Exception as e:
+        logger.error("Streaming batch processing failed: %s", e)
+        yield orjson.dumps({"success": False, "error": "Batch processing failed"}) + b"\n"
+        return
+    
+    for report, processing_results in zip(reports, batch_results):
+        try:
+            processed_report = await build_processed_report(report, processing_results, ai_pipeline)
+            line = {"report_id": report.id, "success": True, "data": processed_report.model_dump(mode="json")}
+        except Exception as e:
+            logger.error("Failed to process report %s in stream: %s", report.id, e)
+            line = {"report_id": report.id, "success": False, "error": "Report processing failed"}
+        
+        yield orjson.dumps(line) + b"\n"
 
 
 async def process_batch_background(reports: List[CitizenReport], ai_pipeline: AIPipeline, priority: bool = False):
     """Background task for batch processing reports."""
     try:
-        processed_count = 0
+        settings = get_settings()
         
-        for report in reports:
-            try:
-                await process_citizen_report(report, ai_pipeline)
+        # Run the pipeline once over the whole batch, then score reports concurrently
+        batch_results = await ai_pipeline.process_citizen_report_batch(reports)
+        outcomes = await gather_with_concurrency(
+            (build_processed_report(report, processing_results, ai_pipeline)
+             for report, processing_results in zip(reports, batch_results)),
+            limit=settings.BATCH_CONCURRENCY
+        )
+        
+        processed_count = 0
+        for report, outcome in zip(reports, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Failed to process report %s in batch: %s", report.id, outcome)
+            else:
                 processed_count += 1
-                
-                if processed_count % 10 == 0:
-                    logger.info(f"Batch processing: {processed_count}/{len(reports)} completed")
-            
-            except Exception as e:
-                logger.error(f"Failed to process report {report.id} in batch: {e}")
-                continue
         
-        logger.info(f"Batch processing completed: {processed_count}/{len(reports)} reports processed")
+        logger.info("Batch processing completed: %d/%d reports processed", processed_count, len(reports))
         
     except Exception as e:
-        logger.error(f"Batch processing failed: {e}")
+        logger.error("Batch processing failed: %s", e)
@@ -3,32 +3,72 @@ Social Media Processing API Endpoints
 Handles ingestion and analysis of social media posts for cross-verification
 """
 
+import asyncio
 import logging
 import time
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import JSONResponse
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional
+import numpy as np
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 
 from app.models.schemas import (
     SocialMediaPost, APIResponse, TrustScore, CitizenReport
 )
+from app.api.validation import openapi_request_body, parse_json_body, validate_body
 from app.services.ai_pipeline_simple import AIPipeline
+from app.services import scoring
+from app.services.job_queue import JobQueue
+from app.services.result_cache import (
+    get_social_cache, get_semantic_cache, get_near_duplicate_cache, social_cache_key, simhash
+)
+from app.services.spatial_index import get_report_index, get_social_index
+from app.utils.helpers import gather_with_concurrency
+from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Shared services, set by the application lifespan in main.py
+_AI_PIPELINE: Optional[AIPipeline] = None
+_JOB_QUEUE: Optional[JobQueue] = None
+
+MAX_BATCH_POSTS = 200
+_BATCH_ADAPTER = TypeAdapter(List[SocialMediaPost])
 
 
 def get_ai_pipeline():
     """Dependency to get AI Pipeline instance."""
-    from main import app
-    if not hasattr(app.state, 'ai_pipeline'):
+    ai_pipeline = _AI_PIPELINE
+    if ai_pipeline is None:
         raise HTTPException(status_code=503, detail="AI Pipeline not available")
-    return app.state.ai_pipeline
+    return ai_pipeline
+
+
+def get_job_queue():
+    """Dependency to get the background job queue."""
+    job_queue = _JOB_QUEUE
+    if job_queue is None:
+        raise HTTPException(status_code=503, detail="Job queue not available")
+    return job_queue
+
+
+async def get_batch_posts(request: Request) -> List[SocialMediaPost]:
+    """Dependency that validates a batch body in one pass, rejecting oversized batches first."""
+    payload = parse_json_body(await request.body())
+    
+    # Count the raw items so an oversized batch never pays for model validation
+    if isinstance(payload, list) and len(payload) > MAX_BATCH_POSTS:
+        raise HTTPException(status_code=400, detail=f"Batch size cannot exceed {MAX_BATCH_POSTS} posts")
+    
+    return validate_body(_BATCH_ADAPTER, payload)
 
 
-@router.post("/ingest", response_model=APIResponse)
-@router.post("/social-media", response_model=APIResponse)  # Add alias for Postman
+@router.post("/ingest")
+@router.post("/social-media")  # Add alias for Postman
 async def ingest_social_media_post(
     post: SocialMediaPost,
     ai_pipeline: AIPipeline = Depends(get_ai_pipeline)
@@ -39,41 +79,38 @@ async def ingest_social_media_post(
     This endpoint accepts social media posts and processes them to extract
     hazard-related information that can be used for cross-verification.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
-        logger.info(f"Received social media post: {post.id} from {post.platform}")
-        
-        # Validate post data
-        if not post.text.strip():
-            raise HTTPException(status_code=400, detail="Post text cannot be empty")
+        logger.info("Received social media post: %s from %s", post.id, post.platform)
         
         # Process the post through AI pipeline
         processing_results = await process_social_media_post(post, ai_pipeline)
         
-        return APIResponse(
-            success=True,
-            message="Social media post processed successfully",
-            data={
+        return ORJSONResponse({
+            "success": True,
+            "message": "Social media post processed successfully",
+            "data": {
                 "post_id": post.id,
                 "platform": post.platform,
                 "analysis": processing_results
             },
-            processing_time=time.time() - start_time
-        )
+            "errors": [],
+            "processing_time": (time.perf_counter_ns() - start_ns) / 1e9
+        })
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error processing social media post {post.id}: {e}")
+        logger.error("Error processing social media post %s: %s", post.id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.post("/batch", response_model=APIResponse)
+@router.post("/batch", openapi_extra=openapi_request_body(_BATCH_ADAPTER))
 async def ingest_batch_posts(
-    posts: List[SocialMediaPost],
-    background_tasks: BackgroundTasks,
-    ai_pipeline: AIPipeline = Depends(get_ai_pipeline)
+    posts: List[SocialMediaPost] = Depends(get_batch_posts),
+    ai_pipeline: AIPipeline = Depends(get_ai_pipeline),
+    job_queue: JobQueue = Depends(get_job_queue)
 ):
     """
     Ingest multiple social media posts in batch.
@@ -81,37 +118,57 @@ async def ingest_batch_posts(
     This endpoint accepts multiple social media posts for efficient
     batch processing and analysis.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
-        if len(posts) > 200:
-            raise HTTPException(status_code=400, detail="Batch size cannot exceed 200 posts")
+        post_count = len(posts)
+        logger.info("Received batch of %d social media posts", post_count)
         
-        logger.info(f"Received batch of {len(posts)} social media posts")
-        
-        # Add to background processing
-        background_tasks.add_task(process_social_batch_background, posts, ai_pipeline)
+        # Hand off to the background job queue
+        job_queue.submit(process_social_batch_background, posts, ai_pipeline)
         
         batch_id = f"social_batch_{int(time.time())}"
         
-        return APIResponse(
-            success=True,
-            message=f"Batch of {len(posts)} posts submitted for processing",
-            data={
+        return ORJSONResponse({
+            "success": True,
+            "message": f"Batch of {post_count} posts submitted for processing",
+            "data": {
                 "batch_id": batch_id,
-                "post_count": len(posts),
+                "post_count": post_count,
                 "status": "processing"
             },
-            processing_time=time.time() - start_time
-        )
+            "errors": [],
+            "processing_time": (time.perf_counter_ns() - start_ns) / 1e9
+        })
     
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=503, detail="Processing queue is full, retry later")
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error processing batch social media posts: {e}")
+        logger.error("Error processing batch social media posts: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.post("/batch/stream", openapi_extra=openapi_request_body(_BATCH_ADAPTER))
+async def stream_batch_posts(
+    posts: List[SocialMediaPost] = Depends(get_batch_posts),
+    ai_pipeline: AIPipeline = Depends(get_ai_pipeline)
+):
+    """
+    Analyze a batch of social media posts and stream the results.
+    
+    Results are written as newline-delimited JSON, one line per post,
+    as soon as each post is analyzed.
+    """
+    logger.info("Streaming batch of %d social media posts", len(posts))
+    
+    return StreamingResponse(
+        stream_analyzed_posts(posts, ai_pipeline),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.get("/analyze/{post_id}")
 async def analyze_social_post(
     post_id: str,
@@ -142,16 +199,16 @@ async def analyze_social_post(
         )
     
     except Exception as e:
-        logger.error(f"Error analyzing social post {post_id}: {e}")
+        logger.error("Error analyzing social post %s: %s", post_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/correlate")
 async def correlate_with_reports(
-    latitude: float,
-    longitude: float,
-    radius_km: float = 20.0,
-    time_window_hours: int = 24,
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(20.0, gt=0, le=500),
+    time_window_hours: int = Query(24, ge=1, le=8760),  # At most one year
     ai_pipeline: AIPipeline = Depends(get_ai_pipeline)
 ):
     """
@@ -161,36 +218,47 @@ async def correlate_with_reports(
     in a specific geographic area and time window for cross-verification.
     """
     try:
-        # Validate coordinates
-        if not (-90 <= latitude <= 90):
-            raise HTTPException(status_code=400, detail="Invalid latitude")
+        since = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
+        nearby_posts = get_social_index().query(latitude, longitude, radius_km, since=since)
+        nearby_reports = get_report_index().query(latitude, longitude, radius_km, since=since)
         
-        if not (-180 <= longitude <= 180):
-            raise HTTPException(status_code=400, detail="Invalid longitude")
+        # Group nearby reports by hazard type so each post is matched in one lookup
+        reports_by_hazard = {}
+        for nearby_report in nearby_reports:
+            reports_by_hazard.setdefault(nearby_report['hazard_type'], []).append(nearby_report['id'])
         
-        if radius_km <= 0 or radius_km > 500:
-            raise HTTPException(status_code=400, detail="Radius must be between 0 and 500 km")
+        correlations = []
+        for nearby_post in nearby_posts:
+            matching_reports = reports_by_hazard.get(nearby_post['hazard_type'], [])
+            correlations.append({
+                "post_id": nearby_post['id'],
+                "platform": nearby_post['platform'],
+                "hazard_type": nearby_post['hazard_type'],
+                "distance_km": nearby_post['distance_km'],
+                "matching_reports": matching_reports
+            })
         
-        # In a real implementation, this would perform spatial-temporal correlation
         correlation_result = {
             "location": {"latitude": latitude, "longitude": longitude},
             "radius_km": radius_km,
             "time_window_hours": time_window_hours,
-            "correlations": [],
-            "total_posts": 0,
-            "matching_posts": 0
+            "correlations": correlations,
+            "total_posts": len(nearby_posts),
+            "matching_posts": sum(1 for correlation in correlations if correlation['matching_reports'])
         }
         
-        return APIResponse(
-            success=True,
-            message="Social media correlation analysis completed",
-            data=correlation_result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Social media correlation analysis completed",
+            "data": correlation_result,
+            "errors": [],
+            "processing_time": None
+        })
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error correlating social media posts: {e}")
+        logger.error("Error correlating social media posts: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -228,36 +296,116 @@ async def get_trending_topics(
             "total_posts_analyzed": 2500
         }
         
-        return APIResponse(
-            success=True,
-            message="Trending topics analysis completed",
-            data=trending_result
-        )
+        return ORJSONResponse({
+            "success": True,
+            "message": "Trending topics analysis completed",
+            "data": trending_result,
+            "errors": [],
+            "processing_time": None
+        })
     
     except Exception as e:
-        logger.error(f"Error getting trending topics: {e}")
+        logger.error("Error getting trending topics: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 async def process_social_media_post(post: SocialMediaPost, ai_pipeline: AIPipeline) -> dict:
     """Process a single social media post through the AI pipeline."""
     try:
-        # Process text content using simplified methods
-        text_features = await ai_pipeline._process_text_simple(post.text, "en")
+        social_cache = get_social_cache()
+        cache_key = social_cache_key(post.text, post.images)
+        content_analysis = social_cache.get(cache_key)
+        
+        # Retweets and republished posts differ only slightly from a post already analyzed
+        fingerprint = None
+        if content_analysis is None and not post.images:
+            fingerprint = simhash(post.text)
+            content_analysis = get_near_duplicate_cache().get(fingerprint)
+        
+        if content_analysis is None:
+            # Process text content using simplified methods
+            text_features = ai_pipeline._process_text_simple(post.text, "en")
+            
+            # Near-duplicate text (retweets, templated posts) can reuse a hazard classification
+            semantic_cache = None
+            hazard_classification = None
+            if get_settings().SEMANTIC_CACHE_ENABLED and not post.images:
+                semantic_cache = get_semantic_cache()
+                hazard_classification = semantic_cache.get(text_features['embedding'])
+            
+            analysis = await analyze_social_media_post(
+                post, text_features, ai_pipeline, hazard_classification=hazard_classification
+            )
+            if semantic_cache is not None and hazard_classification is None:
+                semantic_cache.set(text_features['embedding'], analysis['hazard_analysis'])
+            content_analysis = {
+                'text_features': text_features,
+                'hazard_analysis': analysis['hazard_analysis'],
+                'image_analysis': analysis['image_analysis']
+            }
+            social_cache.set(cache_key, content_analysis)
+            if fingerprint is not None:
+                get_near_duplicate_cache().set(fingerprint, content_analysis)
+            return analysis
         
+        # Reuse cached content analysis; engagement and credibility are per post
+        text_features = content_analysis['text_features']
+        if fingerprint is not None:
+            # A near-duplicate shares only its hazard and image analysis, not this post's text features
+            text_features = ai_pipeline._process_text_simple(post.text, "en")
+        return await analyze_social_media_post(
+            post,
+            text_features,
+            ai_pipeline,
+            hazard_classification=content_analysis['hazard_analysis'],
+            image_features=content_analysis['image_analysis']
+        )
+    
+    except Exception as e:
+        logger.error("Error processing social media post %s: %s", post.id, e)
+        raise
+
+
+async def analyze_social_media_post(post: SocialMediaPost, text_features: dict, ai_pipeline: AIPipeline,
+                                    hazard_classification: Optional[dict] = None,
+                                    image_features: Optional[dict] = None,
+                                    engagement_score: Optional[float] = None,
+                                    credibility_score: Optional[float] = None) -> dict:
+    """Build the analysis for a post whose text features are already computed."""
+    try:
         # Process images if available using simplified methods
-        image_features = {}
-        if post.images:
-            image_features = await ai_pipeline._process_images_simple(post.images)
+        if image_features is None:
+            image_features = {}
+            if post.images:
+                image_features = ai_pipeline._process_images_simple(post.images)
         
         # Classify potential hazards using simplified methods
-        hazard_classification = await ai_pipeline._classify_hazards_simple(post.text)
+        if hazard_classification is None:
+            hazard_classification = ai_pipeline._classify_hazards_simple(post.text)
         
         # Calculate engagement score
-        engagement_score = calculate_engagement_score(post)
+        if engagement_score is None:
+            engagement_score = calculate_engagement_score(post)
         
         # Calculate credibility score based on author and content
-        credibility_score = calculate_social_credibility(post, text_features)
+        if credibility_score is None:
+            credibility_score = calculate_social_credibility(post, text_features)
+        
+        # Geolocated posts become available for correlation with reports
+        if post.location is not None:
+            get_social_index().add(
+                post.id,
+                post.location.latitude,
+                post.location.longitude,
+                {
+                    "id": post.id,
+                    "platform": post.platform,
+                    "hazard_type": hazard_classification.get('predicted_hazard'),
+                    "credibility_score": credibility_score,
+                    "posted_at": post.posted_at.isoformat()
+                },
+                post.posted_at
+            )
         
         return {
             "text_analysis": {
@@ -274,84 +422,108 @@ async def process_social_media_post(post: SocialMediaPost, ai_pipeline: AIPipeli
         }
     
     except Exception as e:
-        logger.error(f"Error processing social media post {post.id}: {e}")
+        logger.error("Error analyzing social media post %s: %s", post.id, e)
         raise
 
 
 def calculate_engagement_score(post: SocialMediaPost) -> float:
     """Calculate engagement score based on likes, shares, comments."""
-    try:
-        total_engagement = (post.likes or 0) + (post.shares or 0) + (post.comments or 0)
-        
-        # Normalize based on follower count
-        if post.author_followers and post.author_followers > 0:
-            engagement_rate = total_engagement / post.author_followers
-            # Cap at 1.0 and normalize to 0-1 scale
-            return min(1.0, engagement_rate * 100)
-        else:
-            # Fallback to absolute engagement
-            return min(1.0, total_engagement / 1000.0)
-    
-    except Exception:
-        return 0.0
+    return scoring.engagement_score(
+        post.likes or 0, post.shares or 0, post.comments or 0, post.author_followers or 0
+    )
 
 
 def calculate_social_credibility(post: SocialMediaPost, text_features: dict) -> float:
     """Calculate credibility score for social media post."""
+    return scoring.social_credibility(
+        bool(post.author_verified),
+        post.author_followers or 0,
+        text_features.get('language_confidence', 0.5),
+        text_features.get('word_count', 0),
+        bool(getattr(post, 'location', None))
+    )
+
+
+def calculate_engagement_scores(posts: List[SocialMediaPost]) -> np.ndarray:
+    """Vectorized calculate_engagement_score over a batch of posts."""
+    return scoring.engagement_scores(
+        np.array([(post.likes or 0) + (post.shares or 0) + (post.comments or 0) for post in posts], dtype=np.float64),
+        np.array([post.author_followers or 0 for post in posts], dtype=np.float64)
+    )
+
+
+def calculate_social_credibilities(posts: List[SocialMediaPost], text_features: List[dict]) -> np.ndarray:
+    """Vectorized calculate_social_credibility over a batch of posts."""
+    return scoring.social_credibilities(
+        np.array([bool(post.author_verified) for post in posts], dtype=bool),
+        np.array([post.author_followers or 0 for post in posts], dtype=np.float64),
+        np.array([features.get('language_confidence', 0.5) for features in text_features], dtype=np.float64),
+        np.array([features.get('word_count', 0) for features in text_features], dtype=np.float64),
+        np.array([bool(getattr(post, 'location', None)) for post in posts], dtype=bool)
+    )
+
+
+async def stream_analyzed_posts(posts: List[SocialMediaPost], ai_pipeline: AIPipeline) -> AsyncIterator[bytes]:
+    """Yield one NDJSON line per analyzed post."""
     try:
-        score = 0.0
-        
-        # Author verification
-        if post.author_verified:
-            score += 0.3
-        
-        # Follower count (normalized)
-        if post.author_followers:
-            follower_score = min(1.0, (post.author_followers / 10000))
-            score += 0.2 * follower_score
-        
-        # Text quality
-        lang_confidence = text_features.get('language_confidence', 0.5)
-        score += 0.2 * lang_confidence
-        
-        # Content length (not too short, not too long)
-        word_count = text_features.get('word_count', 0)
-        if 10 <= word_count <= 100:
-            length_score = 1.0
-        elif word_count < 10:
-            length_score = word_count / 10.0
-        else:
-            length_score = max(0.5, 1.0 - (word_count - 100) / 200.0)
-        score += 0.2 * length_score
-        
-        # Has location data
-        if hasattr(post, 'location') and post.location:
-            score += 0.1
-        
-        return max(0.0, min(1.0, score))
+        batch_text_features = await ai_pipeline._process_text_batch([post.text for post in posts], "en")
+        engagement_scores = calculate_engagement_scores(posts)
+        credibility_scores = calculate_social_credibilities(posts, batch_text_features)
+    except Exception as e:
+        logger.error("Streaming social batch processing failed: %s", e)
+        yield orjson.dumps({"success": False, "error": "Batch processing failed"}) + b"\n"
+        return
     
-    except Exception:
-        return 0.5
+    for post, text_features, engagement_score, credibility_score in zip(
+        posts, batch_text_features, engagement_scores, credibility_scores
+    ):
+        try:
+            analysis = await analyze_social_media_post(
+                post, text_features, ai_pipeline,
+                engagement_score=float(engagement_score),
+                credibility_score=float(credibility_score)
+            )
+            # Serialized here so an unserializable analysis fails only this post's line
+            line = orjson.dumps(
+                {"post_id": post.id, "platform": post.platform, "success": True, "analysis": analysis},
+                option=orjson.OPT_SERIALIZE_NUMPY
+            )
+        except Exception as e:
+            logger.error("Failed to process social post %s in stream: %s", post.id, e)
+            line = orjson.dumps({"post_id": post.id, "success": False, "error": "Post processing failed"})
+        
+        yield line + b"\n"
 
 
 async def process_social_batch_background(posts: List[SocialMediaPost], ai_pipeline: AIPipeline):
     """Background task for batch processing social media posts."""
     try:
-        processed_count = 0
+        settings = get_settings()
+        
+        # Extract text features for the whole batch in one pass, then analyze posts concurrently
+        batch_text_features = await ai_pipeline._process_text_batch([post.text for post in posts], "en")
+        engagement_scores = calculate_engagement_scores(posts)
+        credibility_scores = calculate_social_credibilities(posts, batch_text_features)
         
-        for post in posts:
-            try:
-                await process_social_media_post(post, ai_pipeline)
+        outcomes = await gather_with_concurrency(
+            (analyze_social_media_post(
+                post, text_features, ai_pipeline,
+                engagement_score=float(engagement_score),
+                credibility_score=float(credibility_score)
+            )
+             for post, text_features, engagement_score, credibility_score
+             in zip(posts, batch_text_features, engagement_scores, credibility_scores)),
+            limit=settings.BATCH_CONCURRENCY
+        )
+        
+        processed_count = 0
+        for post, outcome in zip(posts, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Failed to process social post %s in batch: %s", post.id, outcome)
+            else:
                 processed_count += 1
-                
-                if processed_count % 20 == 0:
-                    logger.info(f"Social batch processing: {processed_count}/{len(posts)} completed")
-            
-            except Exception as e:
-                logger.error(f"Failed to process social post {post.id} in batch: {e}")
-                continue
         
-        logger.info(f"Social batch processing completed: {processed_count}/{len(posts)} posts processed")
+        logger.info("Social batch processing completed: %d/%d posts processed", processed_count, len(posts))
         
     except Exception as e:
-        logger.error(f"Social batch processing failed: {e}")
+        logger.error("Social batch processing failed: %s", e)
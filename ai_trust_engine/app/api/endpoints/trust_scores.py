@@ -3,32 +3,108 @@ Trust Scoring API Endpoints
 Handles trust score calculation and retrieval
 """
 
+import asyncio
+import hashlib
 import logging
 import time
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, partial
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
+import numpy as np
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 
 from app.models.schemas import (
     CitizenReport, SocialMediaPost, TrustScore, 
     TrustScoreRequest, APIResponse
 )
 from app.services.ai_pipeline_simple import AIPipeline
+from app.services.batch_controller import get_batch_controller
+from app.services.result_cache import get_trust_score_cache
+from app.utils.helpers import gather_with_concurrency
+from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Shared AI pipeline, set by the application lifespan in main.py
+_AI_PIPELINE: Optional[AIPipeline] = None
+
+# Trust score components classified in bulk, in column order
+TRUST_COMPONENTS = ("overall_score", "content_credibility", "source_reliability", "cross_verification", "confidence")
+CONFIDENCE_LEVELS = ("low", "medium", "high")
+
+# Analytics distribution buckets, labelled like the score_distribution keys
+SCORE_BIN_EDGES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+SCORE_BIN_LABELS = tuple(f"{low:.1f}-{high:.1f}" for low, high in zip(SCORE_BIN_EDGES, SCORE_BIN_EDGES[1:]))
+
+# Recommendation flags
+FLAG_MANUAL_VERIFICATION = 1
+FLAG_CROSS_VERIFICATION = 2
+FLAG_CONTENT_REVIEW = 4
+FLAG_WARNINGS = 8
+
+# Messages per flag, in output order, and the precomputed list for every flag combination
+RECOMMENDATION_RULES = (
+    (FLAG_MANUAL_VERIFICATION, ("Manual verification strongly recommended",
+                                "Request additional evidence from reporter")),
+    (FLAG_CROSS_VERIFICATION, ("Seek additional confirmation from other sources",)),
+    (FLAG_CONTENT_REVIEW, ("Review content for inconsistencies",)),
+    (FLAG_WARNINGS, ("Address identified warnings before acting on report",))
+)
+DEFAULT_RECOMMENDATION = "Report appears credible - proceed with standard verification"
+RECOMMENDATIONS_BY_FLAGS = tuple(
+    tuple(message for flag, messages in RECOMMENDATION_RULES if mask & flag for message in messages)
+    or (DEFAULT_RECOMMENDATION,)
+    for mask in range(16)
+)
+
+# Served for reports without a fresh cached score
+MOCK_TRUST_SCORE = {
+    "overall_score": 0.75,
+    "content_credibility": 0.8,
+    "source_reliability": 0.7,
+    "temporal_consistency": 0.75,
+    "spatial_consistency": 0.8,
+    "cross_verification": 0.6,
+    "confidence": 0.85,
+    "processing_time": 2.3,
+    "model_version": "v1.0.0",
+    "factors": {
+        "language_confidence": 0.95,
+        "image_quality": 0.8,
+        "clip_alignment": 0.7,
+        "hazard_confidence": 0.82
+    },
+    "warnings": []
+}
+
+# Explanation tables; tier boundaries are inclusive lower bounds for overall score
+OVERALL_TIER_BOUNDS = (0.4, 0.6, 0.8)
+OVERALL_TIER_EXPLANATIONS = (
+    "Very low trust score indicates significant credibility concerns",
+    "Low trust score indicates potential credibility issues",
+    "Moderate trust score indicates reasonably credible report",
+    "High trust score indicates very credible report"
+)
+CONFIDENCE_TIER_BOUNDS = (0.6, 0.8)  # Exclusive lower bounds
+COMPONENT_EXPLANATIONS = (
+    ("content_credibility", 0.5, "Content analysis shows potential inconsistencies"),
+    ("source_reliability", 0.5, "Source reliability is below average")
+)
 
 
 def get_ai_pipeline():
     """Dependency to get AI Pipeline instance."""
-    from main import app
-    if not hasattr(app.state, 'ai_pipeline'):
+    ai_pipeline = _AI_PIPELINE
+    if ai_pipeline is None:
         raise HTTPException(status_code=503, detail="AI Pipeline not available")
-    return app.state.ai_pipeline
+    return ai_pipeline
 
 
-@router.post("/calculate", response_model=APIResponse)
+@router.post("/calculate")
 async def calculate_trust_score(
     request: TrustScoreRequest,
     ai_pipeline: AIPipeline = Depends(get_ai_pipeline)
@@ -40,39 +116,39 @@ async def calculate_trust_score(
     the report content, cross-referencing with social media posts,
     and applying various credibility algorithms.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
-        logger.info(f"Calculating trust score for report: {request.report.id}")
+        logger.info("Calculating trust score for report: %s", request.report.id)
         
-        # Process the report through AI pipeline
-        processing_results = await ai_pipeline.process_citizen_report(request.report)
-        
-        # Calculate trust score with social media context
-        trust_score = await ai_pipeline.calculate_trust_score(
-            request.report, 
-            processing_results,
+        # Process the report through AI pipeline and score it with social media context
+        processing_results, trust_score = await ai_pipeline.process_and_score(
+            request.report,
             request.social_media_posts
         )
         
         # Generate explanation
         explanation = generate_trust_explanation(trust_score, processing_results)
         
-        return APIResponse(
-            success=True,
-            message="Trust score calculated successfully",
-            data={
-                "trust_score": trust_score.dict(),
+        trust_score_data = trust_score.model_dump(mode="json")
+        get_trust_score_cache().set(request.report.id, trust_score_data)
+        
+        return ORJSONResponse({
+            "success": True,
+            "message": "Trust score calculated successfully",
+            "data": {
+                "trust_score": trust_score_data,
                 "explanation": explanation,
                 "report_id": request.report.id
             },
-            processing_time=time.time() - start_time
-        )
+            "errors": [],
+            "processing_time": (time.perf_counter_ns() - start_ns) / 1e9
+        })
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error calculating trust score for {request.report.id}: {e}")
+        logger.error("Error calculating trust score for %s: %s", request.report.id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -89,38 +165,33 @@ async def get_trust_score(
     and analysis results for a specific report.
     """
     try:
+        # Serve the last calculated score while it is fresh
+        cached_trust_score = get_trust_score_cache().get(report_id)
+        if cached_trust_score is not None:
+            return APIResponse(
+                success=True,
+                message="Trust score retrieved successfully",
+                data={
+                    "report_id": report_id,
+                    "trust_score": cached_trust_score,
+                    "cache": "hit"
+                }
+            )
+        
         # In a real implementation, this would retrieve from database
         # For now, return a mock trust score
-        mock_trust_score = {
-            "overall_score": 0.75,
-            "content_credibility": 0.8,
-            "source_reliability": 0.7,
-            "temporal_consistency": 0.75,
-            "spatial_consistency": 0.8,
-            "cross_verification": 0.6,
-            "confidence": 0.85,
-            "processing_time": 2.3,
-            "model_version": "v1.0.0",
-            "factors": {
-                "language_confidence": 0.95,
-                "image_quality": 0.8,
-                "clip_alignment": 0.7,
-                "hazard_confidence": 0.82
-            },
-            "warnings": []
-        }
-        
         return APIResponse(
             success=True,
             message="Trust score retrieved successfully",
             data={
                 "report_id": report_id,
-                "trust_score": mock_trust_score
+                "trust_score": MOCK_TRUST_SCORE,
+                "cache": "miss"
             }
         )
     
     except Exception as e:
-        logger.error(f"Error retrieving trust score for {report_id}: {e}")
+        logger.error("Error retrieving trust score for %s: %s", report_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -136,65 +207,84 @@ async def calculate_bulk_trust_scores(
     This endpoint efficiently processes multiple reports to generate
     trust scores, useful for batch analysis and historical data processing.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
-        if len(reports) > 50:
+        report_count = len(reports)
+        if report_count > 50:
             raise HTTPException(status_code=400, detail="Bulk processing limited to 50 reports")
         
-        logger.info(f"Calculating trust scores for {len(reports)} reports")
+        logger.info("Calculating trust scores for %d reports", report_count)
         
-        results = []
         social_posts = social_media_posts or []
         
-        for report in reports:
-            try:
-                # Process each report
-                processing_results = await ai_pipeline.process_citizen_report(report)
-                
-                # Calculate trust score
-                trust_score = await ai_pipeline.calculate_trust_score(
-                    report, processing_results, social_posts
-                )
-                
-                results.append({
-                    "report_id": report.id,
-                    "trust_score": trust_score.dict(),
-                    "status": "success"
-                })
-                
-            except Exception as e:
-                logger.error(f"Error processing report {report.id}: {e}")
-                results.append({
-                    "report_id": report.id,
-                    "trust_score": None,
-                    "status": "failed",
-                    "error": str(e)
-                })
+        # Split into sub-batches sized from recent pipeline latency and score them concurrently
+        controller = get_batch_controller()
+        sub_batch_size = controller.batch_size()
+        score_sub_batch = partial(score_report_batch, social_posts=social_posts, ai_pipeline=ai_pipeline)
+        sub_batches = [reports[i:i + sub_batch_size] for i in range(0, report_count, sub_batch_size)]
+        sub_batch_results = await gather_with_concurrency(
+            (controller.run(score_sub_batch, sub_batch) for sub_batch in sub_batches),
+            limit=get_settings().BATCH_CONCURRENCY
+        )
         
-        successful_count = sum(1 for r in results if r["status"] == "success")
+        # A sub-batch that raised fails only its own reports
+        results = []
+        for sub_batch, outcome in zip(sub_batches, sub_batch_results):
+            if isinstance(outcome, Exception):
+                logger.error("Bulk trust score sub-batch of %d reports failed: %s", len(sub_batch), outcome)
+                results.extend(failed_result(report, outcome) for report in sub_batch)
+            else:
+                results.extend(outcome)
         
-        return APIResponse(
-            success=True,
-            message=f"Bulk trust score calculation completed. {successful_count}/{len(reports)} successful.",
-            data={
+        successful_count = annotate_bulk_results(results)
+        
+        return ORJSONResponse({
+            "success": True,
+            "message": f"Bulk trust score calculation completed. {successful_count}/{report_count} successful.",
+            "data": {
                 "results": results,
-                "total_reports": len(reports),
+                "total_reports": report_count,
                 "successful": successful_count,
-                "failed": len(reports) - successful_count
+                "failed": report_count - successful_count
             },
-            processing_time=time.time() - start_time
-        )
+            "errors": [],
+            "processing_time": (time.perf_counter_ns() - start_ns) / 1e9
+        })
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in bulk trust score calculation: {e}")
+        logger.error("Error in bulk trust score calculation: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.post("/bulk-calculate/stream")
+async def stream_bulk_trust_scores(
+    reports: List[CitizenReport],
+    social_media_posts: Optional[List[SocialMediaPost]] = None,
+    ai_pipeline: AIPipeline = Depends(get_ai_pipeline)
+):
+    """
+    Calculate trust scores for multiple reports and stream the results.
+    
+    Results are written as newline-delimited JSON, one line per report,
+    in completion order rather than request order.
+    """
+    if len(reports) > 50:
+        raise HTTPException(status_code=400, detail="Bulk processing limited to 50 reports")
+    
+    logger.info("Streaming trust scores for %d reports", len(reports))
+    
+    return StreamingResponse(
+        stream_trust_scores(reports, social_media_posts or [], ai_pipeline),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.get("/analytics/distribution")
 async def get_trust_score_distribution(
+    request: Request,
     time_period: str = "24h",  # 24h, 7d, 30d
     hazard_type: Optional[str] = None
 ):
@@ -205,38 +295,16 @@ async def get_trust_score_distribution(
     across different time periods and hazard types.
     """
     try:
-        # In a real implementation, this would query the database
-        # Mock distribution data
-        distribution_data = {
-            "time_period": time_period,
-            "hazard_type": hazard_type,
-            "total_reports": 1500,
-            "score_distribution": {
-                "0.0-0.2": 120,
-                "0.2-0.4": 180,
-                "0.4-0.6": 450,
-                "0.6-0.8": 520,
-                "0.8-1.0": 230
-            },
-            "average_score": 0.62,
-            "median_score": 0.65,
-            "high_trust_reports": 750,  # Score > 0.6
-            "low_trust_reports": 300    # Score < 0.4
-        }
-        
-        return APIResponse(
-            success=True,
-            message="Trust score distribution retrieved",
-            data=distribution_data
-        )
+        return cacheable_json_response(request, build_distribution_response(time_period, hazard_type))
     
     except Exception as e:
-        logger.error(f"Error getting trust score distribution: {e}")
+        logger.error("Error getting trust score distribution: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/analytics/trends")
 async def get_trust_score_trends(
+    request: Request,
     days: int = 7,
     hazard_type: Optional[str] = None
 ):
@@ -250,38 +318,18 @@ async def get_trust_score_trends(
         if days < 1 or days > 365:
             raise HTTPException(status_code=400, detail="Days must be between 1 and 365")
         
-        # Mock trend data
-        trend_data = {
-            "days": days,
-            "hazard_type": hazard_type,
-            "daily_averages": [
-                {"date": "2024-12-07", "avg_score": 0.68, "count": 45},
-                {"date": "2024-12-08", "avg_score": 0.72, "count": 52},
-                {"date": "2024-12-09", "avg_score": 0.65, "count": 38},
-                {"date": "2024-12-10", "avg_score": 0.70, "count": 41},
-                {"date": "2024-12-11", "avg_score": 0.74, "count": 47},
-                {"date": "2024-12-12", "avg_score": 0.69, "count": 39},
-                {"date": "2024-12-13", "avg_score": 0.71, "count": 44}
-            ],
-            "overall_trend": "stable",  # improving, declining, stable
-            "trend_score": 0.02  # Change rate
-        }
-        
-        return APIResponse(
-            success=True,
-            message="Trust score trends retrieved",
-            data=trend_data
-        )
+        return cacheable_json_response(request, build_trends_response(days, hazard_type))
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting trust score trends: {e}")
+        logger.error("Error getting trust score trends: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/model/metrics")
 async def get_model_metrics(
+    request: Request,
     ai_pipeline: AIPipeline = Depends(get_ai_pipeline)
 ):
     """
@@ -291,61 +339,241 @@ async def get_model_metrics(
     including accuracy, processing times, and resource usage.
     """
     try:
-        # Mock model metrics
-        metrics_data = {
-            "model_version": "v1.0.0",
-            "uptime_hours": 72.5,
-            "total_reports_processed": 5420,
-            "average_processing_time": 2.1,
-            "model_performance": {
-                "nlp_accuracy": 0.87,
-                "image_classification_accuracy": 0.83,
-                "duplicate_detection_precision": 0.91,
-                "duplicate_detection_recall": 0.78
-            },
-            "resource_usage": {
-                "cpu_usage_percent": 45,
-                "memory_usage_gb": 3.2,
-                "gpu_usage_percent": 72
-            },
-            "error_rates": {
-                "total_errors": 23,
-                "error_rate_percent": 0.42
-            }
-        }
-        
-        return APIResponse(
-            success=True,
-            message="Model metrics retrieved",
-            data=metrics_data
-        )
+        return cacheable_json_response(request, build_model_metrics_response())
     
     except Exception as e:
-        logger.error(f"Error getting model metrics: {e}")
+        logger.error("Error getting model metrics: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+async def score_report(report: CitizenReport, social_posts: List[SocialMediaPost], ai_pipeline: AIPipeline) -> dict:
+    """Score one report for a bulk request, capturing failures in the result."""
+    try:
+        # Process and score the report; bulk results skip the TrustScore model
+        _, trust_score_data = await ai_pipeline.process_and_score(report, social_posts, as_dict=True)
+        get_trust_score_cache().set(report.id, trust_score_data)
+        
+        return {
+            "report_id": report.id,
+            "trust_score": trust_score_data,
+            "status": "success"
+        }
+    
+    except Exception as e:
+        logger.error("Error processing report %s: %s", report.id, e)
+        return failed_result(report, e)
+
+
+async def score_report_batch(reports: List[CitizenReport], social_posts: List[SocialMediaPost],
+                             ai_pipeline: AIPipeline) -> List[dict]:
+    """Score a sub-batch of reports with one batched pipeline pass, capturing failures in the results."""
+    try:
+        batch_results = await ai_pipeline.process_citizen_report_batch(reports)
+    except Exception as e:
+        logger.error("Error processing report batch: %s", e)
+        return [failed_result(report, e) for report in reports]
+    
+    results = []
+    for report, processing_results in zip(reports, batch_results):
+        try:
+            trust_score_data = await ai_pipeline.calculate_trust_score_dict(report, processing_results, social_posts)
+            get_trust_score_cache().set(report.id, trust_score_data)
+            results.append({
+                "report_id": report.id,
+                "trust_score": trust_score_data,
+                "status": "success"
+            })
+        except Exception as e:
+            logger.error("Error processing report %s: %s", report.id, e)
+            results.append(failed_result(report, e))
+    
+    return results
+
+
+def failed_result(report: CitizenReport, error: Exception) -> dict:
+    """Bulk result entry for a report that could not be scored."""
+    return {
+        "report_id": report.id,
+        "trust_score": None,
+        "status": "failed",
+        "error": str(error)
+    }
+
+
+def cacheable_json_response(request: Request, body: bytes) -> Response:
+    """JSON response with a weak ETag and shared-cache lifetime; 304 when the client copy is current."""
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={get_settings().ANALYTICS_CACHE_MAX_AGE}"
+    }
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(body, media_type="application/json", headers=headers)
+
+
+# Mock analytics only vary with their query parameters, so their serialized responses are memoized
+@lru_cache(maxsize=256)
+def build_distribution_response(time_period: str, hazard_type: Optional[str]) -> bytes:
+    """Serialized trust score distribution response."""
+    # In a real implementation, this would query the database and pass
+    # the overall scores to summarize_score_distribution
+    # Mock distribution data
+    distribution_data = {
+        "time_period": time_period,
+        "hazard_type": hazard_type,
+        "total_reports": 1500,
+        "score_distribution": {
+            "0.0-0.2": 120,
+            "0.2-0.4": 180,
+            "0.4-0.6": 450,
+            "0.6-0.8": 520,
+            "0.8-1.0": 230
+        },
+        "average_score": 0.62,
+        "median_score": 0.65,
+        "high_trust_reports": 750,  # Score > 0.6
+        "low_trust_reports": 300    # Score < 0.4
+    }
+    
+    return orjson.dumps(APIResponse(
+        success=True,
+        message="Trust score distribution retrieved",
+        data=distribution_data
+    ).model_dump(mode="json"))
+
+
+def summarize_score_distribution(scores: Iterable[float]) -> dict:
+    """Distribution fields of the analytics response for a sequence of overall scores."""
+    # Load once, then let NumPy do the bucket counting instead of a Python loop
+    values = np.fromiter(scores, dtype=np.float64)
+    counts, _ = np.histogram(values, bins=SCORE_BIN_EDGES)
+    return {
+        "total_reports": int(values.size),
+        "score_distribution": dict(zip(SCORE_BIN_LABELS, counts.tolist())),
+        "average_score": float(values.mean()) if values.size else 0.0,
+        "median_score": float(np.median(values)) if values.size else 0.0,
+        "high_trust_reports": int(np.count_nonzero(values > 0.6)),
+        "low_trust_reports": int(np.count_nonzero(values < 0.4))
+    }
+
+
+@lru_cache(maxsize=256)
+def build_trends_response(days: int, hazard_type: Optional[str]) -> bytes:
+    """Serialized trust score trends response."""
+    # Mock trend data
+    trend_data = {
+        "days": days,
+        "hazard_type": hazard_type,
+        "daily_averages": [
+            {"date": "2024-12-07", "avg_score": 0.68, "count": 45},
+            {"date": "2024-12-08", "avg_score": 0.72, "count": 52},
+            {"date": "2024-12-09", "avg_score": 0.65, "count": 38},
+            {"date": "2024-12-10", "avg_score": 0.70, "count": 41},
+            {"date": "2024-12-11", "avg_score": 0.74, "count": 47},
+            {"date": "2024-12-12", "avg_score": 0.69, "count": 39},
+            {"date": "2024-12-13", "avg_score": 0.71, "count": 44}
+        ],
+        "overall_trend": "stable",  # improving, declining, stable
+        "trend_score": 0.02  # Change rate
+    }
+    
+    return orjson.dumps(APIResponse(
+        success=True,
+        message="Trust score trends retrieved",
+        data=trend_data
+    ).model_dump(mode="json"))
+
+
+@lru_cache(maxsize=1)
+def build_model_metrics_response() -> bytes:
+    """Serialized model metrics response."""
+    # Mock model metrics
+    metrics_data = {
+        "model_version": "v1.0.0",
+        "uptime_hours": 72.5,
+        "total_reports_processed": 5420,
+        "average_processing_time": 2.1,
+        "model_performance": {
+            "nlp_accuracy": 0.87,
+            "image_classification_accuracy": 0.83,
+            "duplicate_detection_precision": 0.91,
+            "duplicate_detection_recall": 0.78
+        },
+        "resource_usage": {
+            "cpu_usage_percent": 45,
+            "memory_usage_gb": 3.2,
+            "gpu_usage_percent": 72
+        },
+        "error_rates": {
+            "total_errors": 23,
+            "error_rate_percent": 0.42
+        }
+    }
+    
+    return orjson.dumps(APIResponse(
+        success=True,
+        message="Model metrics retrieved",
+        data=metrics_data
+    ).model_dump(mode="json"))
+
+
+def annotate_bulk_results(results: List[dict]) -> int:
+    """Add recommendations and confidence levels to successful bulk results; returns their count."""
+    # Classify all successful scores in one vectorized pass
+    scored = [r for r in results if r["status"] == "success"]
+    if scored:
+        scores = np.array(
+            [[r["trust_score"][component] for component in TRUST_COMPONENTS] for r in scored],
+            dtype=np.float64
+        )
+        flags, confidence_tiers = classify_trust_scores(scores)
+        for result, result_flags, confidence_tier in zip(scored, flags, confidence_tiers):
+            result["recommendations"] = recommendations_for_flags(
+                int(result_flags), bool(result["trust_score"]["warnings"])
+            )
+            result["confidence_level"] = CONFIDENCE_LEVELS[confidence_tier]
+    
+    return len(scored)
+
+
+async def stream_trust_scores(reports: List[CitizenReport], social_posts: List[SocialMediaPost],
+                              ai_pipeline: AIPipeline) -> AsyncIterator[bytes]:
+    """Yield one NDJSON line per report as soon as its trust score is ready."""
+    semaphore = asyncio.Semaphore(get_settings().BATCH_CONCURRENCY)
+    
+    async def bounded(report: CitizenReport) -> dict:
+        async with semaphore:
+            return await score_report(report, social_posts, ai_pipeline)
+    
+    tasks = [asyncio.ensure_future(bounded(report)) for report in reports]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            result = await next_result
+            annotate_bulk_results([result])
+            yield orjson.dumps(result) + b"\n"
+    finally:
+        # Stop scoring if the client goes away mid-stream
+        for task in tasks:
+            task.cancel()
+        # Let cancelled tasks finish so their exceptions are retrieved, not logged as never awaited
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 def generate_trust_explanation(trust_score: TrustScore, processing_results: dict) -> dict:
     """Generate human-readable explanation for trust score."""
     try:
-        explanations = []
-        
         # Overall score interpretation
-        if trust_score.overall_score >= 0.8:
-            explanations.append("High trust score indicates very credible report")
-        elif trust_score.overall_score >= 0.6:
-            explanations.append("Moderate trust score indicates reasonably credible report")
-        elif trust_score.overall_score >= 0.4:
-            explanations.append("Low trust score indicates potential credibility issues")
-        else:
-            explanations.append("Very low trust score indicates significant credibility concerns")
+        explanations = [OVERALL_TIER_EXPLANATIONS[bisect_right(OVERALL_TIER_BOUNDS, trust_score.overall_score)]]
         
         # Component explanations
-        if trust_score.content_credibility < 0.5:
-            explanations.append("Content analysis shows potential inconsistencies")
-        
-        if trust_score.source_reliability < 0.5:
-            explanations.append("Source reliability is below average")
+        explanations.extend(
+            message for component, threshold, message in COMPONENT_EXPLANATIONS
+            if getattr(trust_score, component) < threshold
+        )
         
         # Processing insights
         text_features = processing_results.get('text_features', {})
@@ -364,11 +592,11 @@ def generate_trust_explanation(trust_score: TrustScore, processing_results: dict
             "summary": explanations[0] if explanations else "Standard trust assessment completed",
             "details": explanations,
             "recommendations": generate_recommendations(trust_score),
-            "confidence_level": "high" if trust_score.confidence > 0.8 else "medium" if trust_score.confidence > 0.6 else "low"
+            "confidence_level": CONFIDENCE_LEVELS[bisect_left(CONFIDENCE_TIER_BOUNDS, trust_score.confidence)]
         }
     
     except Exception as e:
-        logger.error(f"Error generating trust explanation: {e}")
+        logger.error("Error generating trust explanation: %s", e)
         return {
             "summary": "Trust score calculated",
             "details": [],
@@ -379,22 +607,30 @@ def generate_trust_explanation(trust_score: TrustScore, processing_results: dict
 
 def generate_recommendations(trust_score: TrustScore) -> List[str]:
     """Generate actionable recommendations based on trust score."""
-    recommendations = []
-    
+    flags = 0
     if trust_score.overall_score < 0.4:
-        recommendations.append("Manual verification strongly recommended")
-        recommendations.append("Request additional evidence from reporter")
-    
+        flags |= FLAG_MANUAL_VERIFICATION
     if trust_score.cross_verification < 0.5:
-        recommendations.append("Seek additional confirmation from other sources")
-    
+        flags |= FLAG_CROSS_VERIFICATION
     if trust_score.content_credibility < 0.6:
-        recommendations.append("Review content for inconsistencies")
-    
-    if len(trust_score.warnings) > 0:
-        recommendations.append("Address identified warnings before acting on report")
+        flags |= FLAG_CONTENT_REVIEW
     
-    if not recommendations:
-        recommendations.append("Report appears credible - proceed with standard verification")
-    
-    return recommendations
+    return recommendations_for_flags(flags, len(trust_score.warnings) > 0)
+
+
+def classify_trust_scores(scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Recommendation flags and confidence tiers for an (N, 5) array of TRUST_COMPONENTS."""
+    flags = (
+        np.where(scores[:, 0] < 0.4, FLAG_MANUAL_VERIFICATION, 0)
+        | np.where(scores[:, 3] < 0.5, FLAG_CROSS_VERIFICATION, 0)
+        | np.where(scores[:, 1] < 0.6, FLAG_CONTENT_REVIEW, 0)
+    ).astype(np.uint8)
+    confidence_tiers = (scores[:, 4] > 0.6).astype(np.uint8) + (scores[:, 4] > 0.8)
+    return flags, confidence_tiers
+
+
+def recommendations_for_flags(flags: int, has_warnings: bool) -> List[str]:
+    """Map recommendation flags to their messages."""
+    if has_warnings:
+        flags |= FLAG_WARNINGS
+    return list(RECOMMENDATIONS_BY_FLAGS[flags])
@@ -0,0 +1,48 @@
+"""
+Request Body Validation for SeaSense AI Trust Engine
+Single-pass parsing of raw JSON bodies for high-volume batch endpoints
+"""
+
+from typing import Any, Dict
+
+import orjson
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+
+
+def openapi_request_body(adapter: TypeAdapter) -> Dict[str, Any]:
+    """OpenAPI requestBody for a route that reads its body manually."""
+    schema = adapter.json_schema(ref_template="#/components/schemas/{model}")
+    # Nested models are already registered as components by the single-item routes
+    schema.pop("$defs", None)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}}
+        }
+    }
+
+
+def parse_json_body(body: bytes) -> Any:
+    """Decode a raw JSON body, reporting malformed input the way FastAPI does."""
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError([{
+            "type": "json_invalid",
+            "loc": ("body", e.pos),
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": e.msg}
+        }])
+
+
+def validate_body(adapter: TypeAdapter, payload: Any) -> Any:
+    """Validate a decoded body in one call, raising FastAPI's 422 on failure."""
+    try:
+        return adapter.validate_python(payload)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+            body=payload
+        )
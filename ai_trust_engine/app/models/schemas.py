@@ -2,12 +2,21 @@
 Pydantic models for SeaSense AI Trust Engine
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, constr, field_validator
+import re
 import uuid
 
+# Standard base64 alphabet with optional padding
+_BASE64_RE = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+
+
+def utc_now() -> datetime:
+    """Timezone-aware current UTC time."""
+    return datetime.now(timezone.utc)
+
 
 class HazardType(str, Enum):
     """Types of ocean hazards."""
@@ -51,15 +60,13 @@ class ImageData(BaseModel):
     filename: Optional[str] = Field(None, description="Original filename")
     content_type: str = Field(default="image/jpeg", description="MIME type")
     
-    @validator('base64_data')
-    def validate_base64(cls, v):
-        """Validate base64 data format."""
-        import base64
-        try:
-            base64.b64decode(v)
-            return v
-        except Exception:
+    @field_validator('base64_data')
+    @classmethod
+    def validate_base64(cls, v: str) -> str:
+        """Validate base64 data format without decoding the payload."""
+        if len(v) % 4 or not _BASE64_RE.fullmatch(v):
             raise ValueError("Invalid base64 data")
+        return v
 
 
 class CitizenReport(BaseModel):
@@ -67,13 +74,13 @@ class CitizenReport(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique report ID")
     
     # Content
-    description: str = Field(..., min_length=10, max_length=5000, description="Report description")
+    description: constr(strip_whitespace=True, min_length=10, max_length=5000) = Field(..., description="Report description")
     hazard_type: HazardType = Field(..., description="Type of hazard reported")
     
     # Location and Time
     location: GPSCoordinates = Field(..., description="GPS coordinates")
     location_name: Optional[str] = Field(None, description="Human-readable location name")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Report timestamp")
+    timestamp: datetime = Field(default_factory=utc_now, description="Report timestamp")
     
     # Media
     images: Optional[List[ImageData]] = Field(default=[], description="Associated images")
@@ -93,7 +100,7 @@ class SocialMediaPost(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique post ID")
     
     # Content
-    text: str = Field(..., description="Post text content")
+    text: constr(strip_whitespace=True, min_length=1) = Field(..., description="Post text content")
     platform: str = Field(..., description="Social media platform")
     original_url: Optional[str] = Field(None, description="Original post URL")
     
@@ -114,7 +121,7 @@ class SocialMediaPost(BaseModel):
     
     # Timing
     posted_at: datetime = Field(..., description="Post creation time")
-    scraped_at: datetime = Field(default_factory=datetime.utcnow, description="Data collection time")
+    scraped_at: datetime = Field(default_factory=utc_now, description="Data collection time")
 
 
 class TrustScore(BaseModel):
@@ -162,7 +169,7 @@ class ProcessedReport(BaseModel):
     verification_notes: Optional[str] = Field(None, description="Verification comments")
     
     # Processing metadata
-    processed_at: datetime = Field(default_factory=datetime.utcnow, description="Processing completion time")
+    processed_at: datetime = Field(default_factory=utc_now, description="Processing completion time")
     processing_version: str = Field(..., description="Processing pipeline version")
 
 
@@ -5,29 +5,102 @@ Handles NLP, Computer Vision, and cross-verification
 
 import asyncio
 import logging
+import os
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple, Union
 import numpy as np
 import torch
 from transformers import AutoTokenizer, AutoModel, pipeline
 import clip
 import cv2
+from langdetect import DetectorFactory, detect_langs
+from langdetect.lang_detect_exception import LangDetectException
 from PIL import Image
 import io
 import base64
-from sklearn.cluster import DBSCAN
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 import pickle
 import hashlib
 
 from app.models.schemas import (
     CitizenReport, SocialMediaPost, TrustScore, 
-    DuplicateDetectionResult, HazardType
+    DuplicateDetectionResult, HazardType, ImageData
 )
+from app.services import scoring
+from app.services.embedding_index import EmbeddingIndex
+from app.services.micro_batcher import MicroBatcher
+from app.services.result_cache import ResultCache, feature_cache_key
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Long side, in pixels, of the working copy used for image quality metrics
+QUALITY_WORKING_SIZE = 512
+
+# JPEG draft-mode decode target; no model or quality metric here needs more pixels
+IMAGE_DECODE_SIZE = (512, 512)
+
+# Token length bucket for compiled mBERT, bounding the number of input shapes it sees
+TEXT_PAD_MULTIPLE = 64
+
+# Softmax temperature for hazard scores; mBERT cosine similarities sit close together
+HAZARD_LABEL_TEMPERATURE = 0.05
+
+# Dimension of the random projection of mBERT embeddings stored for duplicate detection
+REPORT_TEXT_DIM = 128
+
+# Preferred INT8 kernel backends for CPU quantization; x86 and fbgemm use VNNI dot products when available
+QUANTIZED_ENGINES = ("x86", "fbgemm", "qnnpack")
+
+# Deterministic language detection
+DetectorFactory.seed = 0
+
+
+def _vectorized_dbscan(embeddings: np.ndarray, eps: float, min_samples: int,
+                       block_size: int = 1024) -> np.ndarray:
+    """DBSCAN labels under cosine distance for unit-normalized rows; -1 marks noise."""
+    count = embeddings.shape[0]
+    labels = np.full(count, -1, dtype=np.int64)
+    if count == 0:
+        return labels
+    
+    # Epsilon-neighbourhoods from X @ X.T, one block of rows at a time to bound memory
+    rows, cols = [], []
+    for start in range(0, count, block_size):
+        block_rows, block_cols = np.nonzero(embeddings[start:start + block_size] @ embeddings.T >= 1.0 - eps)
+        rows.append(block_rows + start)
+        cols.append(block_cols)
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    neighbours = csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(count, count))
+    
+    # Core points have at least min_samples neighbours, themselves included
+    core = np.flatnonzero(np.asarray(neighbours.sum(axis=1)).ravel() >= min_samples)
+    if len(core) == 0:
+        return labels
+    
+    # Clusters are the connected components of the core points
+    _, components = connected_components(neighbours[core][:, core], directed=False)
+    labels[core] = components
+    
+    # Border points join the cluster of their first core neighbour
+    core_neighbours = neighbours[:, core].tocsr()
+    for point in np.flatnonzero(labels == -1):
+        linked = core_neighbours[point].indices
+        if len(linked):
+            labels[point] = components[linked.min()]
+    
+    return labels
+
+
+def _init_inference_thread():
+    """Give each inference thread its own CUDA stream so concurrent forward passes overlap."""
+    if torch.cuda.is_available():
+        # The current stream is per thread; the caching allocator pools blocks per stream
+        torch.cuda.set_stream(torch.cuda.Stream())
+
 
 class AIPipeline:
     """Main AI processing pipeline for trust scoring."""
@@ -39,8 +112,40 @@ class AIPipeline:
         self.pipelines = {}
         self.is_initialized = False
         
-        # Cache for duplicate detection
-        self.report_embeddings = {}
+        # Dedicated threads for model forward passes so they never run on the event loop
+        self._inference_executor = ThreadPoolExecutor(
+            max_workers=self.settings.INFERENCE_WORKERS,
+            thread_name_prefix="inference",
+            initializer=_init_inference_thread
+        )
+        
+        # Coalesce concurrent single-report text calls into batched forward passes
+        self._text_batcher = MicroBatcher(
+            self._encode_text_items,
+            max_batch_size=self.settings.MICRO_BATCH_SIZE,
+            max_wait=self.settings.MICRO_BATCH_WAIT
+        )
+        
+        # Model outputs for repeated texts and image payloads, so duplicate reports skip the forward passes
+        self._text_cache = ResultCache(maxsize=self.settings.FEATURE_CACHE_SIZE, ttl=self.settings.CACHE_TTL)
+        self._image_cache = ResultCache(maxsize=self.settings.FEATURE_CACHE_SIZE, ttl=self.settings.CACHE_TTL)
+        
+        # Hazard labels and their unit-normalized mBERT embeddings, computed at initialization
+        self._hazard_labels = [hazard.value for hazard in HazardType]
+        self._hazard_index = {hazard: index for index, hazard in enumerate(HazardType)}
+        self._hazard_label_embeddings: Optional[np.ndarray] = None
+        
+        # Johnson-Lindenstrauss projection of mBERT embeddings into report embeddings, sized at initialization
+        self._text_projection: Optional[np.ndarray] = None
+        
+        # Cache for duplicate detection; each pipeline persists its own embedding layout
+        self.report_embeddings = EmbeddingIndex(
+            path=(
+                os.path.join(self.settings.EMBEDDINGS_CACHE_DIR, "reports_model")
+                if self.settings.PERSIST_REPORT_EMBEDDINGS else None
+            ),
+            max_size=self.settings.DUPLICATE_INDEX_SIZE
+        )
         self.report_clusters = {}
         
     async def initialize(self):
@@ -48,6 +153,8 @@ class AIPipeline:
         try:
             logger.info("Initializing AI Pipeline...")
             
+            self._configure_torch()
+            
             # Initialize NLP models
             await self._initialize_nlp_models()
             
@@ -57,24 +164,63 @@ class AIPipeline:
             # Initialize clustering for duplicate detection
             await self._initialize_clustering()
             
+            await self._text_batcher.start()
+            
             self.is_initialized = True
             logger.info("AI Pipeline initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize AI Pipeline: {e}")
+            logger.error("Failed to initialize AI Pipeline: %s", e)
             raise
     
+    def _configure_torch(self):
+        """Pin torch CPU threading and tune the CUDA allocator before any model loads."""
+        num_threads = self.settings.TORCH_NUM_THREADS
+        if num_threads <= 0:
+            processes = max(1, int(os.environ.get("WEB_CONCURRENCY", "1")))
+            num_threads = max(1, (os.cpu_count() or 1) // processes)
+        torch.set_num_threads(num_threads)
+        
+        # Requests already run in parallel on the inference executor
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Only settable before the first inter-op parallel work in the process
+            pass
+        
+        # oneDNN kernels for CPU matmuls and convolutions; allow faster float32 matmul paths
+        torch.backends.mkldnn.enabled = True
+        torch.set_float32_matmul_precision("high")
+        logger.info("Torch using %d intra-op threads", num_threads)
+        
+        # Expandable segments avoid fragmentation from varying batch shapes; read on first CUDA allocation
+        torch_version = tuple(int(part) for part in torch.__version__.split(".")[:2])
+        if torch_version >= (2, 1):
+            os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+    
     async def _initialize_nlp_models(self):
         """Initialize NLP models (mBERT, sentiment analysis, etc.)."""
         try:
             # mBERT for multilingual text processing
             logger.info("Loading mBERT model...")
             self.tokenizers['mbert'] = AutoTokenizer.from_pretrained(
-                self.settings.MBERT_MODEL
+                self.settings.MBERT_MODEL,
+                use_fast=True
             )
-            self.models['mbert'] = AutoModel.from_pretrained(
+            mbert = AutoModel.from_pretrained(
                 self.settings.MBERT_MODEL
-            )
+            ).eval()
+            if torch.cuda.is_available():
+                # Half precision runs on tensor cores and halves VRAM
+                self.models['mbert'] = mbert.half().to("cuda")
+            else:
+                self.models['mbert'] = self._quantize_for_cpu("mBERT", mbert)
+            self.models['mbert'] = self._compile("mBERT", self.models['mbert'])
+            
+            # Fixed seed so every worker and restart projects into the same space
+            self._text_projection = np.random.default_rng(0).standard_normal(
+                (mbert.config.hidden_size, REPORT_TEXT_DIM)
+            ).astype(np.float32) / np.sqrt(REPORT_TEXT_DIM)
             
             # Sentiment analysis pipeline
             logger.info("Loading sentiment analysis pipeline...")
@@ -84,35 +230,39 @@ class AIPipeline:
                 return_all_scores=True
             )
             
-            # Language detection
-            logger.info("Loading language detection pipeline...")
-            self.pipelines['language'] = pipeline(
-                "text-classification",
-                model="papluca/xlm-roberta-base-language-detection"
+            # Hazard classification compares report embeddings against these label embeddings;
+            # this first mBERT call also warms up compilation
+            logger.info("Embedding hazard labels...")
+            label_embeddings = await self._run_inference(
+                self._embed_texts, [label.replace('_', ' ') for label in self._hazard_labels]
             )
-            
-            # Hazard classification
-            logger.info("Loading hazard classification pipeline...")
-            self.pipelines['hazard'] = pipeline(
-                "zero-shot-classification",
-                model="facebook/bart-large-mnli"
+            self._hazard_label_embeddings = label_embeddings / np.linalg.norm(
+                label_embeddings, axis=1, keepdims=True
             )
             
             logger.info("NLP models loaded successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize NLP models: {e}")
+            logger.error("Failed to initialize NLP models: %s", e)
             raise
     
     async def _initialize_cv_models(self):
         """Initialize Computer Vision models (CLIP, YOLO, etc.)."""
         try:
-            # CLIP for image-text alignment
+            # CLIP for image-text alignment; clip.load keeps FP16 weights on GPU
             logger.info("Loading CLIP model...")
             device = "cuda" if torch.cuda.is_available() else "cpu"
             self.models['clip'], self.models['clip_preprocess'] = clip.load(
                 "ViT-B/32", device=device
             )
+            self.models['clip'].eval()
+            if device == "cpu":
+                self.models['clip'] = self._quantize_for_cpu("CLIP", self.models['clip'])
+            
+            # Compile the encoders CLIP's encode_image/encode_text run; their input shapes are fixed
+            clip_model = self.models['clip']
+            clip_model.visual = self._compile("CLIP image encoder", clip_model.visual)
+            clip_model.transformer = self._compile("CLIP text encoder", clip_model.transformer)
             
             # Object detection for hazard identification
             logger.info("Loading object detection model...")
@@ -128,46 +278,86 @@ class AIPipeline:
             logger.info("Computer Vision models loaded successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize CV models: {e}")
+            logger.error("Failed to initialize CV models: %s", e)
             raise
     
+    def _quantize_for_cpu(self, name: str, model: torch.nn.Module) -> torch.nn.Module:
+        """Swap a CPU model's linear layers for INT8 dynamically quantized ones, when enabled."""
+        if not self.settings.QUANTIZE_CPU_MODELS:
+            return model
+        engine = next(
+            (engine for engine in QUANTIZED_ENGINES if engine in torch.backends.quantized.supported_engines),
+            None
+        )
+        if engine is not None:
+            torch.backends.quantized.engine = engine
+        logger.info("Quantizing %s linear layers to INT8 (%s kernels)...", name, torch.backends.quantized.engine)
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    
+    def _compile(self, name: str, module: torch.nn.Module) -> torch.nn.Module:
+        """Wrap a module with torch.compile, when enabled."""
+        if not self.settings.COMPILE_MODELS:
+            return module
+        logger.info("Compiling %s...", name)
+        # CUDA graphs remove per-call launch overhead on GPU
+        mode = "reduce-overhead" if torch.cuda.is_available() else "default"
+        return torch.compile(module, mode=mode)
+    
     async def _initialize_clustering(self):
         """Initialize clustering algorithms for duplicate detection."""
         try:
-            self.clustering_model = DBSCAN(
-                eps=self.settings.CLUSTERING_EPS,
-                min_samples=self.settings.MIN_SAMPLES,
-                metric='cosine'
-            )
+            # Cosine-distance DBSCAN over the normalized embedding index rows
+            self.clustering_eps = self.settings.CLUSTERING_EPS
+            self.clustering_min_samples = self.settings.MIN_SAMPLES
             logger.info("Clustering initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize clustering: {e}")
+            logger.error("Failed to initialize clustering: %s", e)
             raise
     
+    async def cluster_reports(self) -> Dict[str, int]:
+        """Run DBSCAN over every stored report embedding; returns report ids mapped to cluster labels."""
+        ids = list(self.report_embeddings.ids)
+        labels = await self._run_inference(
+            _vectorized_dbscan, self.report_embeddings.matrix.copy(),
+            self.clustering_eps, self.clustering_min_samples
+        )
+        self.report_clusters = {
+            report_id: int(label) for report_id, label in zip(ids, labels) if label >= 0
+        }
+        return self.report_clusters
+    
+    async def _run_inference(self, func, *args):
+        """Run a blocking model call on the inference executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._inference_executor, partial(func, *args))
+    
     async def process_citizen_report(self, report: CitizenReport) -> Dict[str, Any]:
         """Process a citizen report through the AI pipeline."""
         if not self.is_initialized:
             raise RuntimeError("AI Pipeline not initialized")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            # Extract and process text features
-            text_features = await self._process_text(report.description, report.language)
-            
-            # Process images if available
-            image_features = {}
+            # Text features, plus image features if available; the two model stages are
+            # independent, so their executor calls overlap
             if report.images:
-                image_features = await self._process_images(report.images, report.description)
+                text_features, image_features = await asyncio.gather(
+                    self._process_text(report.description, report.language),
+                    self._process_images(report.images, report.description)
+                )
+            else:
+                text_features = await self._process_text(report.description, report.language)
+                image_features = {}
             
             # Detect duplicates
             duplicate_result = await self._detect_duplicates(report, text_features, image_features)
             
             # Perform hazard classification
-            hazard_classification = await self._classify_hazards(report.description)
+            hazard_classification = await self._classify_hazards(text_features['embedding'])
             
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             return {
                 'text_features': text_features,
@@ -178,33 +368,169 @@ class AIPipeline:
             }
             
         except Exception as e:
-            logger.error(f"Error processing citizen report: {e}")
+            logger.error("Error processing citizen report: %s", e)
             raise
     
-    async def _process_text(self, text: str, language: str = "en") -> Dict[str, Any]:
-        """Process text content using NLP models."""
+    async def process_citizen_report_batch(self, reports: List[CitizenReport]) -> List[Dict[str, Any]]:
+        """Process several citizen reports, running the text models once over the batch."""
+        if not self.is_initialized:
+            raise RuntimeError("AI Pipeline not initialized")
+        
         try:
-            # Language detection
-            lang_result = self.pipelines['language'](text)
-            detected_language = lang_result[0]['label']
-            lang_confidence = lang_result[0]['score']
-            
-            # Sentiment analysis
-            sentiment_result = self.pipelines['sentiment'](text)
-            sentiment_scores = {item['label']: item['score'] for item in sentiment_result[0]}
-            
-            # Generate text embeddings using mBERT
-            inputs = self.tokenizers['mbert'](
-                text, 
-                return_tensors="pt", 
-                truncation=True, 
-                padding=True,
-                max_length=512
+            descriptions = [report.description for report in reports]
+            
+            # Batched NLP passes over all descriptions, overlapping the batched vision
+            # pass over every image across the batch
+            text_features_batch, image_features_batch = await asyncio.gather(
+                self._process_text_batch(descriptions),
+                self._process_images_batch(reports)
             )
             
-            with torch.no_grad():
-                outputs = self.models['mbert'](**inputs)
-                text_embedding = outputs.last_hidden_state.mean(dim=1).squeeze().numpy()
+            # Hazards reuse the text embeddings
+            hazard_batch = await self._classify_hazards_batch(
+                [text_features['embedding'] for text_features in text_features_batch]
+            )
+            
+            batch_results = []
+            for report, text_features, hazard_classification, image_features in zip(
+                reports, text_features_batch, hazard_batch, image_features_batch
+            ):
+                start_ns = time.perf_counter_ns()
+                
+                # Duplicate detection stays sequential so each report sees the ones before it
+                duplicate_result = await self._detect_duplicates(report, text_features, image_features)
+                
+                batch_results.append({
+                    'text_features': text_features,
+                    'image_features': image_features,
+                    'duplicate_result': duplicate_result,
+                    'hazard_classification': hazard_classification,
+                    'processing_time': (time.perf_counter_ns() - start_ns) / 1e9
+                })
+            
+            return batch_results
+        
+        except Exception as e:
+            logger.error("Error processing citizen report batch: %s", e)
+            raise
+    
+    async def process_and_score(self, report: CitizenReport,
+                                social_media_posts: Optional[List[SocialMediaPost]] = None,
+                                as_dict: bool = False) -> Tuple[Dict[str, Any], Union[TrustScore, Dict[str, Any]]]:
+        """Process a citizen report and score it in one call; as_dict skips the TrustScore model."""
+        processing_results = await self.process_citizen_report(report)
+        if as_dict:
+            trust_score = await self.calculate_trust_score_dict(report, processing_results, social_media_posts)
+        else:
+            trust_score = await self.calculate_trust_score(report, processing_results, social_media_posts)
+        return processing_results, trust_score
+    
+    async def _process_text_batch(self, texts: List[str], languages: Union[str, List[str]] = "en",
+                                  texts_lower: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Process a batch of texts with one padded forward pass per model.
+        
+        Languages are detected per text, so `languages` is accepted only for parity
+        with the simplified pipeline.
+        """
+        try:
+            if not texts:
+                return []
+            if texts_lower is None:
+                texts_lower = [None] * len(texts)
+            
+            # Encode only texts not seen before, once each
+            keys = [feature_cache_key(text.encode()) for text in texts]
+            items = {key: self._text_cache.get(key) for key in dict.fromkeys(keys)}
+            missing = [key for key, item in items.items() if item is None]
+            if missing:
+                texts_by_key = dict(zip(keys, texts))
+                encoded = await self._encode_text_items([texts_by_key[key] for key in missing])
+                for key, item in zip(missing, encoded):
+                    items[key] = item
+                    self._text_cache.set(key, item)
+            
+            batch_features = []
+            for key, text, text_lower in zip(keys, texts, texts_lower):
+                lang_result, sentiment_result, text_embedding = items[key]
+                batch_features.append({
+                    'embedding': text_embedding,
+                    'detected_language': lang_result['label'],
+                    'language_confidence': lang_result['score'],
+                    'sentiment_scores': {item['label']: item['score'] for item in sentiment_result},
+                    'word_count': len(text.split()),
+                    'char_count': len(text),
+                    'has_urls': 'http' in (text_lower if text_lower is not None else text.lower()),
+                    'has_mentions': '@' in text,
+                    'has_hashtags': '#' in text
+                })
+            
+            return batch_features
+        
+        except Exception as e:
+            logger.error("Error processing text batch: %s", e)
+            raise
+    
+    def _detect_language(self, text: str) -> Dict[str, Any]:
+        """Most probable language of a text, shaped like a text-classification result."""
+        try:
+            best = detect_langs(text)[0]
+            return {'label': best.lang, 'score': best.prob}
+        except LangDetectException:
+            return {'label': 'unknown', 'score': 0.0}
+    
+    def _encode_texts(self, texts: List[str]) -> Tuple[List[Dict], List[List[Dict]], np.ndarray]:
+        """Language, sentiment and mBERT embeddings for a list of texts (blocking)."""
+        lang_results = [self._detect_language(text) for text in texts]
+        
+        # Sentiment accepts lists natively
+        sentiment_results = self.pipelines['sentiment'](texts)
+        
+        return lang_results, sentiment_results, self._embed_texts(texts)
+    
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Mean-pooled mBERT embeddings for a list of texts (blocking)."""
+        # Generate text embeddings using mBERT over a padded batch; BERT needs no token type ids
+        # for single-segment input, and NumPy output is wrapped without copying
+        encoding = self.tokenizers['mbert'](
+            texts,
+            return_tensors="np",
+            return_token_type_ids=False,
+            truncation=True,
+            padding=True,
+            pad_to_multiple_of=TEXT_PAD_MULTIPLE if self.settings.COMPILE_MODELS else None,
+            max_length=512
+        )
+        
+        device = next(self.models['mbert'].parameters()).device
+        inputs = {name: torch.from_numpy(array).to(device) for name, array in encoding.items()}
+        with torch.inference_mode():
+            outputs = self.models['mbert'](**inputs)
+            # Mean-pool over real tokens only, in FP32, so padding does not skew shorter texts
+            hidden_states = outputs.last_hidden_state.float()
+            mask = inputs['attention_mask'].unsqueeze(-1).to(hidden_states.dtype)
+            summed = (hidden_states * mask).sum(dim=1)
+            return (summed / mask.sum(dim=1).clamp(min=1)).cpu().numpy()
+    
+    async def _encode_text_items(self, texts: List[str]) -> List[Tuple[Dict, List[Dict], np.ndarray]]:
+        """Per-text (language, sentiment, embedding) results of one batched encode."""
+        lang_results, sentiment_results, text_embeddings = await self._run_inference(
+            self._encode_texts, texts
+        )
+        return list(zip(lang_results, sentiment_results, text_embeddings))
+    
+    async def _process_text(self, text: str, language: str = "en") -> Dict[str, Any]:
+        """Process text content using NLP models."""
+        try:
+            # Repeated texts reuse earlier outputs; new ones share a forward pass with concurrent reports
+            key = feature_cache_key(text.encode())
+            item = self._text_cache.get(key)
+            if item is None:
+                item = await self._text_batcher.submit(text)
+                self._text_cache.set(key, item)
+            lang_result, sentiment_result, text_embedding = item
+            detected_language = lang_result['label']
+            lang_confidence = lang_result['score']
+            sentiment_scores = {item['label']: item['score'] for item in sentiment_result}
             
             # Text quality metrics
             word_count = len(text.split())
@@ -226,7 +552,7 @@ class AIPipeline:
             }
             
         except Exception as e:
-            logger.error(f"Error processing text: {e}")
+            logger.error("Error processing text: %s", e)
             raise
     
     async def _process_images(self, images: List, description: str) -> Dict[str, Any]:
@@ -239,22 +565,18 @@ class AIPipeline:
                 'quality_scores': []
             }
             
-            for img_data in images:
-                # Decode base64 image
-                image_bytes = base64.b64decode(img_data.base64_data)
-                image = Image.open(io.BytesIO(image_bytes))
-                
-                # CLIP image-text alignment
-                clip_score = await self._calculate_clip_score(image, description)
-                image_features['clip_scores'].append(clip_score)
-                
-                # Object detection
-                objects = self.pipelines['object_detection'](image)
-                image_features['detected_objects'].append(objects)
-                
-                # Image quality assessment
-                quality_score = await self._assess_image_quality(image)
-                image_features['quality_scores'].append(quality_score)
+            if not images:
+                return image_features
+            
+            # Per-image features, then one CLIP text pass to score them against the description
+            features = await self._image_features(images)
+            clip_scores = await self._run_inference(
+                self._score_descriptions, np.stack([embedding for embedding, _, _ in features]),
+                [description], [0] * len(features)
+            )
+            image_features['clip_scores'] = [float(clip_score) for clip_score in clip_scores]
+            image_features['detected_objects'] = [objects for _, objects, _ in features]
+            image_features['quality_scores'] = [quality for _, _, quality in features]
             
             # Calculate average scores
             if image_features['clip_scores']:
@@ -264,55 +586,146 @@ class AIPipeline:
             return image_features
             
         except Exception as e:
-            logger.error(f"Error processing images: {e}")
+            logger.error("Error processing images: %s", e)
             raise
     
-    async def _calculate_clip_score(self, image: Image.Image, text: str) -> float:
-        """Calculate CLIP similarity between image and text."""
+    def _decode_image(self, base64_data: str) -> Image.Image:
+        """Decode a base64 image payload, letting JPEGs skip DCT scales above IMAGE_DECODE_SIZE."""
+        image = Image.open(io.BytesIO(base64.b64decode(base64_data)))
+        image.info['original_size'] = image.size
+        image.draft("RGB", IMAGE_DECODE_SIZE)
+        return image.convert("RGB")
+    
+    async def preprocess_images_batch(self, images: List[ImageData]) -> Tuple[List[Image.Image], torch.Tensor]:
+        """Decode images on worker threads and stack them into one CLIP input tensor."""
+        decoded = await asyncio.gather(
+            *(asyncio.to_thread(self._decode_image, img_data.base64_data) for img_data in images)
+        )
+        preprocess = self.models['clip_preprocess']
+        return list(decoded), torch.stack([preprocess(image) for image in decoded])
+    
+    async def _process_images_batch(self, reports: List[CitizenReport]) -> List[Dict[str, Any]]:
+        """Process the images of several reports with one batched pass per vision model."""
         try:
-            device = next(self.models['clip'].parameters()).device
+            # Flatten images across reports, remembering which report owns each one
+            images = []
+            owners = []
+            for index, report in enumerate(reports):
+                for img_data in report.images or []:
+                    images.append(img_data)
+                    owners.append(index)
+            
+            batch_features: List[Dict[str, Any]] = [{} for _ in reports]
+            if not images:
+                return batch_features
+            
+            features = await self._image_features(images)
+            
+            text_rows = {owner: row for row, owner in enumerate(dict.fromkeys(owners))}
+            descriptions = [reports[owner].description for owner in text_rows]
+            clip_scores = await self._run_inference(
+                self._score_descriptions, np.stack([embedding for embedding, _, _ in features]),
+                descriptions, [text_rows[owner] for owner in owners]
+            )
             
-            # Preprocess image
-            image_input = self.models['clip_preprocess'](image).unsqueeze(0).to(device)
+            for index in text_rows:
+                batch_features[index] = {
+                    'count': len(reports[index].images),
+                    'clip_scores': [],
+                    'detected_objects': [],
+                    'quality_scores': []
+                }
+            
+            for owner, clip_score, (_, objects, quality_score) in zip(owners, clip_scores, features):
+                image_features = batch_features[owner]
+                image_features['clip_scores'].append(float(clip_score))
+                image_features['detected_objects'].append(objects)
+                image_features['quality_scores'].append(quality_score)
             
-            # Tokenize text
-            text_input = clip.tokenize([text]).to(device)
+            # Calculate average scores
+            for image_features in batch_features:
+                if image_features.get('clip_scores'):
+                    image_features['avg_clip_score'] = np.mean(image_features['clip_scores'])
+                    image_features['avg_quality_score'] = np.mean(image_features['quality_scores'])
             
-            with torch.no_grad():
-                # Get features
-                image_features = self.models['clip'].encode_image(image_input)
-                text_features = self.models['clip'].encode_text(text_input)
-                
-                # Calculate similarity
-                similarity = torch.cosine_similarity(image_features, text_features)
-                
-            return float(similarity.cpu().numpy()[0])
+            return batch_features
             
         except Exception as e:
-            logger.error(f"Error calculating CLIP score: {e}")
-            return 0.0
+            logger.error("Error processing image batch: %s", e)
+            raise
+    
+    async def _image_features(self, images: List[ImageData]) -> List[Tuple[np.ndarray, List, float]]:
+        """CLIP embedding, detected objects and quality score per image, reusing results for repeated payloads."""
+        keys = [feature_cache_key(img_data.base64_data.encode()) for img_data in images]
+        features = {key: self._image_cache.get(key) for key in dict.fromkeys(keys)}
+        missing = [key for key, item in features.items() if item is None]
+        
+        if missing:
+            # Decode and run the vision models once per new payload
+            images_by_key = dict(zip(keys, images))
+            decoded, image_input = await self.preprocess_images_batch([images_by_key[key] for key in missing])
+            image_embeddings, detected_objects = await self._run_inference(
+                self._encode_images_batch, decoded, image_input
+            )
+            quality_scores = await self._assess_image_qualities(decoded)
+            for key, embedding, objects, quality_score in zip(missing, image_embeddings, detected_objects, quality_scores):
+                features[key] = (embedding, objects, quality_score)
+                self._image_cache.set(key, features[key])
+        
+        return [features[key] for key in keys]
+    
+    def _encode_images_batch(self, decoded: List[Image.Image], image_input: torch.Tensor) -> Tuple[np.ndarray, List]:
+        """Unit-normalized CLIP image embeddings plus object detection (blocking)."""
+        device = next(self.models['clip'].parameters()).device
+        with torch.inference_mode():
+            image_embeddings = self.models['clip'].encode_image(image_input.to(device)).float()
+            image_embeddings = torch.nn.functional.normalize(image_embeddings, dim=-1).cpu().numpy()
+        
+        # Object detection over the whole image list
+        return image_embeddings, self.pipelines['object_detection'](decoded, batch_size=len(decoded))
+    
+    def _score_descriptions(self, image_embeddings: np.ndarray, descriptions: List[str],
+                            rows: List[int]) -> np.ndarray:
+        """CLIP image-text alignment of each image against its own description row (blocking)."""
+        device = next(self.models['clip'].parameters()).device
+        text_input = clip.tokenize(descriptions, truncate=True).to(device)
+        with torch.inference_mode():
+            text_embeddings = self.models['clip'].encode_text(text_input).float()
+            text_embeddings = torch.nn.functional.normalize(text_embeddings, dim=-1).cpu().numpy()
+        return np.einsum('ij,ij->i', image_embeddings, text_embeddings[rows])
+    
+    async def _assess_image_qualities(self, images: List[Image.Image]) -> List[float]:
+        """Assess image quality on worker threads; OpenCV releases the GIL."""
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self._assess_image_quality, image) for image in images)
+        ))
     
-    async def _assess_image_quality(self, image: Image.Image) -> float:
+    def _assess_image_quality(self, image: Image.Image) -> float:
         """Assess image quality using computer vision techniques."""
         try:
-            # Convert to OpenCV format
-            opencv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+            pixels = np.asarray(image)
+            height, width = pixels.shape[:2]
+            original_width, original_height = image.info.get('original_size', (width, height))
             
-            # Calculate various quality metrics
+            # Measure on a bounded working copy; full-resolution photos only cost bandwidth
+            scale = QUALITY_WORKING_SIZE / max(height, width)
+            if scale < 1.0:
+                pixels = cv2.resize(pixels, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            gray = cv2.cvtColor(pixels, cv2.COLOR_RGB2GRAY)
             
-            # 1. Sharpness (Laplacian variance)
-            gray = cv2.cvtColor(opencv_image, cv2.COLOR_BGR2GRAY)
-            sharpness = cv2.Laplacian(gray, cv2.CV_64F).var()
+            # Calculate various quality metrics
             
-            # 2. Brightness
-            brightness = np.mean(gray)
+            # 1. Sharpness (Laplacian variance); 16-bit output is exact for 8-bit input
+            _, laplacian_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))
+            sharpness = float(laplacian_std[0, 0]) ** 2
             
-            # 3. Contrast
-            contrast = np.std(gray)
+            # 2. Brightness and 3. Contrast in one pass
+            mean, std = cv2.meanStdDev(gray)
+            brightness = float(mean[0, 0])
+            contrast = float(std[0, 0])
             
-            # 4. Resolution score
-            height, width = gray.shape
-            resolution_score = min(1.0, (height * width) / (1920 * 1080))
+            # 4. Resolution score from the original dimensions
+            resolution_score = min(1.0, (original_height * original_width) / (1920 * 1080))
             
             # Combine metrics into overall quality score
             # Normalize and weight the metrics
@@ -330,7 +743,7 @@ class AIPipeline:
             return max(0.0, min(1.0, quality_score))
             
         except Exception as e:
-            logger.error(f"Error assessing image quality: {e}")
+            logger.error("Error assessing image quality: %s", e)
             return 0.5  # Default quality score
     
     async def _detect_duplicates(self, report: CitizenReport, text_features: Dict, image_features: Dict) -> DuplicateDetectionResult:
@@ -339,30 +752,23 @@ class AIPipeline:
             # Create composite embedding for the report
             report_embedding = await self._create_report_embedding(report, text_features, image_features)
             
-            # Calculate similarity with existing reports
-            similarities = []
-            similar_report_ids = []
-            
-            for existing_id, existing_embedding in self.report_embeddings.items():
-                similarity = cosine_similarity(
-                    [report_embedding], [existing_embedding]
-                )[0][0]
-                
-                if similarity > self.settings.SIMILARITY_THRESHOLD:
-                    similarities.append(similarity)
-                    similar_report_ids.append(existing_id)
+            # Calculate similarity with all existing reports in one matrix-vector product
+            similarities = self.report_embeddings.cosine_similarities(report_embedding)
+            matches = np.flatnonzero(similarities > self.settings.SIMILARITY_THRESHOLD)
+            similar_report_ids = [self.report_embeddings.ids[i] for i in matches]
             
             # Determine if this is a duplicate
-            is_duplicate = len(similarities) > 0
-            max_similarity = max(similarities) if similarities else 0.0
+            is_duplicate = len(similar_report_ids) > 0
+            max_similarity = float(similarities[matches].max()) if is_duplicate else 0.0
             
             # Store embedding for future comparisons
-            self.report_embeddings[report.id] = report_embedding
+            self.report_embeddings.add(report.id, report_embedding)
             
             # Cluster assignment (simplified)
             cluster_id = None
             if is_duplicate:
-                cluster_id = f"cluster_{hashlib.md5(str(sorted(similar_report_ids)).encode()).hexdigest()[:8]}"
+                cluster_key = "|".join(sorted(similar_report_ids)).encode()
+                cluster_id = f"cluster_{hashlib.blake2b(cluster_key, digest_size=4).hexdigest()}"
             
             return DuplicateDetectionResult(
                 is_duplicate=is_duplicate,
@@ -373,7 +779,7 @@ class AIPipeline:
             )
             
         except Exception as e:
-            logger.error(f"Error detecting duplicates: {e}")
+            logger.error("Error detecting duplicates: %s", e)
             return DuplicateDetectionResult(
                 is_duplicate=False,
                 similarity_score=0.0,
@@ -385,82 +791,91 @@ class AIPipeline:
     async def _create_report_embedding(self, report: CitizenReport, text_features: Dict, image_features: Dict) -> np.ndarray:
         """Create a composite embedding for a report."""
         try:
-            # Text embedding
-            text_emb = text_features['embedding']
+            # One float32 buffer, the dtype the embedding index stores, filled slice by slice
+            text_dim = REPORT_TEXT_DIM
+            composite_embedding = np.zeros(text_dim + 2 + len(self._hazard_index) + 2, dtype=np.float32)
+            
+            # Text embedding, projected down and unit-normalized; cosine similarities are preserved up to a small error
+            text_emb = composite_embedding[:text_dim]
+            np.matmul(np.asarray(text_features['embedding'], dtype=np.float32), self._text_projection, out=text_emb)
+            text_emb /= np.linalg.norm(text_emb) + 1e-9
             
             # Location embedding (simple coordinate encoding)
-            location_emb = np.array([
-                report.location.latitude / 90.0,  # Normalize latitude
-                report.location.longitude / 180.0,  # Normalize longitude
-            ])
+            composite_embedding[text_dim] = report.location.latitude / 90.0  # Normalize latitude
+            composite_embedding[text_dim + 1] = report.location.longitude / 180.0  # Normalize longitude
             
             # Hazard type embedding (one-hot encoding)
-            hazard_types = list(HazardType)
-            hazard_emb = np.zeros(len(hazard_types))
-            if report.hazard_type in hazard_types:
-                hazard_emb[hazard_types.index(report.hazard_type)] = 1.0
+            hazard_offset = text_dim + 2
+            hazard_index = self._hazard_index.get(report.hazard_type)
+            if hazard_index is not None:
+                composite_embedding[hazard_offset + hazard_index] = 1.0
             
             # Image embedding (average CLIP score if available)
-            image_emb = np.array([
-                image_features.get('avg_clip_score', 0.0),
-                image_features.get('count', 0) / 10.0  # Normalize image count
-            ])
-            
-            # Concatenate all embeddings
-            composite_embedding = np.concatenate([
-                text_emb,
-                location_emb,
-                hazard_emb,
-                image_emb
-            ])
+            image_offset = hazard_offset + len(self._hazard_index)
+            composite_embedding[image_offset] = image_features.get('avg_clip_score', 0.0)
+            composite_embedding[image_offset + 1] = image_features.get('count', 0) / 10.0  # Normalize image count
             
             return composite_embedding
             
         except Exception as e:
-            logger.error(f"Error creating report embedding: {e}")
+            logger.error("Error creating report embedding: %s", e)
             # Return a zero embedding as fallback
-            return np.zeros(768 + 2 + len(list(HazardType)) + 2)
+            return np.zeros(REPORT_TEXT_DIM + 2 + len(self._hazard_index) + 2, dtype=np.float32)
+    
+    async def _classify_hazards(self, text_embedding: np.ndarray) -> Dict[str, Any]:
+        """Classify hazard types from a description's mBERT embedding."""
+        return (await self._classify_hazards_batch([text_embedding]))[0]
     
-    async def _classify_hazards(self, text: str) -> Dict[str, Any]:
-        """Classify hazard types from text description."""
+    async def _classify_hazards_batch(self, text_embeddings: List[np.ndarray]) -> List[Dict[str, Any]]:
+        """Classify hazard types by similarity between description and hazard label embeddings."""
         try:
-            # Define candidate hazard labels
-            candidate_labels = [hazard.value for hazard in HazardType]
-            
-            # Perform zero-shot classification
-            result = self.pipelines['hazard'](text, candidate_labels)
-            
-            # Format results
-            hazard_scores = {
-                label: score for label, score in 
-                zip(result['labels'], result['scores'])
-            }
-            
-            # Get top predicted hazard
-            top_hazard = result['labels'][0]
-            confidence = result['scores'][0]
-            
-            return {
-                'predicted_hazard': top_hazard,
-                'confidence': confidence,
-                'all_scores': hazard_scores
-            }
-            
+            if not text_embeddings:
+                return []
+            
+            embeddings = np.asarray(text_embeddings, dtype=np.float32)
+            norms = np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+            similarities = (embeddings / norms) @ self._hazard_label_embeddings.T
+            
+            # Softmax over labels
+            logits = similarities / HAZARD_LABEL_TEMPERATURE
+            scores = np.exp(logits - logits.max(axis=1, keepdims=True))
+            scores /= scores.sum(axis=1, keepdims=True)
+            
+            results = []
+            for row in scores:
+                order = np.argsort(row)[::-1]
+                results.append({
+                    'predicted_hazard': self._hazard_labels[order[0]],
+                    'confidence': float(row[order[0]]),
+                    'all_scores': {self._hazard_labels[i]: float(row[i]) for i in order}
+                })
+            return results
+        
         except Exception as e:
-            logger.error(f"Error classifying hazards: {e}")
-            return {
-                'predicted_hazard': HazardType.OTHER.value,
-                'confidence': 0.0,
-                'all_scores': {}
-            }
+            logger.error("Error classifying hazard batch: %s", e)
+            return [
+                {
+                    'predicted_hazard': HazardType.OTHER.value,
+                    'confidence': 0.0,
+                    'all_scores': {}
+                }
+                for _ in text_embeddings
+            ]
     
     async def calculate_trust_score(self, 
                                   report: CitizenReport, 
                                   processing_results: Dict[str, Any],
                                   social_media_posts: List[SocialMediaPost] = None) -> TrustScore:
         """Calculate comprehensive trust score for a report."""
+        return TrustScore(**await self.calculate_trust_score_dict(report, processing_results, social_media_posts))
+    
+    async def calculate_trust_score_dict(self,
+                                         report: CitizenReport,
+                                         processing_results: Dict[str, Any],
+                                         social_media_posts: List[SocialMediaPost] = None) -> Dict[str, Any]:
+        """Calculate a trust score as a JSON-ready dict with TrustScore's fields."""
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Extract features
             text_features = processing_results['text_features']
@@ -483,73 +898,56 @@ class AIPipeline:
                 report, social_media_posts or []
             )
             
-            # Calculate overall score (weighted average)
-            weights = {
-                'content_credibility': 0.3,
-                'source_reliability': 0.2,
-                'temporal_consistency': 0.15,
-                'spatial_consistency': 0.15,
-                'cross_verification': 0.2
-            }
-            
-            overall_score = (
-                weights['content_credibility'] * content_credibility +
-                weights['source_reliability'] * source_reliability +
-                weights['temporal_consistency'] * temporal_consistency +
-                weights['spatial_consistency'] * spatial_consistency +
-                weights['cross_verification'] * cross_verification
+            # Weighted average with the duplicate penalty, clamped to 0-1; plain floats for the compiled kernel
+            overall_score = scoring.trust_score(
+                float(content_credibility), float(source_reliability), float(temporal_consistency),
+                float(spatial_consistency), float(cross_verification), bool(duplicate_result.is_duplicate)
             )
             
-            # Apply penalties for duplicates
-            if duplicate_result.is_duplicate:
-                overall_score *= 0.7  # Reduce score for duplicates
-            
-            # Ensure score is within bounds
-            overall_score = max(0.0, min(1.0, overall_score))
-            
             # Calculate confidence
             confidence = await self._calculate_confidence(processing_results)
             
             # Identify potential issues
             warnings = await self._identify_warnings(processing_results, overall_score)
             
-            processing_time = time.time() - start_time
-            
-            return TrustScore(
-                overall_score=overall_score,
-                content_credibility=content_credibility,
-                source_reliability=source_reliability,
-                temporal_consistency=temporal_consistency,
-                spatial_consistency=spatial_consistency,
-                cross_verification=cross_verification,
-                confidence=confidence,
-                processing_time=processing_time,
-                model_version="v1.0.0",
-                factors={
-                    'language_confidence': text_features['language_confidence'],
-                    'image_quality': image_features.get('avg_quality_score', 0.0),
-                    'clip_alignment': image_features.get('avg_clip_score', 0.0),
-                    'hazard_confidence': hazard_classification['confidence']
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+            
+            # Plain floats so the dict serializes without a model round-trip
+            return {
+                'overall_score': float(overall_score),
+                'content_credibility': float(content_credibility),
+                'source_reliability': float(source_reliability),
+                'temporal_consistency': float(temporal_consistency),
+                'spatial_consistency': float(spatial_consistency),
+                'cross_verification': float(cross_verification),
+                'confidence': float(confidence),
+                'processing_time': processing_time,
+                'model_version': "v1.0.0",
+                'factors': {
+                    'language_confidence': float(text_features['language_confidence']),
+                    'image_quality': float(image_features.get('avg_quality_score', 0.0)),
+                    'clip_alignment': float(image_features.get('avg_clip_score', 0.0)),
+                    'hazard_confidence': float(hazard_classification['confidence'])
                 },
-                warnings=warnings
-            )
+                'warnings': warnings
+            }
             
         except Exception as e:
-            logger.error(f"Error calculating trust score: {e}")
+            logger.error("Error calculating trust score: %s", e)
             # Return default score
-            return TrustScore(
-                overall_score=self.settings.DEFAULT_TRUST_SCORE,
-                content_credibility=0.5,
-                source_reliability=0.5,
-                temporal_consistency=0.5,
-                spatial_consistency=0.5,
-                cross_verification=0.5,
-                confidence=0.5,
-                processing_time=0.0,
-                model_version="v1.0.0",
-                factors={},
-                warnings=["Error in processing"]
-            )
+            return {
+                'overall_score': self.settings.DEFAULT_TRUST_SCORE,
+                'content_credibility': 0.5,
+                'source_reliability': 0.5,
+                'temporal_consistency': 0.5,
+                'spatial_consistency': 0.5,
+                'cross_verification': 0.5,
+                'confidence': 0.5,
+                'processing_time': 0.0,
+                'model_version': "v1.0.0",
+                'factors': {},
+                'warnings': ["Error in processing"]
+            }
     
     async def _score_content_credibility(self, text_features: Dict, image_features: Dict, hazard_classification: Dict) -> float:
         """Score content credibility based on text and image analysis."""
@@ -683,16 +1081,22 @@ class AIPipeline:
     async def cleanup(self):
         """Cleanup resources."""
         try:
+            await self._text_batcher.stop()
+            
             # Clear model caches
             self.models.clear()
             self.tokenizers.clear()
             self.pipelines.clear()
             
             # Clear embeddings cache
-            self.report_embeddings.clear()
+            self.report_embeddings.close()
             self.report_clusters.clear()
+            self._text_cache.clear()
+            self._image_cache.clear()
+            
+            self._inference_executor.shutdown(wait=False, cancel_futures=True)
             
             logger.info("AI Pipeline cleanup completed")
             
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
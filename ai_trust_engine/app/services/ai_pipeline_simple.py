@@ -5,9 +5,14 @@ Works without heavy ML dependencies for basic demonstration
 
 import asyncio
 import logging
+import math
+import os
 import time
 import re
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union
 import numpy as np
 from datetime import datetime
 import hashlib
@@ -17,10 +22,41 @@ from app.models.schemas import (
     CitizenReport, SocialMediaPost, TrustScore, 
     DuplicateDetectionResult, HazardType
 )
+from app.services import scoring
+from app.services.embedding_index import EmbeddingIndex
+from app.services.result_cache import ResultCache, feature_cache_key
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Common ocean/hazard terms counted by the simplified bag-of-words embedding
+COMMON_TERMS = (
+    'wave', 'water', 'sea', 'ocean', 'beach', 'coast', 'shore',
+    'storm', 'wind', 'rain', 'debris', 'pollution', 'danger',
+    'emergency', 'safety', 'rescue', 'help', 'alert', 'warning'
+)
+
+# India coastal regions (simplified check) as (min_lat, max_lat, min_lon, max_lon) rows
+COASTAL_REGIONS = np.array([
+    (8, 25, 68, 88),   # Western and Eastern coasts
+    (6, 15, 75, 85),   # Southern India
+], dtype=np.float64)
+
+# Shared image features of reports without images; read-only, tuples serialize like the usual lists
+EMPTY_IMAGE_FEATURES: Dict[str, Any] = {
+    'count': 0,
+    'clip_scores': (),
+    'detected_objects': (),
+    'quality_scores': ()
+}
+
+
+@lru_cache(maxsize=65536)
+def _word_term_indices(word: str) -> Tuple[int, ...]:
+    """Indices of the common terms contained in a word, computed once per distinct word."""
+    word = word.lower()
+    return tuple(i for i, term in enumerate(COMMON_TERMS) if term in word)
+
 
 class SimplifiedAIPipeline:
     """Simplified AI processing pipeline for demonstration purposes."""
@@ -29,10 +65,22 @@ class SimplifiedAIPipeline:
         self.settings = get_settings()
         self.is_initialized = False
         
-        # Cache for duplicate detection
-        self.report_embeddings = {}
+        # Cache for duplicate detection; each pipeline persists its own embedding layout
+        self.report_embeddings = EmbeddingIndex(
+            path=(
+                os.path.join(self.settings.EMBEDDINGS_CACHE_DIR, "reports_simple")
+                if self.settings.PERSIST_REPORT_EMBEDDINGS else None
+            ),
+            max_size=self.settings.DUPLICATE_INDEX_SIZE
+        )
         self.report_clusters = {}
         
+        # Batches run on a worker thread, so the scan-then-add on the index must not interleave
+        self._duplicates_lock = threading.Lock()
+        
+        # Text features are deterministic, so repeated descriptions reuse them
+        self._text_cache = ResultCache(maxsize=self.settings.FEATURE_CACHE_SIZE, ttl=self.settings.CACHE_TTL)
+        
         # Simple keyword-based hazard detection
         self.hazard_keywords = {
             HazardType.TSUNAMI: ['tsunami', 'giant wave', 'wall of water', 'earthquake wave'],
@@ -45,6 +93,33 @@ class SimplifiedAIPipeline:
             HazardType.OTHER: ['hazard', 'danger', 'emergency', 'alert', 'warning']
         }
         
+        # Single precompiled scan for every keyword. The lookahead lets overlapping
+        # keywords ('current' inside 'rip current') all match, like per-keyword `in` checks;
+        # this relies on no keyword being a prefix of another.
+        all_keywords = sorted({k for keywords in self.hazard_keywords.values() for k in keywords}, key=len, reverse=True)
+        self._hazard_keyword_pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(keyword) for keyword in all_keywords) + '))'
+        )
+        
+        # (hazard type, score key, keyword count) per hazard, resolved once instead of per call
+        self._hazard_normalizers = tuple(
+            (hazard_type, hazard_type.value, len(keywords)) for hazard_type, keywords in self.hazard_keywords.items()
+        )
+        
+        # Hazard types per keyword, so scoring walks only the keywords that matched
+        self._keyword_hazards: Dict[str, List[HazardType]] = {}
+        for hazard_type, keywords in self.hazard_keywords.items():
+            for keyword in keywords:
+                self._keyword_hazards.setdefault(keyword, []).append(hazard_type)
+        
+        # Sentiment label per keyword, for one dict lookup per word
+        sentiment_keywords = {
+            'POSITIVE': ['good', 'safe', 'calm', 'clear', 'beautiful', 'peaceful'],
+            'NEGATIVE': ['danger', 'emergency', 'massive', 'huge', 'scary', 'terrible', 'bad', 'urgent'],
+            'NEUTRAL': ['report', 'observe', 'see', 'notice', 'location']
+        }
+        self._sentiment_labels = {word: label for label, words in sentiment_keywords.items() for word in words}
+        
     async def initialize(self):
         """Initialize the simplified pipeline."""
         try:
@@ -55,7 +130,7 @@ class SimplifiedAIPipeline:
             logger.info("Simplified AI Pipeline initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize Simplified AI Pipeline: {e}")
+            logger.error("Failed to initialize Simplified AI Pipeline: %s", e)
             raise
     
     async def process_citizen_report(self, report: CitizenReport) -> Dict[str, Any]:
@@ -63,22 +138,25 @@ class SimplifiedAIPipeline:
         if not self.is_initialized:
             raise RuntimeError("AI Pipeline not initialized")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
+            # Lowercased once for both the text features and hazard keywords
+            description_lower = report.description.lower()
+            
             # Extract and process text features
-            text_features = await self._process_text_simple(report.description, report.language)
+            text_features = self._process_text_simple(report.description, report.language, description_lower)
             
             # Process images if available (simplified)
-            image_features = await self._process_images_simple(report.images or [])
+            image_features = self._process_images_simple(report.images or [])
             
             # Detect duplicates
-            duplicate_result = await self._detect_duplicates_simple(report, text_features)
+            duplicate_result = self._detect_duplicates_simple(report, text_features)
             
             # Perform hazard classification
-            hazard_classification = await self._classify_hazards_simple(report.description)
+            hazard_classification = self._classify_hazards_simple(report.description, description_lower)
             
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             return {
                 'text_features': text_features,
@@ -89,50 +167,148 @@ class SimplifiedAIPipeline:
             }
             
         except Exception as e:
-            logger.error(f"Error processing citizen report: {e}")
+            logger.error("Error processing citizen report: %s", e)
             raise
     
-    async def _process_text_simple(self, text: str, language: str = "en") -> Dict[str, Any]:
-        """Simple text processing without heavy NLP models."""
+    async def process_citizen_report_batch(self, reports: List[CitizenReport]) -> List[Dict[str, Any]]:
+        """Process several citizen reports, sharing a single text-processing pass."""
+        if not self.is_initialized:
+            raise RuntimeError("AI Pipeline not initialized")
+        
         try:
-            # Basic text analysis
-            words = text.lower().split()
-            word_count = len(words)
-            char_count = len(text)
-            
-            # Simple language detection (based on character patterns)
-            detected_language = self._detect_language_simple(text)
-            lang_confidence = 0.9 if detected_language == language else 0.7
+            # Process all descriptions in one batch, lowercasing each once
+            descriptions_lower = [report.description.lower() for report in reports]
+            text_features_batch = await self._process_text_batch(
+                [report.description for report in reports],
+                [report.language for report in reports],
+                descriptions_lower
+            )
             
-            # Simple sentiment analysis (keyword-based)
-            sentiment_scores = self._analyze_sentiment_simple(text)
+            # The rest is CPU-only; run it off the event loop in one hop rather than per report
+            return await asyncio.to_thread(
+                self._process_reports_sync, reports, text_features_batch, descriptions_lower
+            )
+        
+        except Exception as e:
+            logger.error("Error processing citizen report batch: %s", e)
+            raise
+    
+    def _process_reports_sync(self, reports: List[CitizenReport], text_features_batch: List[Dict[str, Any]],
+                              descriptions_lower: List[str]) -> List[Dict[str, Any]]:
+        """Image, duplicate and hazard analysis for reports with precomputed text features."""
+        batch_results = []
+        for report, text_features, description_lower in zip(reports, text_features_batch, descriptions_lower):
+            start_ns = time.perf_counter_ns()
             
-            # Create simple text embedding (word frequency based)
-            text_embedding = self._create_text_embedding_simple(words)
+            # Process images if available (simplified)
+            image_features = self._process_images_simple(report.images or [])
             
-            # Text quality metrics
-            has_urls = 'http' in text.lower()
-            has_mentions = '@' in text
-            has_hashtags = '#' in text
+            # Duplicate detection stays sequential so each report sees the ones before it
+            duplicate_result = self._detect_duplicates_simple(report, text_features)
             
-            return {
-                'embedding': text_embedding,
-                'detected_language': detected_language,
-                'language_confidence': lang_confidence,
-                'sentiment_scores': sentiment_scores,
-                'word_count': word_count,
-                'char_count': char_count,
-                'has_urls': has_urls,
-                'has_mentions': has_mentions,
-                'has_hashtags': has_hashtags
-            }
+            # Perform hazard classification
+            hazard_classification = self._classify_hazards_simple(report.description, description_lower)
             
+            batch_results.append({
+                'text_features': text_features,
+                'image_features': image_features,
+                'duplicate_result': duplicate_result,
+                'hazard_classification': hazard_classification,
+                'processing_time': (time.perf_counter_ns() - start_ns) / 1e9
+            })
+        
+        return batch_results
+    
+    async def process_and_score(self, report: CitizenReport,
+                                social_media_posts: Optional[List[SocialMediaPost]] = None,
+                                as_dict: bool = False) -> Tuple[Dict[str, Any], Union[TrustScore, Dict[str, Any]]]:
+        """Process a citizen report and score it in one call; as_dict skips the TrustScore model."""
+        processing_results = await self.process_citizen_report(report)
+        if as_dict:
+            trust_score = await self.calculate_trust_score_dict(report, processing_results, social_media_posts)
+        else:
+            trust_score = await self.calculate_trust_score(report, processing_results, social_media_posts)
+        return processing_results, trust_score
+    
+    def _process_text_simple(self, text: str, language: str = "en", text_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Simple text processing without heavy NLP models."""
+        try:
+            return self._extract_text_features_simple(text, language, text_lower)
+        
+        except Exception as e:
+            logger.error("Error processing text: %s", e)
+            raise
+    
+    async def _process_text_batch(self, texts: List[str], languages: Union[str, List[str]] = "en",
+                                  texts_lower: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Process a batch of texts, returning features aligned with the input order."""
+        try:
+            if isinstance(languages, str):
+                languages = [languages] * len(texts)
+            if texts_lower is None:
+                texts_lower = [None] * len(texts)
+            
+            return [
+                self._extract_text_features_simple(text, language, text_lower)
+                for text, language, text_lower in zip(texts, languages, texts_lower)
+            ]
+        
         except Exception as e:
-            logger.error(f"Error processing text: {e}")
+            logger.error("Error processing text batch: %s", e)
             raise
     
-    async def _process_images_simple(self, images: List) -> Dict[str, Any]:
+    def _extract_text_features_simple(self, text: str, language: str,
+                                      text_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Extract keyword-based features for a single text, reusing them for repeated texts."""
+        key = feature_cache_key(text.encode())
+        features = self._text_cache.get(key)
+        if features is None:
+            features = self._compute_text_features_simple(text, text_lower)
+            self._text_cache.set(key, features)
+        
+        # Depends on the claimed language, so it is not cached
+        lang_confidence = 0.9 if features['detected_language'] == language else 0.7
+        return {**features, 'language_confidence': lang_confidence}
+    
+    def _compute_text_features_simple(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Language-independent keyword features of a text."""
+        # Basic text analysis; the lowercased text and its words are shared by every feature below
+        if text_lower is None:
+            text_lower = text.lower()
+        words = text_lower.split()
+        word_count = len(words)
+        char_count = len(text)
+        
+        # Simple language detection (based on character patterns)
+        detected_language = self._detect_language_simple(text)
+        
+        # Simple sentiment analysis (keyword-based)
+        sentiment_scores = self._analyze_sentiment_simple(words)
+        
+        # Create simple text embedding (word frequency based)
+        text_embedding = self._create_text_embedding_simple(words)
+        
+        # Text quality metrics
+        has_urls = 'http' in text_lower
+        has_mentions = '@' in text
+        has_hashtags = '#' in text
+        
+        return {
+            'embedding': text_embedding,
+            'detected_language': detected_language,
+            'sentiment_scores': sentiment_scores,
+            'word_count': word_count,
+            'char_count': char_count,
+            'has_urls': has_urls,
+            'has_mentions': has_mentions,
+            'has_hashtags': has_hashtags
+        }
+    
+    def _process_images_simple(self, images: List) -> Dict[str, Any]:
         """Simple image processing without heavy CV models."""
+        if not images:
+            return EMPTY_IMAGE_FEATURES
+        
         try:
             image_features = {
                 'count': len(images),
@@ -156,104 +332,77 @@ class SimplifiedAIPipeline:
             
             # Calculate average scores
             if image_features['clip_scores']:
-                image_features['avg_clip_score'] = np.mean(image_features['clip_scores'])
-                image_features['avg_quality_score'] = np.mean(image_features['quality_scores'])
+                image_features['avg_clip_score'] = float(np.mean(image_features['clip_scores']))
+                image_features['avg_quality_score'] = float(np.mean(image_features['quality_scores']))
             
             return image_features
             
         except Exception as e:
-            logger.error(f"Error processing images: {e}")
+            logger.error("Error processing images: %s", e)
             return {'count': 0, 'clip_scores': [], 'detected_objects': [], 'quality_scores': []}
     
     def _detect_language_simple(self, text: str) -> str:
         """Simple language detection based on character patterns."""
         # Very basic detection - can be improved
-        if any(ord(char) > 127 for char in text):
+        if not text.isascii():
             # Has non-ASCII characters, likely not English
             return "hi"  # Assume Hindi for simplicity
         return "en"
     
-    def _analyze_sentiment_simple(self, text: str) -> Dict[str, float]:
-        """Simple sentiment analysis using keyword matching."""
-        positive_words = ['good', 'safe', 'calm', 'clear', 'beautiful', 'peaceful']
-        negative_words = ['danger', 'emergency', 'massive', 'huge', 'scary', 'terrible', 'bad', 'urgent']
-        neutral_words = ['report', 'observe', 'see', 'notice', 'location']
-        
-        words = text.lower().split()
+    def _analyze_sentiment_simple(self, words: List[str]) -> Dict[str, float]:
+        """Simple sentiment analysis using keyword matching over lowercased words."""
+        labels = self._sentiment_labels
+        counts = Counter(labels[word] for word in words if word in labels)
         
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
-        neutral_count = sum(1 for word in words if word in neutral_words)
-        
-        total = max(1, positive_count + negative_count + neutral_count)
+        total = max(1, sum(counts.values()))
         
         return {
-            'POSITIVE': positive_count / total,
-            'NEGATIVE': negative_count / total,
-            'NEUTRAL': neutral_count / total
+            'POSITIVE': counts['POSITIVE'] / total,
+            'NEGATIVE': counts['NEGATIVE'] / total,
+            'NEUTRAL': counts['NEUTRAL'] / total
         }
     
     def _create_text_embedding_simple(self, words: List[str]) -> np.ndarray:
         """Create a simple text embedding based on word frequency."""
-        # Simple bag-of-words approach with common ocean/hazard terms
-        common_terms = [
-            'wave', 'water', 'sea', 'ocean', 'beach', 'coast', 'shore',
-            'storm', 'wind', 'rain', 'debris', 'pollution', 'danger',
-            'emergency', 'safety', 'rescue', 'help', 'alert', 'warning'
-        ]
-        
-        embedding = np.zeros(len(common_terms))
-        for i, term in enumerate(common_terms):
-            embedding[i] = sum(1 for word in words if term in word.lower())
-        
-        # Normalize
-        norm = np.linalg.norm(embedding)
+        # Simple bag-of-words approach with common ocean/hazard terms: each term counts the words containing it
+        term_indices = [i for word in words for i in _word_term_indices(word)]
+        embedding = np.bincount(term_indices, minlength=len(COMMON_TERMS)).astype(np.float32)
+        
+        # Normalize in place; np.linalg.norm's dispatch costs more than the math on 19 floats
+        norm = math.sqrt(float(np.dot(embedding, embedding)))
         if norm > 0:
-            embedding = embedding / norm
+            embedding *= 1.0 / norm
         
         return embedding
     
-    async def _detect_duplicates_simple(self, report: CitizenReport, text_features: Dict) -> DuplicateDetectionResult:
+    def _detect_duplicates_simple(self, report: CitizenReport, text_features: Dict) -> DuplicateDetectionResult:
         """Simple duplicate detection using text and location similarity."""
         try:
-            # Calculate similarity with existing reports
-            similarities = []
-            similar_report_ids = []
-            
             current_embedding = text_features['embedding']
             current_location = (report.location.latitude, report.location.longitude)
             
-            for existing_id, existing_data in self.report_embeddings.items():
-                existing_embedding = existing_data['embedding']
-                existing_location = existing_data['location']
+            with self._duplicates_lock:
+                # Score every existing report at once: cosine text similarity plus
+                # inverse-distance location similarity (1.0 degree is roughly 111 km)
+                text_sims = self.report_embeddings.cosine_similarities(current_embedding)
+                location_sims = np.maximum(0.0, 1.0 - self.report_embeddings.location_distances(current_location))
+                combined_sims = 0.7 * text_sims + 0.3 * location_sims
                 
-                # Text similarity (cosine similarity)
-                text_sim = np.dot(current_embedding, existing_embedding)
+                matches = np.flatnonzero(combined_sims > self.settings.SIMILARITY_THRESHOLD)
+                similar_report_ids = [self.report_embeddings.ids[i] for i in matches]
                 
-                # Location similarity (inverse distance)
-                location_sim = self._calculate_location_similarity(current_location, existing_location)
-                
-                # Combined similarity
-                combined_sim = 0.7 * text_sim + 0.3 * location_sim
-                
-                if combined_sim > self.settings.SIMILARITY_THRESHOLD:
-                    similarities.append(combined_sim)
-                    similar_report_ids.append(existing_id)
+                # Store embedding for future comparisons
+                self.report_embeddings.add(report.id, current_embedding, current_location)
             
             # Determine if this is a duplicate
-            is_duplicate = len(similarities) > 0
-            max_similarity = max(similarities) if similarities else 0.0
-            
-            # Store embedding for future comparisons
-            self.report_embeddings[report.id] = {
-                'embedding': current_embedding,
-                'location': current_location
-            }
+            is_duplicate = len(similar_report_ids) > 0
+            max_similarity = float(combined_sims[matches].max()) if is_duplicate else 0.0
             
             # Simple cluster assignment
             cluster_id = None
             if is_duplicate:
-                cluster_id = f"cluster_{hashlib.md5(str(sorted(similar_report_ids)).encode()).hexdigest()[:8]}"
+                cluster_key = "|".join(sorted(similar_report_ids)).encode()
+                cluster_id = f"cluster_{hashlib.blake2b(cluster_key, digest_size=4).hexdigest()}"
             
             return DuplicateDetectionResult(
                 is_duplicate=is_duplicate,
@@ -264,7 +413,7 @@ class SimplifiedAIPipeline:
             )
             
         except Exception as e:
-            logger.error(f"Error detecting duplicates: {e}")
+            logger.error("Error detecting duplicates: %s", e)
             return DuplicateDetectionResult(
                 is_duplicate=False,
                 similarity_score=0.0,
@@ -273,38 +422,21 @@ class SimplifiedAIPipeline:
                 confidence=0.5
             )
     
-    def _calculate_location_similarity(self, loc1: Tuple[float, float], loc2: Tuple[float, float]) -> float:
-        """Calculate location similarity based on distance."""
-        try:
-            # Simple distance calculation (Euclidean distance in degrees)
-            lat_diff = abs(loc1[0] - loc2[0])
-            lon_diff = abs(loc1[1] - loc2[1])
-            distance = (lat_diff**2 + lon_diff**2)**0.5
-            
-            # Convert to similarity (inverse of distance, normalized)
-            max_distance = 1.0  # Approximately 111 km at equator
-            similarity = max(0.0, 1.0 - (distance / max_distance))
-            
-            return similarity
-            
-        except Exception:
-            return 0.0
-    
-    async def _classify_hazards_simple(self, text: str) -> Dict[str, Any]:
-        """Simple hazard classification using keyword matching."""
+    def _classify_hazards_simple(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Simple hazard classification using keyword matching; pass text_lower when already computed."""
         try:
-            text_lower = text.lower()
+            if text_lower is None:
+                text_lower = text.lower()
+            matched_keywords = set(self._hazard_keyword_pattern.findall(text_lower))
+            counts = Counter(
+                hazard_type for keyword in matched_keywords for hazard_type in self._keyword_hazards[keyword]
+            )
             
-            # Score each hazard type
-            hazard_scores = {}
-            for hazard_type, keywords in self.hazard_keywords.items():
-                score = 0
-                for keyword in keywords:
-                    if keyword in text_lower:
-                        score += 1
-                
-                # Normalize by number of keywords
-                hazard_scores[hazard_type.value] = score / len(keywords)
+            # Score each hazard type, normalized by its number of keywords
+            hazard_scores = {
+                hazard_value: counts[hazard_type] / keyword_count
+                for hazard_type, hazard_value, keyword_count in self._hazard_normalizers
+            }
             
             # Find the best match
             if hazard_scores:
@@ -321,7 +453,7 @@ class SimplifiedAIPipeline:
             }
             
         except Exception as e:
-            logger.error(f"Error classifying hazards: {e}")
+            logger.error("Error classifying hazards: %s", e)
             return {
                 'predicted_hazard': HazardType.OTHER.value,
                 'confidence': 0.0,
@@ -333,8 +465,15 @@ class SimplifiedAIPipeline:
                                   processing_results: Dict[str, Any],
                                   social_media_posts: List[SocialMediaPost] = None) -> TrustScore:
         """Calculate trust score using simplified algorithms."""
+        return TrustScore(**await self.calculate_trust_score_dict(report, processing_results, social_media_posts))
+    
+    async def calculate_trust_score_dict(self,
+                                         report: CitizenReport,
+                                         processing_results: Dict[str, Any],
+                                         social_media_posts: List[SocialMediaPost] = None) -> Dict[str, Any]:
+        """Calculate a trust score as a JSON-ready dict with TrustScore's fields."""
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Extract features
             text_features = processing_results['text_features']
@@ -343,44 +482,26 @@ class SimplifiedAIPipeline:
             hazard_classification = processing_results['hazard_classification']
             
             # Component scores
-            content_credibility = await self._score_content_credibility_simple(
+            content_credibility = self._score_content_credibility_simple(
                 text_features, image_features, hazard_classification
             )
             
-            source_reliability = await self._score_source_reliability_simple(report)
+            source_reliability = self._score_source_reliability_simple(report)
             
             temporal_consistency = 0.75  # Mock score
             
-            spatial_consistency = await self._score_spatial_consistency_simple(report)
+            spatial_consistency = self._score_spatial_consistency_simple(report)
             
-            cross_verification = await self._score_cross_verification_simple(
+            cross_verification = self._score_cross_verification_simple(
                 report, social_media_posts or []
             )
             
-            # Calculate overall score (weighted average)
-            weights = {
-                'content_credibility': 0.3,
-                'source_reliability': 0.2,
-                'temporal_consistency': 0.15,
-                'spatial_consistency': 0.15,
-                'cross_verification': 0.2
-            }
-            
-            overall_score = (
-                weights['content_credibility'] * content_credibility +
-                weights['source_reliability'] * source_reliability +
-                weights['temporal_consistency'] * temporal_consistency +
-                weights['spatial_consistency'] * spatial_consistency +
-                weights['cross_verification'] * cross_verification
+            # Weighted average with the duplicate penalty, clamped to 0-1; plain floats for the compiled kernel
+            overall_score = scoring.trust_score(
+                float(content_credibility), float(source_reliability), float(temporal_consistency),
+                float(spatial_consistency), float(cross_verification), bool(duplicate_result.is_duplicate)
             )
             
-            # Apply penalties for duplicates
-            if duplicate_result.is_duplicate:
-                overall_score *= 0.7  # Reduce score for duplicates
-            
-            # Ensure score is within bounds
-            overall_score = max(0.0, min(1.0, overall_score))
-            
             # Calculate confidence
             confidence = 0.8  # Mock confidence
             
@@ -393,45 +514,46 @@ class SimplifiedAIPipeline:
             if image_features['count'] == 0:
                 warnings.append("No images provided")
             
-            processing_time = time.time() - start_time
-            
-            return TrustScore(
-                overall_score=overall_score,
-                content_credibility=content_credibility,
-                source_reliability=source_reliability,
-                temporal_consistency=temporal_consistency,
-                spatial_consistency=spatial_consistency,
-                cross_verification=cross_verification,
-                confidence=confidence,
-                processing_time=processing_time,
-                model_version="simplified-v1.0.0",
-                factors={
-                    'language_confidence': text_features['language_confidence'],
-                    'image_quality': image_features.get('avg_quality_score', 0.0),
-                    'clip_alignment': image_features.get('avg_clip_score', 0.0),
-                    'hazard_confidence': hazard_classification['confidence']
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+            
+            # Plain floats so the dict serializes without a model round-trip
+            return {
+                'overall_score': float(overall_score),
+                'content_credibility': float(content_credibility),
+                'source_reliability': float(source_reliability),
+                'temporal_consistency': float(temporal_consistency),
+                'spatial_consistency': float(spatial_consistency),
+                'cross_verification': float(cross_verification),
+                'confidence': float(confidence),
+                'processing_time': processing_time,
+                'model_version': "simplified-v1.0.0",
+                'factors': {
+                    'language_confidence': float(text_features['language_confidence']),
+                    'image_quality': float(image_features.get('avg_quality_score', 0.0)),
+                    'clip_alignment': float(image_features.get('avg_clip_score', 0.0)),
+                    'hazard_confidence': float(hazard_classification['confidence'])
                 },
-                warnings=warnings
-            )
+                'warnings': warnings
+            }
             
         except Exception as e:
-            logger.error(f"Error calculating trust score: {e}")
+            logger.error("Error calculating trust score: %s", e)
             # Return default score
-            return TrustScore(
-                overall_score=self.settings.DEFAULT_TRUST_SCORE,
-                content_credibility=0.5,
-                source_reliability=0.5,
-                temporal_consistency=0.5,
-                spatial_consistency=0.5,
-                cross_verification=0.5,
-                confidence=0.5,
-                processing_time=0.0,
-                model_version="simplified-v1.0.0",
-                factors={},
-                warnings=["Error in processing"]
-            )
+            return {
+                'overall_score': self.settings.DEFAULT_TRUST_SCORE,
+                'content_credibility': 0.5,
+                'source_reliability': 0.5,
+                'temporal_consistency': 0.5,
+                'spatial_consistency': 0.5,
+                'cross_verification': 0.5,
+                'confidence': 0.5,
+                'processing_time': 0.0,
+                'model_version': "simplified-v1.0.0",
+                'factors': {},
+                'warnings': ["Error in processing"]
+            }
     
-    async def _score_content_credibility_simple(self, text_features: Dict, image_features: Dict, hazard_classification: Dict) -> float:
+    def _score_content_credibility_simple(self, text_features: Dict, image_features: Dict, hazard_classification: Dict) -> float:
         """Simple content credibility scoring."""
         score = 0.0
         
@@ -464,7 +586,7 @@ class SimplifiedAIPipeline:
         
         return max(0.0, min(1.0, score))
     
-    async def _score_source_reliability_simple(self, report: CitizenReport) -> float:
+    def _score_source_reliability_simple(self, report: CitizenReport) -> float:
         """Simple source reliability scoring."""
         score = 0.5  # Base score
         
@@ -484,26 +606,21 @@ class SimplifiedAIPipeline:
         
         return max(0.0, min(1.0, score))
     
-    async def _score_spatial_consistency_simple(self, report: CitizenReport) -> float:
+    def _score_spatial_consistency_simple(self, report: CitizenReport) -> float:
         """Simple spatial consistency scoring."""
         # Basic check if coordinates are in ocean/coastal areas
         lat, lon = report.location.latitude, report.location.longitude
         
-        # India coastal regions (simplified check)
-        coastal_regions = [
-            (8, 25, 68, 88),   # Western and Eastern coasts
-            (6, 15, 75, 85),   # Southern India
-        ]
-        
-        is_coastal = False
-        for min_lat, max_lat, min_lon, max_lon in coastal_regions:
-            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
-                is_coastal = True
-                break
+        # One vectorized bounds test against every region
+        regions = COASTAL_REGIONS
+        is_coastal = bool((
+            (regions[:, 0] <= lat) & (lat <= regions[:, 1]) &
+            (regions[:, 2] <= lon) & (lon <= regions[:, 3])
+        ).any())
         
         return 0.8 if is_coastal else 0.5
     
-    async def _score_cross_verification_simple(self, report: CitizenReport, social_media_posts: List[SocialMediaPost]) -> float:
+    def _score_cross_verification_simple(self, report: CitizenReport, social_media_posts: List[SocialMediaPost]) -> float:
         """Simple cross-verification scoring."""
         if not social_media_posts:
             return 0.5  # Neutral score when no social media data
@@ -516,13 +633,14 @@ class SimplifiedAIPipeline:
         """Cleanup resources."""
         try:
             # Clear caches
-            self.report_embeddings.clear()
+            self.report_embeddings.close()
+            self._text_cache.clear()
             self.report_clusters.clear()
             
             logger.info("Simplified AI Pipeline cleanup completed")
             
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
 
 # Alias for backward compatibility
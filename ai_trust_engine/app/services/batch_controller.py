@@ -0,0 +1,89 @@
+"""
+Batch Controller for SeaSense AI Trust Engine
+Adaptive sub-batch sizing from observed pipeline batch latency
+"""
+
+import math
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from config.settings import get_settings
+
+T = TypeVar("T")
+
+
+class BatchController:
+    """Sizes sub-batches as sqrt(shared_overhead / per_item_cost), fitted from recent batch calls."""
+    
+    def __init__(self, max_size: int = 16, alpha: float = 0.2):
+        self.max_size = max(1, max_size)
+        self.alpha = alpha
+        
+        # Exponentially weighted moments of (batch size, elapsed seconds) for a running linear fit
+        self._moments: Optional[List[float]] = None
+        
+        # Seeded so the first bulk requests use mid-sized sub-batches
+        self.shared_overhead = (self.max_size / 2) ** 2
+        self.per_item_cost = 1.0
+        
+        self.inflight = 0
+        self._lock = threading.Lock()
+    
+    def batch_size(self) -> int:
+        """Current sub-batch size; saturates under backpressure to amortize shared overhead."""
+        with self._lock:
+            if self.inflight >= self.max_size:
+                return self.max_size
+            optimal = math.sqrt(self.shared_overhead / self.per_item_cost)
+            return max(1, min(self.max_size, int(round(optimal))))
+    
+    def _observe(self, size: int, elapsed: float):
+        """Fold one batch observation into the overhead and per-item estimates."""
+        sample = (size, elapsed, size * size, size * elapsed)
+        if self._moments is None:
+            self._moments = list(sample)
+        else:
+            self._moments = [m + self.alpha * (x - m) for m, x in zip(self._moments, sample)]
+        mean_n, mean_t, mean_nn, mean_nt = self._moments
+        
+        variance = mean_nn - mean_n ** 2
+        if variance > 1e-6:
+            per_item = (mean_nt - mean_n * mean_t) / variance
+            self.per_item_cost = max(per_item, 1e-9)
+            self.shared_overhead = max(mean_t - self.per_item_cost * mean_n, 1e-9)
+        else:
+            # Recent batches all had one size, so the split is unobservable; rescale the current estimates
+            scale = mean_t / (self.shared_overhead + self.per_item_cost * mean_n)
+            self.per_item_cost *= scale
+            self.shared_overhead *= scale
+    
+    async def run(self, func: Callable[[List[Any]], Awaitable[T]], items: List[Any]) -> T:
+        """Await func(items), recording its latency against the batch size."""
+        with self._lock:
+            self.inflight += len(items)
+        start_ns = time.perf_counter_ns()
+        try:
+            return await func(items)
+        finally:
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+            with self._lock:
+                self.inflight -= len(items)
+                self._observe(len(items), elapsed)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get the current sizing estimates."""
+        with self._lock:
+            return {
+                "inflight": self.inflight,
+                "max_size": self.max_size,
+                "shared_overhead": self.shared_overhead,
+                "per_item_cost": self.per_item_cost
+            }
+
+
+@lru_cache()
+def get_batch_controller() -> BatchController:
+    """Get the shared controller for bulk trust score sub-batches."""
+    return BatchController(max_size=get_settings().MAX_SUB_BATCH_SIZE)
@@ -0,0 +1,213 @@
+"""
+Embedding Index for SeaSense AI Trust Engine
+Contiguous store of normalized report embeddings for vectorized duplicate scans
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingIndex:
+    """Unit-normalized float32 embedding rows, grown geometrically, with optional float32 locations."""
+    
+    def __init__(self, initial_capacity: int = 256, path: Optional[str] = None,
+                 max_size: Optional[int] = None):
+        # Once max_size rows are held, the oldest half is dropped in one compaction
+        self.max_size = max(2, max_size) if max_size else None
+        self.initial_capacity = max(1, min(initial_capacity, self.max_size or initial_capacity))
+        
+        # With a path, rows live in memory-mapped .npy files beside an id list: the index
+        # survives restarts, can outgrow RAM through the page cache, and other processes can map the
+        # files read-only. Each path has a single writer.
+        self.path = path
+        self._reset()
+        if path is not None:
+            self._load()
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    @property
+    def matrix(self) -> np.ndarray:
+        """View of the stored unit-normalized rows, in insertion order."""
+        if self._matrix is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._matrix[:len(self.ids)]
+    
+    def _reset(self):
+        self.ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._locations: Optional[np.ndarray] = None
+        self._ids_file = None
+        # Set while rows mapped from disk have not yet been matched against a live embedding's size
+        self._unverified = False
+    
+    def _files(self) -> Tuple[str, str, str]:
+        return f"{self.path}.vectors.npy", f"{self.path}.locations.npy", f"{self.path}.ids"
+    
+    def _load(self):
+        """Map a previously persisted index, if there is one."""
+        vectors_file, locations_file, ids_file = self._files()
+        directory = os.path.dirname(vectors_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        if os.path.exists(vectors_file) and os.path.exists(locations_file) and os.path.exists(ids_file):
+            self._matrix = np.lib.format.open_memmap(vectors_file, mode="r+")
+            self._locations = np.lib.format.open_memmap(locations_file, mode="r+")
+            self._unverified = True
+            with open(ids_file, encoding="utf-8") as f:
+                ids = f.read().splitlines()
+            # Vectors are written before their id, so trailing rows without one are ignored
+            for item_id in ids[:self._matrix.shape[0]]:
+                if item_id not in self._rows:
+                    self._rows[item_id] = len(self.ids)
+                    self.ids.append(item_id)
+        else:
+            open(ids_file, "w", encoding="utf-8").close()
+        
+        self._ids_file = open(ids_file, "a", encoding="utf-8")
+        if self.max_size and len(self.ids) > self.max_size:
+            self._evict(len(self.ids) - self.max_size // 2)
+    
+    def _allocate(self, capacity: int, dim: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Zeroed vector and location arrays, copying over the current rows."""
+        if self.path is None:
+            matrix = np.zeros((capacity, dim), dtype=np.float32)
+            locations = np.zeros((capacity, 2), dtype=np.float32)
+        else:
+            # Fill new files under temporary names, then swap them in; existing maps stay valid
+            vectors_file, locations_file, _ = self._files()
+            matrix = np.lib.format.open_memmap(vectors_file + ".tmp", mode="w+", dtype=np.float32, shape=(capacity, dim))
+            locations = np.lib.format.open_memmap(locations_file + ".tmp", mode="w+", dtype=np.float32, shape=(capacity, 2))
+        
+        if self._matrix is not None:
+            matrix[:len(self.ids)] = self._matrix[:len(self.ids)]
+            locations[:len(self.ids)] = self._locations[:len(self.ids)]
+        
+        if self.path is not None:
+            matrix.flush()
+            locations.flush()
+            os.replace(vectors_file + ".tmp", vectors_file)
+            os.replace(locations_file + ".tmp", locations_file)
+        return matrix, locations
+    
+    def _grow(self, dim: int):
+        """Make room for one more row, doubling capacity when full and evicting at max_size."""
+        if self.max_size and len(self.ids) >= self.max_size:
+            self._evict(len(self.ids) - self.max_size // 2)
+        if self._matrix is None:
+            self._matrix, self._locations = self._allocate(self.initial_capacity, dim)
+        elif len(self.ids) == self._matrix.shape[0]:
+            capacity = 2 * self._matrix.shape[0]
+            if self.max_size:
+                capacity = min(capacity, self.max_size)
+            self._matrix, self._locations = self._allocate(capacity, dim)
+    
+    def _evict(self, count: int):
+        """Drop the count oldest rows, shifting the rest to the front in insertion order."""
+        size = len(self.ids)
+        self._matrix[:size - count] = self._matrix[count:size]
+        self._locations[:size - count] = self._locations[count:size]
+        self.ids = self.ids[count:]
+        self._rows = {item_id: row for row, item_id in enumerate(self.ids)}
+        
+        if self._ids_file is not None:
+            # Rewrite the id list to match the shifted rows
+            self.flush()
+            self._ids_file.close()
+            _, _, ids_file = self._files()
+            with open(ids_file + ".tmp", "w", encoding="utf-8") as f:
+                f.writelines(item_id + "\n" for item_id in self.ids)
+            os.replace(ids_file + ".tmp", ids_file)
+            self._ids_file = open(ids_file, "a", encoding="utf-8")
+    
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        """L2-normalize an embedding; zero vectors stay zero."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+    
+    def _check_dim(self, dim: int):
+        """Ensure embeddings of this size fit the stored rows.
+        
+        A persisted index written with another size (a different pipeline or embedding layout) is
+        stale and is discarded; any other mismatch is a caller error.
+        """
+        if self._matrix is None or self._matrix.shape[1] == dim:
+            self._unverified = False
+            return
+        if self._unverified:
+            logger.warning("Persisted embedding index %s stores %d-dim vectors, not %d; discarding it",
+                           self.path, self._matrix.shape[1], dim)
+            self.clear()
+            return
+        raise ValueError(f"Embedding has {dim} dimensions but the index stores {self._matrix.shape[1]}")
+    
+    def add(self, item_id: str, embedding: np.ndarray,
+            location: Optional[Tuple[float, float]] = None):
+        """Insert or replace the embedding (and optional lat/lon) stored for an id."""
+        vector = self._normalize(embedding)
+        self._check_dim(vector.shape[0])
+        row = self._rows.get(item_id)
+        is_new = row is None
+        if is_new:
+            self._grow(vector.shape[0])
+            row = len(self.ids)
+        self._matrix[row] = vector
+        self._locations[row] = location if location is not None else (0.0, 0.0)
+        
+        if is_new:
+            self._rows[item_id] = row
+            self.ids.append(item_id)
+            if self._ids_file is not None:
+                self._ids_file.write(item_id + "\n")
+                self._ids_file.flush()
+    
+    def cosine_similarities(self, embedding: np.ndarray) -> np.ndarray:
+        """Cosine similarity of the query against every stored row, in insertion order."""
+        if not self.ids:
+            return np.zeros(0, dtype=np.float32)
+        vector = self._normalize(embedding)
+        self._check_dim(vector.shape[0])
+        if not self.ids:
+            return np.zeros(0, dtype=np.float32)
+        similarities = self._matrix[:len(self.ids)] @ vector
+        # float32 rounding can push identical rows just past 1.0
+        return np.clip(similarities, -1.0, 1.0, out=similarities)
+    
+    def location_distances(self, location: Tuple[float, float]) -> np.ndarray:
+        """Euclidean distance in degrees from a lat/lon to every stored location."""
+        if not self.ids:
+            return np.zeros(0, dtype=np.float32)
+        offsets = self._locations[:len(self.ids)] - np.asarray(location, dtype=np.float32)
+        return np.hypot(offsets[:, 0], offsets[:, 1])
+    
+    def flush(self):
+        """Write memory-mapped rows back to disk."""
+        if isinstance(self._matrix, np.memmap):
+            self._matrix.flush()
+            self._locations.flush()
+    
+    def close(self):
+        """Flush and release the index; a persisted index is reloaded by the next instance."""
+        self.flush()
+        if self._ids_file is not None:
+            self._ids_file.close()
+        self._reset()
+    
+    def clear(self):
+        """Drop all stored embeddings, including any persisted files."""
+        self.close()
+        if self.path is not None:
+            for file in self._files():
+                if os.path.exists(file):
+                    os.remove(file)
+            self._load()
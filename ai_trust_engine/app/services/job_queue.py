@@ -0,0 +1,74 @@
+"""
+Job Queue for SeaSense AI Trust Engine
+In-process asyncio queue drained by a fixed pool of background workers
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue:
+    """Bounded queue of background processing jobs with persistent worker tasks."""
+    
+    def __init__(self, num_workers: int = 4, maxsize: int = 100):
+        self.num_workers = max(1, num_workers)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._workers: List[asyncio.Task] = []
+        self.completed = 0
+        self.failed = 0
+        self.running = 0
+    
+    async def start(self):
+        """Launch the worker tasks."""
+        for worker_id in range(self.num_workers):
+            self._workers.append(asyncio.create_task(self._worker(worker_id)))
+        logger.info("Job queue started with %d workers", self.num_workers)
+    
+    def submit(self, func: Callable[..., Awaitable[Any]], *args: Any):
+        """Enqueue a coroutine function call. Raises asyncio.QueueFull when at capacity."""
+        self._queue.put_nowait((func, args))
+    
+    async def _worker(self, worker_id: int):
+        """Pull jobs off the queue and run them until cancelled."""
+        while True:
+            func, args = await self._queue.get()
+            self.running += 1
+            try:
+                await func(*args)
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error("Job %s failed in worker %s: %s", func.__name__, worker_id, e)
+            finally:
+                self.running -= 1
+                self._queue.task_done()
+    
+    async def stop(self, timeout: float = 30.0):
+        """Let the workers finish queued jobs for up to timeout seconds, then cancel them."""
+        # These jobs were already acknowledged to clients, so drain before cancelling
+        if self._workers:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Job queue did not drain within %.1fs; dropping %d queued and %d running jobs",
+                               timeout, self._queue.qsize(), self.running)
+        
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Job queue stopped")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get queue depth and job counters."""
+        return {
+            "workers": len(self._workers),
+            "pending": self._queue.qsize(),
+            "running": self.running,
+            "maxsize": self._queue.maxsize,
+            "completed": self.completed,
+            "failed": self.failed
+        }
@@ -0,0 +1,302 @@
+"""
+Result Cache for SeaSense AI Trust Engine
+Thread-safe LRU + TTL cache for content-level AI analysis results
+"""
+
+import hashlib
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from cachetools import TTLCache
+
+from app.models.schemas import CitizenReport, ImageData
+from config.settings import get_settings
+
+
+class ResultCache:
+    """LRU cache with per-entry TTL, guarded by a lock and tracking hit rate."""
+    
+    def __init__(self, maxsize: int, ttl: int):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+    
+    def set(self, key: str, value: Any):
+        """Store a value under key."""
+        with self._lock:
+            self._cache[key] = value
+    
+    def clear(self):
+        """Drop all cached entries and reset counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+                "ttl": self._cache.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+class SemanticCache:
+    """Similarity cache over text embeddings for near-duplicate content."""
+    
+    def __init__(self, capacity: int, threshold: float, ttl: int):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl = ttl
+        self._embeddings: Optional[np.ndarray] = None
+        self._values: List[Any] = [None] * capacity
+        self._stored_at = np.zeros(capacity)
+        self._next = 0
+        self._count = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> Optional[np.ndarray]:
+        """Unit-normalize an embedding; zero vectors carry no signal and are not cached."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+    
+    def get(self, embedding: np.ndarray) -> Optional[Any]:
+        """Return the value stored for the most similar live embedding above the threshold."""
+        vector = self._normalize(embedding)
+        with self._lock:
+            if vector is None or self._count == 0 or vector.shape[0] != self._embeddings.shape[1]:
+                self.misses += 1
+                return None
+            
+            # Brute-force cosine similarity; expired entries can never match
+            similarities = self._embeddings[:self._count] @ vector
+            similarities[self._stored_at[:self._count] < time.monotonic() - self.ttl] = -1.0
+            best = int(np.argmax(similarities))
+            
+            if similarities[best] >= self.threshold:
+                self.hits += 1
+                return self._values[best]
+            
+            self.misses += 1
+            return None
+    
+    def set(self, embedding: np.ndarray, value: Any):
+        """Store a value, overwriting the oldest entry once capacity is reached."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        
+        with self._lock:
+            if self._embeddings is None or vector.shape[0] != self._embeddings.shape[1]:
+                self._embeddings = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+                self._count = 0
+                self._next = 0
+            
+            self._embeddings[self._next] = vector
+            self._values[self._next] = value
+            self._stored_at[self._next] = time.monotonic()
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": self._count,
+                "maxsize": self.capacity,
+                "ttl": self.ttl,
+                "threshold": self.threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash over word 3-shingles; near-identical texts differ in few bits."""
+    words = text.lower().split()
+    if len(words) >= 3:
+        shingles = [" ".join(words[i:i + 3]) for i in range(len(words) - 2)]
+    else:
+        shingles = words or [text]
+    
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'little') for shingle in shingles],
+        dtype=np.uint64
+    )
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+    
+    # Each bit is set when the majority of shingle hashes have it set
+    votes = 2 * bits.sum(axis=0, dtype=np.int64) - len(shingles)
+    return int(np.packbits(votes > 0, bitorder='little').view('<u8')[0])
+
+
+class SimHashIndex:
+    """Near-duplicate cache keyed by SimHash, banded so lookups touch only a few candidates."""
+    
+    BANDS = 4
+    BAND_BITS = 16
+    
+    def __init__(self, maxsize: int, ttl: int, max_distance: int = 3):
+        # With 4 bands, any fingerprint within 3 bits shares at least one whole band
+        self.max_distance = min(max_distance, self.BANDS - 1)
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._bands: List[Dict[int, set]] = [{} for _ in range(self.BANDS)]
+        self._band_size = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+    
+    def _band_keys(self, fingerprint: int) -> List[int]:
+        mask = (1 << self.BAND_BITS) - 1
+        return [(fingerprint >> (band * self.BAND_BITS)) & mask for band in range(self.BANDS)]
+    
+    def get(self, fingerprint: int) -> Optional[Any]:
+        """Return the value of a live entry within max_distance bits of fingerprint."""
+        with self._lock:
+            for band, key in enumerate(self._band_keys(fingerprint)):
+                for candidate in self._bands[band].get(key, ()):
+                    if bin(candidate ^ fingerprint).count('1') > self.max_distance:
+                        continue
+                    value = self._entries.get(candidate)
+                    if value is not None:
+                        self.hits += 1
+                        return value
+            self.misses += 1
+            return None
+    
+    def set(self, fingerprint: int, value: Any):
+        """Store a value under fingerprint."""
+        with self._lock:
+            if fingerprint not in self._entries:
+                for band, key in enumerate(self._band_keys(fingerprint)):
+                    self._bands[band].setdefault(key, set()).add(fingerprint)
+                self._band_size += 1
+            self._entries[fingerprint] = value
+            
+            # Expired and evicted fingerprints linger in the bands; rebuild once they dominate
+            if self._band_size > 2 * self._entries.maxsize:
+                self._rebuild_bands()
+    
+    def _rebuild_bands(self):
+        self._bands = [{} for _ in range(self.BANDS)]
+        fingerprints = list(self._entries.keys())
+        for fingerprint in fingerprints:
+            for band, key in enumerate(self._band_keys(fingerprint)):
+                self._bands[band].setdefault(key, set()).add(fingerprint)
+        self._band_size = len(fingerprints)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self._entries.maxsize,
+                "ttl": self._entries.ttl,
+                "max_distance": self.max_distance,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+def _hash_images(images: Optional[List[ImageData]]) -> str:
+    """Digest image payloads so reports with different media never share an entry."""
+    digest = hashlib.sha256()
+    for image in images or []:
+        digest.update(image.base64_data.encode())
+        digest.update(b"|")
+    return digest.hexdigest()
+
+
+def report_cache_key(report: CitizenReport) -> str:
+    """Cache key for a citizen report's content analysis."""
+    hazard_type = getattr(report.hazard_type, 'value', report.hazard_type)
+    content = (
+        f"{report.description}|{hazard_type}|{report.language}|"
+        f"{round(report.location.latitude, 3)},{round(report.location.longitude, 3)}|"
+        f"{_hash_images(report.images)}"
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def feature_cache_key(content: bytes) -> str:
+    """Cache key for model features of one text or image payload."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def social_cache_key(text: str, images: Optional[List[ImageData]] = None) -> str:
+    """Cache key for a social media post's content analysis."""
+    content = f"{text}|{_hash_images(images)}"
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+@lru_cache()
+def get_report_cache() -> ResultCache:
+    """Get the shared citizen report analysis cache."""
+    settings = get_settings()
+    return ResultCache(maxsize=settings.RESULT_CACHE_SIZE, ttl=settings.RESULT_CACHE_TTL)
+
+
+@lru_cache()
+def get_social_cache() -> ResultCache:
+    """Get the shared social media analysis cache."""
+    settings = get_settings()
+    return ResultCache(maxsize=settings.RESULT_CACHE_SIZE, ttl=settings.RESULT_CACHE_TTL)
+
+
+@lru_cache()
+def get_semantic_cache() -> SemanticCache:
+    """Get the shared social media semantic cache."""
+    settings = get_settings()
+    return SemanticCache(
+        capacity=settings.SEMANTIC_CACHE_SIZE,
+        threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+        ttl=settings.RESULT_CACHE_TTL
+    )
+
+
+@lru_cache()
+def get_near_duplicate_cache() -> SimHashIndex:
+    """Get the shared social media near-duplicate cache."""
+    settings = get_settings()
+    return SimHashIndex(
+        maxsize=settings.RESULT_CACHE_SIZE,
+        ttl=settings.RESULT_CACHE_TTL,
+        max_distance=settings.NEAR_DUPLICATE_MAX_DISTANCE
+    )
+
+
+@lru_cache()
+def get_trust_score_cache() -> ResultCache:
+    """Get the shared cache of last computed trust scores, keyed by report id."""
+    settings = get_settings()
+    return ResultCache(maxsize=settings.TRUST_SCORE_CACHE_SIZE, ttl=settings.TRUST_SCORE_CACHE_TTL)
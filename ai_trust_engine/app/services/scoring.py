@@ -0,0 +1,166 @@
+"""
+Scoring Helpers for SeaSense AI Trust Engine
+Typed numeric kernels behind engagement, credibility and priority scoring
+
+NumPy batch variants share the constants of the scalar kernels. The scalar
+kernels work on plain ints, floats and bools only, so the module can be
+compiled in place for hot batch paths; the .py source remains the fallback import:
+
+    mypyc app/services/scoring.py
+"""
+
+from typing import Final
+
+import numpy as np
+
+PRIORITY_LOW: Final = "low"
+PRIORITY_MEDIUM: Final = "medium"
+PRIORITY_HIGH: Final = "high"
+PRIORITY_CRITICAL: Final = "critical"
+
+# Component weights of the overall trust score, and the multiplier applied to duplicates
+WEIGHT_CONTENT_CREDIBILITY: Final = 0.3
+WEIGHT_SOURCE_RELIABILITY: Final = 0.2
+WEIGHT_TEMPORAL_CONSISTENCY: Final = 0.15
+WEIGHT_SPATIAL_CONSISTENCY: Final = 0.15
+WEIGHT_CROSS_VERIFICATION: Final = 0.2
+DUPLICATE_PENALTY: Final = 0.7
+
+# Engagement rate multiplier, and the absolute engagement that scores 1.0 when followers are unknown
+ENGAGEMENT_RATE_SCALE: Final = 100
+ENGAGEMENT_ABSOLUTE_SCALE: Final = 1000.0
+
+# Social credibility component weights and normalizers
+CREDIBILITY_WEIGHT_VERIFIED: Final = 0.3
+CREDIBILITY_WEIGHT_FOLLOWERS: Final = 0.2
+CREDIBILITY_WEIGHT_LANGUAGE: Final = 0.2
+CREDIBILITY_WEIGHT_LENGTH: Final = 0.2
+CREDIBILITY_WEIGHT_LOCATION: Final = 0.1
+CREDIBILITY_FOLLOWER_SCALE: Final = 10000
+
+# Word counts scoring full length credit, and the decay beyond the upper bound
+MIN_FULL_LENGTH_WORDS: Final = 10
+MAX_FULL_LENGTH_WORDS: Final = 100
+LONG_TEXT_DECAY_WORDS: Final = 200.0
+MIN_LONG_TEXT_SCORE: Final = 0.5
+
+
+def engagement_score(likes: int, shares: int, comments: int, followers: int) -> float:
+    """Engagement score on a 0-1 scale from interaction counts."""
+    total_engagement: int = likes + shares + comments
+    
+    # Normalize based on follower count
+    if followers > 0:
+        engagement_rate: float = total_engagement / followers
+        # Cap at 1.0 and normalize to 0-1 scale
+        return min(1.0, engagement_rate * ENGAGEMENT_RATE_SCALE)
+    
+    # Fallback to absolute engagement
+    return min(1.0, total_engagement / ENGAGEMENT_ABSOLUTE_SCALE)
+
+
+def engagement_scores(total_engagement: np.ndarray, followers: np.ndarray) -> np.ndarray:
+    """Vectorized engagement_score over total interaction and follower counts."""
+    total_engagement = np.asarray(total_engagement, dtype=np.float64)
+    followers = np.asarray(followers, dtype=np.float64)
+    
+    # Engagement rate where follower count is known, absolute engagement otherwise
+    has_followers = followers > 0
+    engagement_rate = np.divide(total_engagement, followers, out=np.zeros_like(total_engagement), where=has_followers)
+    scores = np.where(
+        has_followers,
+        engagement_rate * ENGAGEMENT_RATE_SCALE,
+        total_engagement / ENGAGEMENT_ABSOLUTE_SCALE
+    )
+    return np.minimum(1.0, scores)
+
+
+def social_credibility(verified: bool, followers: int, language_confidence: float,
+                       word_count: int, has_location: bool) -> float:
+    """Credibility score on a 0-1 scale from author and content signals."""
+    score: float = 0.0
+    
+    # Author verification
+    if verified:
+        score += CREDIBILITY_WEIGHT_VERIFIED
+    
+    # Follower count (normalized)
+    if followers:
+        score += CREDIBILITY_WEIGHT_FOLLOWERS * min(1.0, followers / CREDIBILITY_FOLLOWER_SCALE)
+    
+    # Text quality
+    score += CREDIBILITY_WEIGHT_LANGUAGE * language_confidence
+    
+    # Content length (not too short, not too long)
+    length_score: float
+    if MIN_FULL_LENGTH_WORDS <= word_count <= MAX_FULL_LENGTH_WORDS:
+        length_score = 1.0
+    elif word_count < MIN_FULL_LENGTH_WORDS:
+        length_score = word_count / float(MIN_FULL_LENGTH_WORDS)
+    else:
+        length_score = max(MIN_LONG_TEXT_SCORE, 1.0 - (word_count - MAX_FULL_LENGTH_WORDS) / LONG_TEXT_DECAY_WORDS)
+    score += CREDIBILITY_WEIGHT_LENGTH * length_score
+    
+    # Has location data
+    if has_location:
+        score += CREDIBILITY_WEIGHT_LOCATION
+    
+    return max(0.0, min(1.0, score))
+
+
+def social_credibilities(verified: np.ndarray, followers: np.ndarray, language_confidence: np.ndarray,
+                         word_count: np.ndarray, has_location: np.ndarray) -> np.ndarray:
+    """Vectorized social_credibility over per-post signal arrays."""
+    followers = np.asarray(followers, dtype=np.float64)
+    word_count = np.asarray(word_count, dtype=np.float64)
+    
+    score = np.where(verified, CREDIBILITY_WEIGHT_VERIFIED, 0.0)
+    score += CREDIBILITY_WEIGHT_FOLLOWERS * np.minimum(1.0, followers / CREDIBILITY_FOLLOWER_SCALE)
+    score += CREDIBILITY_WEIGHT_LANGUAGE * np.asarray(language_confidence, dtype=np.float64)
+    
+    # Content length (not too short, not too long)
+    length_score = np.where(
+        (word_count >= MIN_FULL_LENGTH_WORDS) & (word_count <= MAX_FULL_LENGTH_WORDS),
+        1.0,
+        np.where(
+            word_count < MIN_FULL_LENGTH_WORDS,
+            word_count / MIN_FULL_LENGTH_WORDS,
+            np.maximum(MIN_LONG_TEXT_SCORE, 1.0 - (word_count - MAX_FULL_LENGTH_WORDS) / LONG_TEXT_DECAY_WORDS)
+        )
+    )
+    score += CREDIBILITY_WEIGHT_LENGTH * length_score
+    score += np.where(has_location, CREDIBILITY_WEIGHT_LOCATION, 0.0)
+    
+    return np.clip(score, 0.0, 1.0)
+
+
+def trust_score(content_credibility: float, source_reliability: float, temporal_consistency: float,
+                spatial_consistency: float, cross_verification: float, is_duplicate: bool) -> float:
+    """Overall trust score on a 0-1 scale: weighted component average with a duplicate penalty."""
+    score: float = (
+        WEIGHT_CONTENT_CREDIBILITY * content_credibility +
+        WEIGHT_SOURCE_RELIABILITY * source_reliability +
+        WEIGHT_TEMPORAL_CONSISTENCY * temporal_consistency +
+        WEIGHT_SPATIAL_CONSISTENCY * spatial_consistency +
+        WEIGHT_CROSS_VERIFICATION * cross_verification
+    )
+    
+    # Reduce score for duplicates
+    if is_duplicate:
+        score *= DUPLICATE_PENALTY
+    
+    return max(0.0, min(1.0, score))
+
+
+def priority_level(overall_score: float, critical_hazard: bool) -> str:
+    """Priority value for a trust score and whether its hazard type is high-risk."""
+    # Most reports score low or medium; settle those before the hazard check
+    if overall_score <= 0.5:
+        return PRIORITY_LOW
+    if overall_score <= 0.7:
+        return PRIORITY_MEDIUM
+    if critical_hazard:
+        return PRIORITY_CRITICAL
+    if overall_score > 0.8:
+        return PRIORITY_HIGH
+    return PRIORITY_MEDIUM
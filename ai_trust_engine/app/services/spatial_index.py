@@ -0,0 +1,157 @@
+"""
+Spatial Index for SeaSense AI Trust Engine
+Grid-cell index over geolocated reports and posts for radius queries
+"""
+
+import math
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.utils.helpers import EARTH_RADIUS_KM, haversine_distances
+from config.settings import get_settings
+
+
+def _to_epoch(timestamp: Optional[datetime]) -> Optional[float]:
+    """Convert a datetime to epoch seconds, treating naive values as UTC."""
+    if timestamp is None:
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+class SpatialIndex:
+    """Fixed-size lat/lon grid mapping cells to the records located inside them."""
+    
+    def __init__(self, cell_size_deg: float = 0.1, max_size: Optional[int] = None):
+        self.cell_size_deg = cell_size_deg
+        self.max_size = max_size
+        self._lon_cells = int(math.ceil(360.0 / cell_size_deg))
+        self._cells: Dict[Tuple[int, int], Dict[str, Dict[str, Any]]] = {}
+        self._record_cells: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._record_cells)
+    
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        """Grid cell for a coordinate; longitude columns wrap at the antimeridian."""
+        row = int(math.floor((latitude + 90.0) / self.cell_size_deg))
+        col = int(math.floor((longitude + 180.0) / self.cell_size_deg)) % self._lon_cells
+        return row, col
+    
+    def add(self, record_id: str, latitude: float, longitude: float,
+            record: Dict[str, Any], timestamp: Optional[datetime] = None):
+        """Insert or replace a record, evicting the oldest once max_size is reached."""
+        entry = {
+            'latitude': latitude,
+            'longitude': longitude,
+            'timestamp': _to_epoch(timestamp),
+            'record': record
+        }
+        cell = self._cell(latitude, longitude)
+        with self._lock:
+            self.remove(record_id)
+            self._cells.setdefault(cell, {})[record_id] = entry
+            self._record_cells[record_id] = cell
+            
+            # _record_cells keeps insertion order, so its first key is the oldest record
+            if self.max_size is not None:
+                while len(self._record_cells) > self.max_size:
+                    self.remove(next(iter(self._record_cells)))
+    
+    def remove(self, record_id: str):
+        """Drop a record if present."""
+        with self._lock:
+            cell = self._record_cells.pop(record_id, None)
+            if cell is None:
+                return
+            bucket = self._cells.get(cell, {})
+            bucket.pop(record_id, None)
+            if not bucket:
+                self._cells.pop(cell, None)
+    
+    def _candidate_cells(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[int, int]]:
+        """Cells overlapping the bounding box of the query circle."""
+        angular_radius = radius_km / EARTH_RADIUS_KM
+        dlat = math.degrees(angular_radius)
+        min_row, _ = self._cell(max(-90.0, latitude - dlat), longitude)
+        max_row, _ = self._cell(min(90.0, latitude + dlat), longitude)
+        
+        # Longitude half-width of the circle; near the poles it covers every column
+        cos_lat = math.cos(math.radians(latitude))
+        if latitude + dlat >= 90.0 or latitude - dlat <= -90.0 or math.sin(angular_radius) >= cos_lat:
+            cols = range(self._lon_cells)
+        else:
+            dlon = math.degrees(math.asin(math.sin(angular_radius) / cos_lat))
+            _, center_col = self._cell(latitude, longitude)
+            span = int(math.ceil(dlon / self.cell_size_deg)) + 1
+            if 2 * span + 1 >= self._lon_cells:
+                cols = range(self._lon_cells)
+            else:
+                cols = [(center_col + offset) % self._lon_cells for offset in range(-span, span + 1)]
+        
+        return [(row, col) for row in range(min_row, max_row + 1) for col in cols]
+    
+    def query(self, latitude: float, longitude: float, radius_km: float,
+              max_results: Optional[int] = None, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Records within radius_km of a point, nearest first, with `distance_km` added."""
+        if max_results is not None and max_results < 1:
+            raise ValueError(f"max_results must be positive, got {max_results}")
+        since_epoch = _to_epoch(since)
+        
+        with self._lock:
+            candidates = [
+                entry
+                for cell in self._candidate_cells(latitude, longitude, radius_km)
+                for entry in self._cells.get(cell, {}).values()
+            ]
+        
+        if not candidates:
+            return []
+        
+        # Score every candidate in one vectorized pass
+        count = len(candidates)
+        lats = np.fromiter((entry['latitude'] for entry in candidates), dtype=np.float64, count=count)
+        lons = np.fromiter((entry['longitude'] for entry in candidates), dtype=np.float64, count=count)
+        distances = haversine_distances(latitude, longitude, lats, lons)
+        mask = distances <= radius_km
+        
+        if since_epoch is not None:
+            timestamps = np.fromiter(
+                (np.nan if entry['timestamp'] is None else entry['timestamp'] for entry in candidates),
+                dtype=np.float64, count=count
+            )
+            mask &= timestamps >= since_epoch
+        
+        matches = np.flatnonzero(mask)
+        if max_results is not None and max_results < len(matches):
+            # Keep only the nearest max_results before sorting
+            matches = matches[np.argpartition(distances[matches], max_results - 1)[:max_results]]
+        matches = matches[np.argsort(distances[matches], kind='stable')]
+        if max_results is not None:
+            matches = matches[:max_results]
+        
+        return [
+            {**candidates[i]['record'], 'distance_km': round(float(distances[i]), 3)}
+            for i in matches
+        ]
+
+
+@lru_cache()
+def get_report_index() -> SpatialIndex:
+    """Get the shared spatial index of processed citizen reports."""
+    settings = get_settings()
+    return SpatialIndex(cell_size_deg=settings.SPATIAL_CELL_SIZE_DEG, max_size=settings.SPATIAL_INDEX_SIZE)
+
+
+@lru_cache()
+def get_social_index() -> SpatialIndex:
+    """Get the shared spatial index of geolocated social media posts."""
+    settings = get_settings()
+    return SpatialIndex(cell_size_deg=settings.SPATIAL_CELL_SIZE_DEG, max_size=settings.SPATIAL_INDEX_SIZE)
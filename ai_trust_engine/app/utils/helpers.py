@@ -2,41 +2,133 @@
 Utility functions for SeaSense AI Trust Engine
 """
 
+import asyncio
+import functools
 import hashlib
+import inspect
+import math
 import re
+import struct
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Awaitable
 import numpy as np
-from geopy.distance import geodesic
 import base64
 import io
 from PIL import Image
 
+# Text patterns, compiled once at import rather than looked up in re's cache per call
+_HASHTAG_RE = re.compile(r'#\w+')
+_MENTION_RE = re.compile(r'@\w+')
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+# URLs, then mentions and hashtags; a tag stops where a URL starts, as when URLs were removed first
+_URL_MENTION_HASHTAG_RE = re.compile(r'http[s]?://\S+|[@#](?:(?!http[s]?://\S)\w)+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?-]')
+# ASCII characters _SPECIAL_CHARS_RE removes, as a deletion table for str.translate
+_ASCII_SPECIAL_CHARS_TABLE = str.maketrans('', '', ''.join(
+    chr(code) for code in range(128) if _SPECIAL_CHARS_RE.match(chr(code))
+))
+_DIGIT_RE = re.compile(r'\d')
+# Emails, phone numbers and card-like numbers in one pass; phones first so long digit runs mask as phones.
+# A card whose unseparated groups hold a 10+ digit run is skipped so that run masks as a phone,
+# as it would when phones are masked before cards
+_SENSITIVE_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<phone>\b\d{10,}\b)'
+    r'|(?P<card>\b(?!\d{12}|\d{4}[\s-]\d{12})\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b)'
+)
+_SENSITIVE_MASKS = {'email': '***@***.***', 'phone': '***********', 'card': '****-****-****-****'}
+
+# Ocean regions (simplified) as (min_lat, max_lat, min_lon, max_lon) rows
+_OCEAN_BBOXES = np.array([
+    (-50, 20, 50, 120),  # Indian Ocean
+    (5, 25, 50, 80),     # Arabian Sea
+    (5, 25, 80, 100),    # Bay of Bengal
+], dtype=np.float64)
+
+
+EARTH_RADIUS_KM = 6371.0
+
 
 def calculate_location_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate distance between two GPS coordinates in kilometers."""
     try:
-        return geodesic((lat1, lon1), (lat2, lon2)).kilometers
+        # Closed-form great-circle distance; within 0.5% of the ellipsoidal geodesic
+        return haversine_distance(lat1, lon1, lat2, lon2)
     except Exception:
         return float('inf')
 
 
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in kilometers on a spherical Earth; cheaper than geodesic."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def haversine_distances(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Vectorized haversine_distance from one point to arrays of coordinates, or elementwise between arrays."""
+    phi1 = np.radians(lat)
+    phi2 = np.radians(lats)
+    dphi = phi2 - phi1
+    dlambda = np.radians(lons - lon)
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+# Rows of the pairwise matrix computed per block; bounds the float64 temporaries to block x N
+PAIRWISE_BLOCK_ROWS = 256
+
+
+def pairwise_haversine_km(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Full N x N float32 haversine distance matrix in kilometers, filled in row blocks."""
+    phi = np.radians(np.asarray(lats, dtype=np.float64))
+    lam = np.radians(np.asarray(lons, dtype=np.float64))
+    cos_phi = np.cos(phi)
+    n = phi.shape[0]
+    out = np.empty((n, n), dtype=np.float32)
+    
+    for start in range(0, n, PAIRWISE_BLOCK_ROWS):
+        stop = min(start + PAIRWISE_BLOCK_ROWS, n)
+        a = np.sin((phi[None, :] - phi[start:stop, None]) / 2) ** 2
+        a += cos_phi[start:stop, None] * cos_phi[None, :] * np.sin((lam[None, :] - lam[start:stop, None]) / 2) ** 2
+        np.sqrt(a, out=a)
+        np.minimum(a, 1.0, out=a)
+        np.arcsin(a, out=a)
+        np.multiply(a, 2 * EARTH_RADIUS_KM, out=out[start:stop])
+    return out
+
+
 def normalize_coordinates(latitude: float, longitude: float) -> Tuple[float, float]:
     """Normalize GPS coordinates to standard format."""
     # Ensure latitude is between -90 and 90
     lat = max(-90.0, min(90.0, latitude))
     
-    # Ensure longitude is between -180 and 180
+    # Ensure longitude is between -180 and 180; in-range values are returned untouched, others wrap
+    # in closed form into (-180, 180] from above and [-180, 180) from below, like repeated +/-360
     lon = longitude
-    while lon > 180:
-        lon -= 360
-    while lon < -180:
-        lon += 360
+    if lon > 180:
+        lon = 180.0 - (180.0 - lon) % 360.0
+    elif lon < -180:
+        lon = (lon + 180.0) % 360.0 - 180.0
     
     return lat, lon
 
 
+def normalize_coordinates_bulk(lats: np.ndarray, lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """normalize_coordinates over float arrays, modifying them in place."""
+    np.clip(lats, -90.0, 90.0, out=lats)
+    above = lons > 180.0
+    below = lons < -180.0
+    lons[above] = 180.0 - np.mod(180.0 - lons[above], 360.0)
+    lons[below] = np.mod(lons[below] + 180.0, 360.0) - 180.0
+    return lats, lons
+
+
 def is_ocean_location(latitude: float, longitude: float) -> bool:
     """
     Simple check if coordinates are likely in ocean.
@@ -44,58 +136,54 @@ def is_ocean_location(latitude: float, longitude: float) -> bool:
     """
     # For now, simple heuristic - assume locations far from major landmasses are ocean
     # This is a simplified implementation
-    
-    # Indian Ocean region (simplified)
-    if 20 >= latitude >= -50 and 50 <= longitude <= 120:
-        return True
-    
-    # Arabian Sea
-    if 5 <= latitude <= 25 and 50 <= longitude <= 80:
-        return True
-    
-    # Bay of Bengal
-    if 5 <= latitude <= 25 and 80 <= longitude <= 100:
-        return True
-    
-    return False
+    regions = _OCEAN_BBOXES
+    return bool((
+        (regions[:, 0] <= latitude) & (latitude <= regions[:, 1]) &
+        (regions[:, 2] <= longitude) & (longitude <= regions[:, 3])
+    ).any())
+
+
+def is_ocean_location_bulk(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """is_ocean_location over coordinate arrays; returns a boolean array."""
+    lats = np.asarray(lats, dtype=np.float64)[:, None]
+    lons = np.asarray(lons, dtype=np.float64)[:, None]
+    regions = _OCEAN_BBOXES
+    inside = np.logical_and.reduce((
+        regions[:, 0] <= lats, lats <= regions[:, 1],
+        regions[:, 2] <= lons, lons <= regions[:, 3]
+    ))
+    return inside.any(axis=1)
 
 
 def extract_hashtags(text: str) -> List[str]:
     """Extract hashtags from text."""
-    hashtag_pattern = r'#\w+'
-    hashtags = re.findall(hashtag_pattern, text, re.IGNORECASE)
+    hashtags = _HASHTAG_RE.findall(text)
     return [tag.lower() for tag in hashtags]
 
 
 def extract_mentions(text: str) -> List[str]:
     """Extract mentions from text."""
-    mention_pattern = r'@\w+'
-    mentions = re.findall(mention_pattern, text, re.IGNORECASE)
+    mentions = _MENTION_RE.findall(text)
     return [mention.lower() for mention in mentions]
 
 
 def extract_urls(text: str) -> List[str]:
     """Extract URLs from text."""
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    urls = re.findall(url_pattern, text)
-    return urls
+    return _URL_RE.findall(text)
 
 
 def clean_text(text: str) -> str:
     """Clean and normalize text for processing."""
-    # Remove URLs
-    text = re.sub(r'http[s]?://\S+', '', text)
-    
-    # Remove mentions and hashtags for cleaner text
-    text = re.sub(r'[@#]\w+', '', text)
+    # Remove URLs, and mentions and hashtags for cleaner text
+    text = _URL_MENTION_HASHTAG_RE.sub('', text)
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = ' '.join(text.split())
     
-    # Remove special characters (keep basic punctuation)
-    text = re.sub(r'[^\w\s.,!?-]', '', text)
-    
-    return text
+    # Remove special characters (keep basic punctuation); ASCII text takes the C-level translate path
+    if text.isascii():
+        return text.translate(_ASCII_SPECIAL_CHARS_TABLE)
+    return _SPECIAL_CHARS_RE.sub('', text)
 
 
 def generate_report_hash(content: str, location: Tuple[float, float], timestamp: datetime) -> str:
@@ -105,29 +193,105 @@ def generate_report_hash(content: str, location: Tuple[float, float], timestamp:
     timestamp_rounded = timestamp.replace(minute=0, second=0, microsecond=0)
     
     hash_input = f"{content.lower().strip()}{location_rounded}{timestamp_rounded}"
-    return hashlib.md5(hash_input.encode()).hexdigest()
+    # Non-cryptographic fingerprint; 128-bit BLAKE2b is faster than MD5 and the same length
+    return hashlib.blake2b(hash_input.encode(), digest_size=16).hexdigest()
 
 
-def validate_image_data(base64_data: str) -> Dict[str, Any]:
-    """Validate and analyze image data."""
+def generate_report_hashes_bulk(contents: List[str], lats: np.ndarray, lons: np.ndarray,
+                                timestamps: List[datetime]) -> List[str]:
+    """generate_report_hash over parallel columns of reports."""
+    lats_rounded = np.round(np.asarray(lats, dtype=np.float64), 4).tolist()
+    lons_rounded = np.round(np.asarray(lons, dtype=np.float64), 4).tolist()
+    timestamps_rounded = [timestamp.replace(minute=0, second=0, microsecond=0) for timestamp in timestamps]
+    
+    blake2b = hashlib.blake2b
+    return [
+        blake2b(f"{content.lower().strip()}{(lat, lon)}{timestamp}".encode(), digest_size=16).hexdigest()
+        for content, lat, lon, timestamp in zip(contents, lats_rounded, lons_rounded, timestamps_rounded)
+    ]
+
+
+# Pillow modes of 8-bit PNG color types (plus 1-bit grayscale) and of JPEG component counts
+_PNG_MODES = {(8, 0): 'L', (8, 2): 'RGB', (8, 3): 'P', (8, 4): 'LA', (8, 6): 'RGBA', (1, 0): '1'}
+_JPEG_MODES = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+# JPEG start-of-frame markers; 0xC4, 0xC8 and 0xCC share the range but are not frames
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _sniff_image(data: bytes) -> Optional[Tuple[str, int, int, str]]:
+    """Format, width, height and mode of a PNG or JPEG read from its header; None if unsure."""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and data[12:16] == b'IHDR' and len(data) >= 26:
+        width, height = struct.unpack('>II', data[16:24])
+        mode = _PNG_MODES.get((data[24], data[25]))
+        return ('PNG', width, height, mode) if mode else None
+    
+    if data[:2] != b'\xff\xd8':
+        return None
+    
+    # Walk the JPEG marker segments up to the frame header
+    i = 2
+    while i + 4 <= len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            i += 2
+            continue
+        if marker == 0xDA:
+            return None
+        length = struct.unpack('>H', data[i + 2:i + 4])[0]
+        if marker == 0xE2 and data[i + 4:i + 8] == b'MPF\x00':
+            # Multi-picture files are reported as MPO; leave them to Pillow
+            return None
+        if marker in _JPEG_SOF_MARKERS:
+            if i + 10 > len(data):
+                return None
+            height, width = struct.unpack('>HH', data[i + 5:i + 9])
+            mode = _JPEG_MODES.get(data[i + 9])
+            return ('JPEG', width, height, mode) if mode and height else None
+        i += 2 + length
+    return None
+
+
+def validate_image_data(base64_data: str, max_size_mb: Optional[float] = None) -> Dict[str, Any]:
+    """Validate and analyze image data; payloads over max_size_mb are rejected before decoding."""
     try:
+        # Estimate the decoded size from the base64 length so oversize payloads are never allocated
+        estimated_mb = len(base64_data) * 0.75 / (1024 * 1024)
+        if max_size_mb is not None and estimated_mb > max_size_mb:
+            return {
+                'valid': False,
+                'error': f"Image exceeds {max_size_mb} MB",
+                'size_mb': estimated_mb,
+                'width': 0,
+                'height': 0
+            }
+        
         # Decode base64
         image_bytes = base64.b64decode(base64_data)
         
         # Check size
         size_mb = len(image_bytes) / (1024 * 1024)
         
-        # Open image to get properties
-        image = Image.open(io.BytesIO(image_bytes))
+        # Read PNG and JPEG properties straight from the header; Pillow handles anything else
+        sniffed = _sniff_image(image_bytes)
+        if sniffed is None:
+            # Only the header is parsed, pixel data is never loaded
+            with Image.open(io.BytesIO(image_bytes)) as image:
+                sniffed = (image.format, image.width, image.height, image.mode)
+        image_format, width, height, mode = sniffed
         
         return {
             'valid': True,
             'size_mb': size_mb,
-            'width': image.width,
-            'height': image.height,
-            'format': image.format,
-            'mode': image.mode,
-            'total_pixels': image.width * image.height
+            'width': width,
+            'height': height,
+            'format': image_format,
+            'mode': mode,
+            'total_pixels': width * height
         }
     
     except Exception as e:
@@ -142,13 +306,13 @@ def validate_image_data(base64_data: str) -> Dict[str, Any]:
 
 def calculate_text_quality_score(text: str) -> float:
     """Calculate a quality score for text content."""
-    if not text or not text.strip():
+    length = len(text.strip()) if text else 0
+    if not length:
         return 0.0
     
     score = 0.0
     
     # Length score (optimal range: 50-500 characters)
-    length = len(text.strip())
     if 50 <= length <= 500:
         length_score = 1.0
     elif length < 50:
@@ -171,29 +335,71 @@ def calculate_text_quality_score(text: str) -> float:
         score += 0.2 * word_diversity
     
     # Has proper capitalization
-    if text[0].isupper() if text else False:
+    if text[0].isupper():
         score += 0.1
     
     # Contains numbers (often indicates specific details)
-    if re.search(r'\d', text):
+    if _DIGIT_RE.search(text):
         score += 0.1
     
     return min(1.0, score)
 
 
+def calculate_text_quality_scores_bulk(texts: List[str]) -> np.ndarray:
+    """calculate_text_quality_score over a list of texts, with the numeric terms vectorized."""
+    stripped = [text.strip() if text else "" for text in texts]
+    lengths = np.fromiter(map(len, stripped), dtype=np.int32, count=len(stripped))
+    
+    # Length score (optimal range: 50-500 characters)
+    length_scores = np.where(lengths < 50, lengths / 50.0,
+                             np.where(lengths <= 500, 1.0, np.maximum(0.3, 1.0 - (lengths - 500) / 1000.0)))
+    
+    sentences = np.fromiter(
+        (text.count('.') + text.count('!') + text.count('?') for text in stripped),
+        dtype=np.float64, count=len(stripped)
+    )
+    
+    def diversity(text: str) -> float:
+        words = text.lower().split()
+        return len(set(words)) / len(words) if words else 0.0
+    
+    diversities = np.fromiter(map(diversity, stripped), dtype=np.float64, count=len(stripped))
+    capitalized = np.fromiter((bool(text) and text[0].isupper() for text in texts), dtype=bool, count=len(texts))
+    has_digits = np.fromiter((_DIGIT_RE.search(text) is not None for text in stripped), dtype=bool, count=len(stripped))
+    
+    scores = (0.4 * length_scores + 0.2 * np.minimum(1.0, sentences / 5.0) + 0.2 * diversities
+              + 0.1 * capitalized + 0.1 * has_digits)
+    scores = np.minimum(1.0, scores)
+    scores[lengths == 0] = 0.0
+    return scores
+
+
 def time_window_filter(timestamp: datetime, window_hours: int = 24) -> bool:
-    """Check if timestamp is within the specified time window."""
-    now = datetime.utcnow()
-    time_diff = now - timestamp
-    return time_diff.total_seconds() <= window_hours * 3600
+    """Check if timestamp is within the specified time window; naive timestamps are taken as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return time.time() - timestamp.timestamp() <= window_hours * 3600
 
 
 def spatial_cluster_check(location1: Tuple[float, float], 
                          location2: Tuple[float, float], 
                          threshold_km: float = 10.0) -> bool:
     """Check if two locations are within spatial clustering threshold."""
-    distance = calculate_location_distance(location1[0], location1[1], location2[0], location2[1])
-    return distance <= threshold_km
+    if threshold_km < 0:
+        # No distance is below a negative threshold; squaring the sine below would hide the sign
+        return False
+    half_angle = threshold_km / (2 * EARTH_RADIUS_KM)
+    if half_angle >= math.pi / 2:
+        # Beyond half the circumference every pair is within range
+        return True
+    try:
+        # Compare the haversine term against the threshold's instead of converting it to kilometers
+        phi1, phi2 = math.radians(location1[0]), math.radians(location2[0])
+        dlambda = math.radians(location2[1] - location1[1])
+        a = math.sin((phi2 - phi1) / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    except Exception:
+        return False
+    return a <= math.sin(half_angle) ** 2
 
 
 def calculate_engagement_rate(likes: int, shares: int, comments: int, followers: int) -> float:
@@ -208,84 +414,106 @@ def calculate_engagement_rate(likes: int, shares: int, comments: int, followers:
     return min(1.0, engagement_rate) * 100
 
 
+# Lower bounds of each summary label above "Very Poor", ascending
+_TRUST_SCORE_THRESHOLDS = (0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+_TRUST_SCORE_LABELS = ("Very Poor", "Poor", "Low", "Moderate", "Good", "High", "Very High", "Excellent")
+
+
 def format_trust_score_summary(trust_score: float) -> str:
     """Format trust score into human-readable summary."""
-    if trust_score >= 0.9:
-        return "Excellent"
-    elif trust_score >= 0.8:
-        return "Very High"
-    elif trust_score >= 0.7:
-        return "High"
-    elif trust_score >= 0.6:
-        return "Good"
-    elif trust_score >= 0.5:
-        return "Moderate"
-    elif trust_score >= 0.4:
-        return "Low"
-    elif trust_score >= 0.3:
-        return "Poor"
-    else:
-        return "Very Poor"
+    return _TRUST_SCORE_LABELS[bisect_right(_TRUST_SCORE_THRESHOLDS, trust_score)]
+
+
+# Priority level color codes
+_PRIORITY_COLORS = {
+    'critical': '#FF0000',  # Red
+    'high': '#FF8C00',      # Orange
+    'medium': '#FFD700',    # Gold
+    'low': '#32CD32'        # Green
+}
 
 
 def get_priority_color(priority: str) -> str:
     """Get color code for priority level."""
-    color_map = {
-        'critical': '#FF0000',  # Red
-        'high': '#FF8C00',      # Orange
-        'medium': '#FFD700',    # Gold
-        'low': '#32CD32'        # Green
-    }
-    return color_map.get(priority.lower(), '#808080')  # Gray for unknown
+    return _PRIORITY_COLORS.get(priority.lower(), '#808080')  # Gray for unknown
 
 
-def batch_process_generator(items: List[Any], batch_size: int = 10):
-    """Generator for batch processing of items."""
-    for i in range(0, len(items), batch_size):
-        yield items[i:i + batch_size]
+def batch_process_generator(items: Iterable[Any], batch_size: int = 10):
+    """Generator for batch processing of items; accepts any iterable, including streams."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+async def gather_with_concurrency(aws: Iterable[Awaitable[Any]], limit: int = 8) -> List[Any]:
+    """Await items concurrently with at most `limit` in flight. Exceptions are returned in place of results."""
+    semaphore = asyncio.Semaphore(max(1, limit))
+    
+    async def bounded(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+    
+    return await asyncio.gather(*(bounded(aw) for aw in aws), return_exceptions=True)
 
 
 def retry_with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0):
     """Decorator for retrying functions with exponential backoff."""
+    # Sleep after each failed attempt but the last
+    delays = tuple(base_delay * (1 << attempt) for attempt in range(max_retries - 1))
+    
     def decorator(func):
-        async def async_wrapper(*args, **kwargs):
-            for attempt in range(max_retries):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise
-                    delay = base_delay * (2 ** attempt)
-                    await asyncio.sleep(delay)
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for delay in delays:
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception:
+                        await asyncio.sleep(delay)
+                return await func(*args, **kwargs)
             
+            return async_wrapper
+        
+        @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            for attempt in range(max_retries):
+            for delay in delays:
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise
-                    delay = base_delay * (2 ** attempt)
+                except Exception:
                     time.sleep(delay)
+            return func(*args, **kwargs)
         
-        import asyncio
-        import inspect
-        
-        if inspect.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
     
     return decorator
 
 
+# Last formatted response timestamp as (epoch seconds, ISO string), reused within a millisecond
+_timestamp_cache: Tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, formatted at most once per millisecond."""
+    global _timestamp_cache
+    now = time.time()
+    cached_at, formatted = _timestamp_cache
+    if 0.0 <= now - cached_at < 0.001:
+        return formatted
+    formatted = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    _timestamp_cache = (now, formatted)
+    return formatted
+
+
 def generate_api_response(success: bool, message: str, data: Any = None, 
                          errors: List[str] = None, processing_time: float = None) -> Dict[str, Any]:
     """Generate standardized API response."""
     response = {
         'success': success,
         'message': message,
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': _now_iso()
     }
     
     if data is not None:
@@ -302,13 +530,4 @@ def generate_api_response(success: bool, message: str, data: Any = None,
 
 def mask_sensitive_data(text: str) -> str:
     """Mask sensitive information in text for logging."""
-    # Mask email addresses
-    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '***@***.***', text)
-    
-    # Mask phone numbers (simple pattern)
-    text = re.sub(r'\b\d{10,}\b', '***********', text)
-    
-    # Mask credit card-like numbers
-    text = re.sub(r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b', '****-****-****-****', text)
-    
-    return text
+    return _SENSITIVE_RE.sub(lambda match: _SENSITIVE_MASKS[match.lastgroup], text)
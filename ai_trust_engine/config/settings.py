@@ -5,7 +5,7 @@ Configuration settings for SeaSense AI Trust Engine
 import os
 from functools import lru_cache
 from typing import List
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -29,6 +29,8 @@ class Settings(BaseSettings):
     MBERT_MODEL: str = "bert-base-multilingual-cased"
     CLIP_MODEL: str = "openai/clip-vit-base-patch32"
     YOLO_MODEL: str = "yolov8n.pt"
+    QUANTIZE_CPU_MODELS: bool = True  # INT8 dynamic quantization of mBERT and CLIP on CPU
+    COMPILE_MODELS: bool = False  # torch.compile mBERT and CLIP encoders; trades startup time for faster calls
     
     # Trust Scoring Parameters
     MIN_TRUST_SCORE: float = 0.0
@@ -39,6 +41,7 @@ class Settings(BaseSettings):
     SIMILARITY_THRESHOLD: float = 0.8
     CLUSTERING_EPS: float = 0.3
     MIN_SAMPLES: int = 2
+    DUPLICATE_INDEX_SIZE: int = 100000  # Most recent report embeddings kept for duplicate checks
     
     # Social Media API Keys (Optional)
     TWITTER_API_KEY: str = ""
@@ -55,6 +58,16 @@ class Settings(BaseSettings):
     # Cache Configuration
     REDIS_URL: str = "redis://localhost:6379"
     CACHE_TTL: int = 3600  # 1 hour
+    RESULT_CACHE_SIZE: int = 2000
+    RESULT_CACHE_TTL: int = 600  # 10 minutes
+    SEMANTIC_CACHE_ENABLED: bool = False  # Needs model embeddings, not the simplified bag-of-words
+    SEMANTIC_CACHE_SIZE: int = 10000
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    NEAR_DUPLICATE_MAX_DISTANCE: int = 3  # SimHash bits; at most 3
+    TRUST_SCORE_CACHE_SIZE: int = 10000
+    TRUST_SCORE_CACHE_TTL: int = 300  # 5 minutes
+    FEATURE_CACHE_SIZE: int = 10000  # Per-text and per-image model outputs, keyed by content hash
+    ANALYTICS_CACHE_MAX_AGE: int = 60  # Cache-Control max-age for analytics responses
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -63,15 +76,27 @@ class Settings(BaseSettings):
     # Model Paths
     MODEL_CACHE_DIR: str = "./models"
     EMBEDDINGS_CACHE_DIR: str = "./embeddings"
+    PERSIST_REPORT_EMBEDDINGS: bool = False  # Memory-map duplicate-detection embeddings under EMBEDDINGS_CACHE_DIR
     
     # Performance Settings
     MAX_WORKERS: int = 4
+    INFERENCE_WORKERS: int = min(4, os.cpu_count() or 1)  # Model inference threads; torch ops release the GIL
+    # Torch intra-op threads per process; 0 splits the CPUs across WEB_CONCURRENCY server processes.
+    # Leave OMP_NUM_THREADS unset (or set it to the same value) so OpenMP does not override this.
+    TORCH_NUM_THREADS: int = 0
+    MICRO_BATCH_SIZE: int = 16  # Concurrent single-report texts coalesced per model call
+    MICRO_BATCH_WAIT: float = 0.01  # Seconds to wait for more texts before running a partial batch
+    JOB_QUEUE_SIZE: int = 100
+    JOB_QUEUE_DRAIN_TIMEOUT: float = 30.0  # Seconds shutdown waits for accepted background jobs
+    SPATIAL_CELL_SIZE_DEG: float = 0.1  # ~11 km grid cells for nearby/correlate lookups
+    SPATIAL_INDEX_SIZE: int = 100000  # Most recent records kept per spatial index
+    BATCH_CONCURRENCY: int = 8
+    MAX_SUB_BATCH_SIZE: int = 16  # Upper bound for adaptive bulk sub-batches
     BATCH_PROCESSING_INTERVAL: int = 60
     CLEANUP_INTERVAL: int = 3600
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # Validated once by get_settings() and shared read-only across requests
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
 
 
 @lru_cache()
@@ -7,14 +7,22 @@ to generate trust scores for ocean hazard reports.
 """
 
 import logging
+import sys
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 from app.api.endpoints import reports, social_media, trust_scores
 from app.services.ai_pipeline_simple import AIPipeline
+from app.services.batch_controller import get_batch_controller
+from app.services.job_queue import JobQueue
+from app.services.result_cache import (
+    get_report_cache, get_social_cache, get_semantic_cache, get_near_duplicate_cache,
+    get_trust_score_cache
+)
 from config.settings import get_settings
 
 # Configure logging
@@ -41,13 +49,32 @@ async def lifespan(app: FastAPI):
         await app.state.ai_pipeline.initialize()
         logger.info("AI Pipeline initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize AI Pipeline: {e}")
+        logger.error("Failed to initialize AI Pipeline: %s", e)
         raise
     
+    # Start background job workers
+    app.state.job_queue = JobQueue(
+        num_workers=settings.MAX_WORKERS,
+        maxsize=settings.JOB_QUEUE_SIZE
+    )
+    await app.state.job_queue.start()
+    
+    # Hand the shared services to the endpoint dependencies once
+    for module in (reports, social_media):
+        module._AI_PIPELINE = app.state.ai_pipeline
+        module._JOB_QUEUE = app.state.job_queue
+    trust_scores._AI_PIPELINE = app.state.ai_pipeline
+    
     yield
     
     # Cleanup
     logger.info("Shutting down SeaSense AI Trust Engine...")
+    for module in (reports, social_media):
+        module._AI_PIPELINE = None
+        module._JOB_QUEUE = None
+    trust_scores._AI_PIPELINE = None
+    if hasattr(app.state, 'job_queue'):
+        await app.state.job_queue.stop(timeout=settings.JOB_QUEUE_DRAIN_TIMEOUT)
     if hasattr(app.state, 'ai_pipeline'):
         await app.state.ai_pipeline.cleanup()
 
@@ -59,6 +86,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -68,7 +96,7 @@ settings = get_settings()
 # Add middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
+    allow_origins=frozenset(settings.ALLOWED_ORIGINS),  # Starlette keeps this for per-request membership tests
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
@@ -132,10 +160,28 @@ async def health_check():
             "version": "1.0.0"
         }
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         raise HTTPException(status_code=500, detail="Service unhealthy")
 
 
+@app.get("/status")
+async def status():
+    """Runtime status including result cache statistics."""
+    return {
+        "status": "healthy" if hasattr(app.state, 'ai_pipeline') else "degraded",
+        "version": "1.0.0",
+        "caches": {
+            "reports": get_report_cache().stats(),
+            "social_media": get_social_cache().stats(),
+            "social_media_semantic": get_semantic_cache().stats(),
+            "social_media_near_duplicates": get_near_duplicate_cache().stats(),
+            "trust_scores": get_trust_score_cache().stats()
+        },
+        "job_queue": app.state.job_queue.stats() if hasattr(app.state, 'job_queue') else None,
+        "bulk_batching": get_batch_controller().stats()
+    }
+
+
 def get_ai_pipeline():
     """Dependency to get AI Pipeline instance."""
     if not hasattr(app.state, 'ai_pipeline'):
@@ -149,5 +195,8 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        # uvloop (from uvicorn[standard]) has no Windows support
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info"
     )
@@ -6,21 +6,24 @@ SeaSense AI Trust Engine Complete Test
 
 import requests
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://127.0.0.1:8005"
+BAR = "=" * 60
+
+# One keep-alive connection pool for every demo request
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=0))
 
 print("🌊 SeaSense AI Trust Engine - FINAL DEMO")
-print("=" * 60)
+print(BAR)
 print("Smart India Hackathon 2025")
-print("=" * 60)
+print(BAR)
 
 def demo_step(step_num, title, description):
-    print(f"\n{'=' * 60}")
-    print(f"📍 STEP {step_num}: {title}")
-    print(f"📝 {description}")
-    print(f"{'=' * 60}")
+    print(f"\n{BAR}\n📍 STEP {step_num}: {title}\n📝 {description}\n{BAR}")
 
 def show_response(response, endpoint_name):
     print(f"\n🔗 URL: {response.url}")
@@ -41,7 +44,7 @@ def show_response(response, endpoint_name):
 demo_step(1, "Health Check", "Verify API server is running")
 
 try:
-    response = requests.get(f"{BASE_URL}/health", timeout=5)
+    response = session.get(f"{BASE_URL}/health", timeout=5)
     health_result = show_response(response, "Health Check")
     
     if not health_result:
@@ -49,17 +52,15 @@ try:
         print("Please start the server:")
         print("cd ai_trust_engine")
         print("python -m uvicorn main:app --host 0.0.0.0 --port 8005")
+        session.close()
         exit(1)
         
 except Exception as e:
     print(f"❌ Connection failed: {e}")
+    session.close()
     exit(1)
 
-time.sleep(2)
-
-# Step 2: Submit Citizen Report
-demo_step(2, "Citizen Report", "Submit ocean hazard report from citizen")
-
+# Steps 2 and 3 are independent submissions; send both at once and show them in order
 citizen_data = {
     "reporter_name": "Arya Katoch - SIH 2025 Team",
     "location": {
@@ -74,28 +75,6 @@ citizen_data = {
     "contact_info": "arya.katoch@sih2025.com"
 }
 
-try:
-    response = requests.post(f"{BASE_URL}/api/v1/reports/citizen", json=citizen_data, timeout=10)
-    citizen_result = show_response(response, "Citizen Report")
-    
-    # Extract report ID for trust score test
-    report_id = None
-    if citizen_result and 'data' in citizen_result:
-        if 'original_report' in citizen_result['data']:
-            report_id = citizen_result['data']['original_report']['id']
-        elif 'id' in citizen_result['data']:
-            report_id = citizen_result['data']['id']
-    
-    print(f"\n🔑 Extracted Report ID: {report_id}")
-    
-except Exception as e:
-    print(f"❌ Citizen report failed: {e}")
-
-time.sleep(2)
-
-# Step 3: Submit Social Media Post
-demo_step(3, "Social Media Analysis", "Process viral social media hazard alert")
-
 social_data = {
     "platform": "twitter",
     "username": "@SeaSenseSIH2025",
@@ -115,21 +94,47 @@ social_data = {
     }
 }
 
+executor = ThreadPoolExecutor(max_workers=4)
+citizen_future = executor.submit(session.post, f"{BASE_URL}/api/v1/reports/citizen", json=citizen_data, timeout=10)
+social_future = executor.submit(session.post, f"{BASE_URL}/api/v1/reports/social-media", json=social_data, timeout=10)
+executor.shutdown(wait=False)
+
+# Step 2: Submit Citizen Report
+demo_step(2, "Citizen Report", "Submit ocean hazard report from citizen")
+
+report_id = None
+try:
+    response = citizen_future.result()
+    citizen_result = show_response(response, "Citizen Report")
+    
+    # Extract report ID for trust score test
+    if citizen_result and 'data' in citizen_result:
+        if 'original_report' in citizen_result['data']:
+            report_id = citizen_result['data']['original_report']['id']
+        elif 'id' in citizen_result['data']:
+            report_id = citizen_result['data']['id']
+    
+    print(f"\n🔑 Extracted Report ID: {report_id}")
+    
+except Exception as e:
+    print(f"❌ Citizen report failed: {e}")
+
+# Step 3: Submit Social Media Post
+demo_step(3, "Social Media Analysis", "Process viral social media hazard alert")
+
 try:
-    response = requests.post(f"{BASE_URL}/api/v1/reports/social-media", json=social_data, timeout=10)
+    response = social_future.result()
     social_result = show_response(response, "Social Media Analysis")
     
 except Exception as e:
     print(f"❌ Social media analysis failed: {e}")
 
-time.sleep(2)
-
 # Step 4: Get Trust Score Analysis
 if report_id:
     demo_step(4, "Trust Score Analysis", f"Analyze trust factors for report: {report_id}")
     
     try:
-        response = requests.get(f"{BASE_URL}/api/v1/trust-scores/{report_id}", timeout=10)
+        response = session.get(f"{BASE_URL}/api/v1/trust-scores/{report_id}", timeout=10)
         trust_result = show_response(response, "Trust Score Analysis")
         
     except Exception as e:
@@ -137,8 +142,10 @@ if report_id:
 else:
     print("\n⚠️ Skipping trust score test - no report ID available")
 
+session.close()
+
 # Demo Summary
-print(f"\n{'=' * 60}")
+print(f"\n{BAR}")
 print("🎉 SEASENSE AI TRUST ENGINE DEMO COMPLETE!")
 print("📊 SYSTEM CAPABILITIES DEMONSTRATED:")
 print("✅ Real-time health monitoring")
@@ -149,7 +156,7 @@ print("✅ Duplicate detection and clustering")
 print("✅ Emergency response recommendations")
 print("\n🏆 SMART INDIA HACKATHON 2025")
 print("🌊 Protecting India's Coastline with AI")
-print("=" * 60)
+print(BAR)
 
 print("\n🔗 API DOCUMENTATION: http://127.0.0.1:8005/docs")
 print("💡 Try the interactive API docs in your browser!")
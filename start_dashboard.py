@@ -12,6 +12,14 @@ import signal
 import threading
 from pathlib import Path
 
+import requests
+
+BACKEND_HEALTH_URL = "http://127.0.0.1:8005/health"
+
+# Services run in their own process groups on POSIX, so stopping one also stops its
+# children (the uvicorn reload worker, the Next.js dev server under npm)
+POSIX = os.name == "posix"
+
 def start_backend():
     """Start the FastAPI backend server"""
     print("🌊 Starting SeaSense AI Trust Engine Backend...")
@@ -27,8 +35,11 @@ def start_backend():
             [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", "8005", "--reload"],
             cwd=backend_dir,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.STDOUT,  # One pipe per process; an unread stderr pipe would stall it once full
+            text=True,
+            bufsize=1,
+            start_new_session=True,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"}  # Flush each log line instead of in pipe-sized bursts
         )
         print("✅ Backend server started on http://127.0.0.1:8005")
         return process
@@ -56,8 +67,9 @@ def start_frontend():
             ["npm", "run", "dev"],
             cwd=frontend_dir,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.STDOUT,  # One pipe per process; an unread stderr pipe would stall it once full
+            text=True,
+            start_new_session=True
         )
         print("✅ Frontend dashboard started on http://localhost:3000")
         return process
@@ -65,14 +77,53 @@ def start_frontend():
         print(f"❌ Failed to start frontend: {e}")
         return None
 
-def monitor_process(process, name):
-    """Monitor a process and print its output"""
+def wait_ready(url, process, timeout=15):
+    """Poll a health URL until it answers 200, the process exits, or the timeout passes"""
+    deadline = time.monotonic() + timeout
+    with requests.Session() as session:
+        while time.monotonic() < deadline and process.poll() is None:
+            try:
+                if session.get(url, timeout=0.5).status_code == 200:
+                    return True
+            except requests.RequestException:
+                pass
+            time.sleep(0.1)
+    return False
+
+def stop_process(process, force=False):
+    """Signal a service and, on POSIX, every process in its group"""
+    if not POSIX:
+        process.kill() if force else process.terminate()
+        return
+    try:
+        os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+def monitor_process(process, name, exited=None):
+    """Monitor a process and print its output, setting exited once its output ends"""
     try:
-        for line in iter(process.stdout.readline, ''):
-            if line:
-                print(f"[{name}] {line.strip()}")
+        # Read whatever the pipe holds in one call and split it into lines ourselves,
+        # carrying a partial last line over to the next read
+        fd = process.stdout.fileno()
+        pending = b""
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                if line:
+                    print(f"[{name}] {line.decode(errors='replace').strip()}")
+        if pending:
+            print(f"[{name}] {pending.decode(errors='replace').strip()}")
+        # End of output means the process is exiting; reap it so poll() reports it
+        process.wait()
     except Exception as e:
         print(f"Error monitoring {name}: {e}")
+    finally:
+        if exited is not None:
+            exited.set()
 
 def main():
     """Main function to start both services"""
@@ -85,14 +136,18 @@ def main():
         print("❌ Failed to start backend. Exiting.")
         return
     
-    # Wait a moment for backend to start
-    time.sleep(3)
+    # Wait for the backend to answer health checks instead of a fixed delay
+    if not wait_ready(BACKEND_HEALTH_URL, backend_process):
+        if backend_process.poll() is not None:
+            print("❌ Backend exited during startup. Exiting.")
+            return
+        print("⚠️  Backend is not answering health checks yet; starting frontend anyway")
     
     # Start frontend
     frontend_process = start_frontend()
     if not frontend_process:
         print("❌ Failed to start frontend. Stopping backend.")
-        backend_process.terminate()
+        stop_process(backend_process)
         return
     
     print("\n🎉 Both services are running!")
@@ -101,9 +156,10 @@ def main():
     print("📚 API Docs: http://127.0.0.1:8005/docs")
     print("\nPress Ctrl+C to stop both services")
     
-    # Start monitoring threads
-    backend_thread = threading.Thread(target=monitor_process, args=(backend_process, "BACKEND"))
-    frontend_thread = threading.Thread(target=monitor_process, args=(frontend_process, "FRONTEND"))
+    # Start monitoring threads; either one finishing wakes the supervisor loop
+    exited = threading.Event()
+    backend_thread = threading.Thread(target=monitor_process, args=(backend_process, "BACKEND", exited))
+    frontend_thread = threading.Thread(target=monitor_process, args=(frontend_process, "FRONTEND", exited))
     
     backend_thread.daemon = True
     frontend_thread.daemon = True
@@ -112,9 +168,11 @@ def main():
     frontend_thread.start()
     
     try:
-        # Wait for processes
+        # Block until a monitor sees its process exit; Windows only delivers Ctrl+C to timed waits
         while True:
-            time.sleep(1)
+            if not exited.wait(None if POSIX else 1):
+                continue
+            exited.clear()
             
             # Check if processes are still running
             if backend_process.poll() is not None:
@@ -130,18 +188,18 @@ def main():
         
         # Terminate processes
         if backend_process:
-            backend_process.terminate()
+            stop_process(backend_process)
         if frontend_process:
-            frontend_process.terminate()
-        
-        # Wait for processes to terminate
-        time.sleep(2)
+            stop_process(frontend_process)
         
-        # Force kill if still running
-        if backend_process and backend_process.poll() is None:
-            backend_process.kill()
-        if frontend_process and frontend_process.poll() is None:
-            frontend_process.kill()
+        # Give each process up to two seconds to exit, then force kill it
+        for process in (backend_process, frontend_process):
+            if not process:
+                continue
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                stop_process(process, force=True)
         
         print("✅ Services stopped successfully")
 
@@ -4,9 +4,10 @@ Test script for SeaSense AI Trust Engine Dashboard
 This script tests the backend API endpoints used by the dashboard
 """
 
+import asyncio
+import httpx
 import requests
 import json
-import time
 import sys
 from typing import Dict, Any
 
@@ -40,6 +41,30 @@ def test_endpoint(endpoint: str, method: str = "GET", data: Dict[Any, Any] = Non
         print(f"❌ {method} {endpoint} - Error: {e}")
         return False
 
+async def test_endpoints_concurrently(endpoints) -> list:
+    """Send all GET endpoints at once over one client, reporting them in order"""
+    async with httpx.AsyncClient(base_url=API_BASE_URL, timeout=5) as client:
+        responses = await asyncio.gather(
+            *(client.get(endpoint) for endpoint, _ in endpoints), return_exceptions=True
+        )
+    
+    results = []
+    for (endpoint, method), response in zip(endpoints, responses):
+        if isinstance(response, httpx.ConnectError):
+            print(f"❌ {method} {endpoint} - Connection failed (Backend not running?)")
+            results.append(False)
+        elif isinstance(response, Exception):
+            print(f"❌ {method} {endpoint} - Error: {response}")
+            results.append(False)
+        elif response.status_code == 200:
+            print(f"✅ {method} {endpoint} - Status: {response.status_code}")
+            results.append(True)
+        else:
+            print(f"❌ {method} {endpoint} - Status: {response.status_code}")
+            print(f"   Response: {response.text[:100]}...")
+            results.append(False)
+    return results
+
 def test_dashboard_endpoints():
     """Test all dashboard-related endpoints"""
     print("🧪 Testing SeaSense AI Trust Engine Dashboard Endpoints")
@@ -54,13 +79,8 @@ def test_dashboard_endpoints():
         ("/api/v1/social-media/trending", "GET"),
     ]
     
-    passed = 0
     total = len(endpoints)
-    
-    for endpoint, method in endpoints:
-        if test_endpoint(endpoint, method):
-            passed += 1
-        time.sleep(0.5)  # Small delay between requests
+    passed = sum(asyncio.run(test_endpoints_concurrently(endpoints)))
     
     print("\n" + "=" * 60)
     print(f"📊 Test Results: {passed}/{total} endpoints passed")